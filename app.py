@@ -1,17 +1,36 @@
-from flask import Flask, render_template, jsonify, request
-from flask_socketio import SocketIO, emit
+from flask import Flask, render_template, jsonify, request, make_response
+from flask_socketio import SocketIO, emit, join_room, leave_room
+import atexit
+import signal
+import socket
+import sys
 import threading
 import time
-import requests
 import gspread
 from gspread import Cell
-from datetime import datetime, timedelta
+from datetime import datetime
 import pytz
 import json
-import re
 from typing import List, Dict
 
-from projection.quantum_gauntlet import compute_roster_projection
+from projection.quantum_gauntlet import IncrementalProjection, build_matchup_index
+from projection.breakdowns import breakdown_document
+from projection.memo import matchup_digest
+from sleeper.budget import RequestBudget
+from sleeper.client import SleeperClient
+from sleeper.players import PlayerRegistry
+from sleeper.schedule import NflSchedule, points_game_state
+from sleeper.week_cache import WeekCache
+from sleeper import season as season_calendar
+from dashboard.idp import IdpScoringCache, build_idp_payload
+from dashboard.leagues import League, LeagueConfig, LeagueRegistry, LeagueScheduler, load_league_configs
+from dashboard.polling import PollPolicy
+from dashboard.refresh import offload
+from dashboard.responses import DocumentCache, json_response
+from dashboard.snapshot import load_snapshot, restore_json_keys, write_snapshot
+from dashboard.store import StoredState, open_state_store
+from tournament.bracket import build_tournament_sections
+from tournament.simulate import build_score_model, simulate
 
 # ——— GOOGLE SHEETS AUTHENTICATION ———
 import os
@@ -47,14 +66,25 @@ allowed_origins = [
     "http://localhost:5004",
     "http://127.0.0.1:5004"
 ]
-socketio = SocketIO(app, cors_allowed_origins=allowed_origins)
+# "threading" for `python app.py` and tests; wsgi.py selects "gevent" for production.
+# With several workers, SOCKETIO_MESSAGE_QUEUE (e.g. redis://…) fans the leader's broadcasts out to all of them
+# Under `gunicorn -w N` long-polling requests can land on a worker without the session; websocket-only
+# connections stay on the worker that accepted them, so no sticky load balancer is needed
+SOCKETIO_WEBSOCKET_ONLY = os.environ.get('SOCKETIO_WEBSOCKET_ONLY', 'False').lower() == 'true'
+socketio = SocketIO(
+    app,
+    cors_allowed_origins=allowed_origins,
+    async_mode=os.environ.get('SOCKETIO_ASYNC_MODE', 'threading'),
+    message_queue=os.environ.get('SOCKETIO_MESSAGE_QUEUE'),
+    **({'transports': ['websocket']} if SOCKETIO_WEBSOCKET_ONLY else {}),
+)
 
 # Add cache-busting headers and CORS for API endpoints
 @app.after_request
 def after_request(response):
-    response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
-    response.headers["Pragma"] = "no-cache"
-    response.headers["Expires"] = "0"
+    # Always revalidate, but let browsers keep bodies so ETag'd responses can come back as 304
+    if "Cache-Control" not in response.headers:
+        response.headers["Cache-Control"] = "no-cache"
     
     # Add CORS headers for allowed origins
     origin = request.headers.get('Origin')
@@ -79,55 +109,218 @@ def after_request(response):
     
     return response
 
-# Global variables to store the latest data
-latest_data = {
-    'timestamp': '',
-    'week14': {},
-    'week15': {},
-    'week16': {},
-    'week17': {},
-    'combined': {},
-    'standings': [],
-    'initial_standings': []
-}
-
-def fmt(x):
-    return f"{x:.2f}" if isinstance(x, (int, float)) else x
-
-def fetch_playoff_data():
-    """Fetch and process playoff data from Sleeper API"""
+# ——— LEAGUES ———
+# The original dashboard's league; LEAGUES_FILE (a JSON list of configs) hosts more from this process
+DEFAULT_LEAGUE = LeagueConfig(
+    key='default',
+    username="LactatingLtinas",
+    season="2025",
+    league_name="The Shake Weight Fantasy League",
+)
+
+def empty_league_data():
+    """Sections of a league's dashboard before its first refresh"""
+    return {
+        'timestamp': '',
+        'week14': {},
+        'week15': {},
+        'week16': {},
+        'week17': {},
+        'combined': {},
+        'standings': [],
+        'initial_standings': []
+    }
+
+# Persistent caches (finalized weeks, schedule, players, state store, snapshot) live here
+CACHE_DIR = os.environ.get('SLEEPER_CACHE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache'))
+
+# Last successful refresh of the default league, rewritten atomically after each one; loaded here for a warm start.
+# The tracked data_snapshot.json (GitHub Pages) is only read as a fallback; set DATA_SNAPSHOT_PATH to it to publish.
+SNAPSHOT_PATH = os.environ.get('DATA_SNAPSHOT_PATH', os.path.join(CACHE_DIR, 'data_snapshot.json'))
+SHIPPED_SNAPSHOT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data_snapshot.json')
+
+def make_league(config, snapshot_path=None, fallback_path=None):
+    """A league with its own state and refresher, warm-started from ``snapshot_path`` (else ``fallback_path``) if given"""
+    data = None
+    for path in (snapshot_path, fallback_path):
+        data = load_snapshot(path) if path else None
+        if data:
+            print(f"[OK] Warm start from {path} (data from {data['timestamp']})")
+            break
+    return League(
+        config,
+        data or empty_league_data(),
+        refresh=lambda league: fetch_playoff_data(league),
+        build_odds=lambda league: build_odds(league),
+        snapshot_path=snapshot_path,
+        spawn=socketio.start_background_task,
+    )
+
+def build_leagues(configs):
+    """Registry of the configured leagues; the first is the default and backs data_snapshot.json"""
+    return LeagueRegistry(
+        make_league(config, SNAPSHOT_PATH, SHIPPED_SNAPSHOT_PATH) if idx == 0 else make_league(config)
+        for idx, config in enumerate(configs)
+    )
+
+leagues = build_leagues(load_league_configs(os.environ.get('LEAGUES_FILE'), default=DEFAULT_LEAGUE))
+
+# First refreshes are spread over the poll interval, later ones follow the NFL game clock:
+# every POLL_LIVE_SECONDS during game windows, POLL_IDLE_SECONDS between them, none once the season is over.
+# The request budget below caps their combined rate.
+POLL_INTERVAL_SECONDS = 60
+poll_policy = PollPolicy(
+    live=float(os.environ.get('POLL_LIVE_SECONDS', 20)),
+    idle=float(os.environ.get('POLL_IDLE_SECONDS', 300)),
+)
+scheduler = LeagueScheduler(interval=POLL_INTERVAL_SECONDS, policy=poll_policy)
+
+# Shared keep-alive Sleeper client (parallel per-week fetches), rate-limited across all leagues
+sleeper = SleeperClient(budget=RequestBudget(float(os.environ.get('SLEEPER_MAX_RPS', 10))))
+
+# Finalized weeks are persisted here and never re-fetched
+week_cache = WeekCache(os.path.join(CACHE_DIR, 'sleeper_weeks.json'))
+# Player names, positions and teams, downloaded once a day into SQLite
+player_registry = PlayerRegistry(os.path.join(CACHE_DIR, 'sleeper_players.sqlite3'), spawn=socketio.start_background_task)
+# NFL schedule for projection game states, reloaded once per NFL week
+nfl_schedule = NflSchedule(os.path.join(CACHE_DIR, 'nfl_schedule.json'), players=player_registry)
+
+# Shared by all workers: the refresh leader publishes each version here, the others adopt it
+STATE_STORE_URL = os.environ.get('STATE_STORE_URL', 'sqlite:///' + os.path.join(CACHE_DIR, 'dashboard_state.sqlite3'))
+state_store = open_state_store(STATE_STORE_URL)
+LEADER_LEASE_SECONDS = 180
+FOLLOWER_POLL_SECONDS = 5
+# Workers only elect a leader when they share a store or message queue; a lone worker always crawls
+LEADER_ELECTION = bool(os.environ.get('STATE_STORE_URL') or os.environ.get('SOCKETIO_MESSAGE_QUEUE'))
+
+def worker_id():
+    # Evaluated per call: a forked worker must not inherit its parent's identity
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+def _pid_exists(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # alive, owned by another user
+    return True
+
+def release_dead_local_leader():
+    """Free a lease held by a process of this host that no longer exists (e.g. before a restart); True if freed"""
+    leader = state_store.leader()
+    if leader is None or leader == worker_id():
+        return False
+    host, _, pid = leader.rpartition(':')
+    if host != socket.gethostname() or not pid.isdigit() or _pid_exists(int(pid)):
+        return False
+    state_store.release_leadership(leader)
+    print(f"[INFO] Took over the refresh lease of exited worker {leader}")
+    return True
+
+def hold_refresh_lease():
+    """Take or renew the refresh lease; True if this worker should crawl"""
+    if not LEADER_ELECTION:
+        return True
+    release_dead_local_leader()
+    return state_store.acquire_leadership(worker_id(), LEADER_LEASE_SECONDS)
+
+def release_refresh_lease():
+    """Hand the lease over on shutdown instead of leaving it to expire"""
+    if not LEADER_ELECTION:
+        return
+    try:
+        state_store.release_leadership(worker_id())
+    except Exception as e:
+        print(f"Warning: Could not release the refresh lease: {e}")
+
+def sync_from_store(league=None):
+    """Adopt newer versions published by the refresh leader (one league, or all); True if any was adopted"""
+    adopted = False
+    for target in ([league] if league is not None else leagues):
+        stored = state_store.load_if_newer(target.key, target.live_state.version)
+        if stored is None:
+            continue
+        data = restore_json_keys(stored.data)
+        target.live_state.restore(stored.version, data, stored.section_versions)
+        target.latest_data = data
+        adopted = True
+    return adopted
+
+def refresh_leader_elsewhere():
+    """True when another worker holds the refresh lease (so this one must not crawl)"""
+    if not LEADER_ELECTION:
+        return False
+    leader = state_store.leader()
+    return leader is not None and leader != worker_id() and not release_dead_local_leader()
+
+for _league in leagues:
+    if sync_from_store(_league):
+        print(f"[OK] Warm start for {_league.key} from state store v{_league.live_state.version} (data from {_league.latest_data.get('timestamp')})")
+
+def compute_team_records(matchups_by_week, roster_ids, weeks):
+    """Head-to-head win/loss records with a cumulative snapshot after each week."""
+    team_records = {rid: {'wins': 0, 'losses': 0, 'weekly_records': []} for rid in roster_ids}
+
+    for week in weeks:
+        matchups = matchups_by_week.get(week, [])
+
+        # Group matchups by matchup_id to find head-to-head results
+        matchup_groups = {}
+        for m in matchups:
+            mid = m.get('matchup_id')
+            if mid not in matchup_groups:
+                matchup_groups[mid] = []
+            matchup_groups[mid].append(m)
+
+        # Determine winners for each matchup
+        for matchup_list in matchup_groups.values():
+            if len(matchup_list) == 2:  # Head-to-head matchup
+                team1, team2 = matchup_list
+                if team1.get('points', 0) > team2.get('points', 0):
+                    team_records[team1['roster_id']]['wins'] += 1
+                    team_records[team2['roster_id']]['losses'] += 1
+                else:
+                    team_records[team2['roster_id']]['wins'] += 1
+                    team_records[team1['roster_id']]['losses'] += 1
+
+        # Store weekly record snapshot
+        for rid in team_records:
+            team_records[rid]['weekly_records'].append({
+                'week': week,
+                'wins': team_records[rid]['wins'],
+                'losses': team_records[rid]['losses']
+            })
+
+    return team_records
+
+def fetch_playoff_data(league=None):
+    """Fetch and process playoff data from Sleeper API for one league (the default league if None)"""
+    league = league or leagues.default
+    projection_memo = league.projection_memo
+    projection_states = league.projection_states
+    projection_breakdowns = league.projection_breakdowns
+    live_state = league.live_state
     try:
-        print("[UPDATE] Fetching playoff data...")
+        print(f"[UPDATE] Fetching playoff data for {league.key}...")
         # ——— CONFIGURATION ———
-        username = "LactatingLtinas"
-        season = "2025"
-        target_league_name = "The Shake Weight Fantasy League"
+        config = league.config
         weeks_pre = list(range(1, 14))  # Weeks 1-13 (regular season before playoffs)
         w14, w15, w16, w17 = 14, 15, 16, 17  # Production playoff rounds
 
-        # ——— FETCH USER & LEAGUE ———
-        print(f"[INFO] Looking up user: {username}")
-        user_resp = requests.get(f"https://api.sleeper.app/v1/user/{username}")
-        user_resp.raise_for_status()
-        user_id = user_resp.json()["user_id"]
-        print(f"[OK] Found user ID: {user_id}")
-
-        print(f"[INFO] Fetching leagues for season {season}...")
-        leagues = requests.get(f"https://api.sleeper.app/v1/user/{user_id}/leagues/nfl/{season}").json()
-        print(f"[INFO] Found {len(leagues)} leagues")
-        for league in leagues:
-            print(f"   - {league.get('name', 'Unknown')}")
-        
-        league_id = next((L["league_id"] for L in leagues if L.get("name")==target_league_name), None)
+        # ——— RESOLVE LEAGUE (cached after first lookup) ———
+        league_id = league.resolve(sleeper, week_cache)
         if not league_id:
-            print(f"[ERROR] League '{target_league_name}' not found in available leagues")
-            raise RuntimeError(f"League '{target_league_name}' not found.")
-        print(f"[OK] Found league ID: {league_id}")
+            print(f"[ERROR] League '{config.league_name}' not found for user {config.username}")
+            raise RuntimeError(f"League '{config.league_name}' not found.")
+        print(f"[OK] Using league ID: {league_id}")
+
+        # Weeks at or before this boundary are final and served from the week cache
+        latest_completed_week = season_calendar.latest_completed_week()
 
         # ——— BUILD ROSTER ↔ TEAM MAP ———
-        rosters = requests.get(f"https://api.sleeper.app/v1/league/{league_id}/rosters").json()
+        rosters, users = week_cache.get_rosters_and_users(sleeper, league_id)
         roster_to_owner = {r["roster_id"]: r["owner_id"] for r in rosters}
-        users = requests.get(f"https://api.sleeper.app/v1/league/{league_id}/users").json()
         owner_to_name = {u["user_id"]: (u.get("metadata",{}).get("team_name") or u["display_name"]) for u in users}
         roster_to_name = {rid: owner_to_name.get(owner_id,f"Roster {rid}") for rid,owner_id in roster_to_owner.items()}
 
@@ -135,53 +328,42 @@ def fetch_playoff_data():
         print("[INFO] Fetching scores for all weeks...")
         scores = {rid:{} for rid in roster_to_name}
         # Store raw matchup dictionaries by week for projection module
-        matchups_by_week: Dict[int, List[dict]] = {}
-        for wk in weeks_pre + [w14, w15, w16, w17]:
-            print(f"   Week {wk}...")
-            resp = requests.get(f"https://api.sleeper.app/v1/league/{league_id}/matchups/{wk}")
-            resp.raise_for_status()
-            matchups = resp.json()
-            print(f"     Found {len(matchups)} matchups")
-            matchups_by_week[wk] = matchups
+        matchups_by_week: Dict[int, List[dict]] = week_cache.get_matchups(
+            sleeper, league_id, weeks_pre + [w14, w15, w16, w17], latest_completed_week
+        )
+
+        # ——— GAME STATES (from the NFL schedule, once per week per refresh) ———
+        game_states = {}
+
+        def game_state_provider(week):
+            """Schedule-based game states; players the schedule cannot place fall back to live points."""
+            if week not in game_states:
+                live_points = {
+                    pid: points
+                    for m in matchups_by_week.get(week) or []
+                    for pid, points in (m.get("players_points") or {}).items()
+                }
+                game_states[week] = nfl_schedule.game_states(sleeper, week, fallback=points_game_state(live_points))
+            return game_states[week]
+
+        # ——— SHORT-CIRCUIT WHEN NOTHING CHANGED ———
+        # Raw response digests (304s keep theirs), the completed-week boundary and the playoff games' states
+        states_version = ",".join(game_state_provider(wk).version for wk in (w14, w15, w16, w17))
+        fingerprint = f"{latest_completed_week}:{sleeper.fingerprint(f'/league/{league_id}/')}:{states_version}"
+        if fingerprint == league.fingerprint and league.latest_data.get('timestamp'):
+            league.refresh_stats['skipped_cycles'] += 1
+            print("[OK] Sleeper responses unchanged, skipping rebuild and broadcast")
+            return
+
+        for wk, matchups in matchups_by_week.items():
+            print(f"   Week {wk}: {len(matchups)} matchups")
             for m in matchups:
                 scores[m["roster_id"]][wk] = m.get("points",0.0)
         print(f"[OK] Scores loaded for {len(scores)} rosters")
 
-        # ——— FETCH MATCHUP DATA FOR WIN/LOSS RECORDS ———
+        # ——— DERIVE WIN/LOSS RECORDS (from the matchups already fetched) ———
         print("[INFO] Calculating win/loss records...")
-        team_records = {rid: {'wins': 0, 'losses': 0, 'weekly_records': []} for rid in roster_to_name}
-
-        for week in range(1, 14):  # Regular season weeks 1-13
-            resp = requests.get(f"https://api.sleeper.app/v1/league/{league_id}/matchups/{week}")
-            resp.raise_for_status()
-            matchups = resp.json()
-            
-            # Group matchups by matchup_id to find head-to-head results
-            matchup_groups = {}
-            for m in matchups:
-                mid = m.get('matchup_id')
-                if mid not in matchup_groups:
-                    matchup_groups[mid] = []
-                matchup_groups[mid].append(m)
-            
-            # Determine winners for each matchup
-            for matchup_list in matchup_groups.values():
-                if len(matchup_list) == 2:  # Head-to-head matchup
-                    team1, team2 = matchup_list
-                    if team1.get('points', 0) > team2.get('points', 0):
-                        team_records[team1['roster_id']]['wins'] += 1
-                        team_records[team2['roster_id']]['losses'] += 1
-                    else:
-                        team_records[team2['roster_id']]['wins'] += 1
-                        team_records[team1['roster_id']]['losses'] += 1
-            
-            # Store weekly record snapshot
-            for rid in team_records:
-                team_records[rid]['weekly_records'].append({
-                    'week': week,
-                    'wins': team_records[rid]['wins'],
-                    'losses': team_records[rid]['losses']
-                })
+        team_records = compute_team_records(matchups_by_week, roster_to_name, weeks_pre)
 
         print(f"[OK] Win/loss records calculated for {len(team_records)} teams")
 
@@ -206,675 +388,454 @@ def fetch_playoff_data():
         for r in results[:5]:  # Show top 5
             print(f"   #{r['orig_seed']}: {r['team']} - {r['pre_total']:.2f}")
 
-        # ——— IDENTIFY WILDCARD WINNER ———
-        print("[INFO] Identifying wildcard winner...")
-        wildcards = [r for r in results if 7<=r["orig_seed"]<=12]
-        wildcard_winner = max(wildcards, key=lambda r:r["wk14"]) if wildcards else None
-        if wildcard_winner:
-            print(f"   Wildcard winner: {wildcard_winner['team']}")
-        else:
-            print("   No wildcard winner found")
-
-        # ——— ASSIGN ROUND 1 POSITIONS ———
-        print("[INFO] Assigning playoff positions...")
-        for r in results:
-            seed=r["orig_seed"]
-            if seed<=2: 
-                r["position"]="Bye"
-                print(f"   #{seed} {r['team']}: Bye")
-            elif seed<=6: 
-                r["position"]="Playoff"
-                print(f"   #{seed} {r['team']}: Playoff")
-            else: 
-                r["position"]="Wildcard Winner" if r is wildcard_winner else "Toliet Bowl"
-                print(f"   #{seed} {r['team']}: {r['position']}")
-
-        # ——— BUILD LISTS ———
-        bye_list = [r for r in results if r["position"]=="Bye"]
-        playoff_list = sorted([r for r in results if r["position"]=="Playoff"], key=lambda r:r["wk14"], reverse=True)
-        wildcard_list = sorted([r for r in results if r["position"] in ("Wildcard Winner","Toliet Bowl")],
-                              key=lambda r:r["wk14"], reverse=True)
-
-        # Week 14: top/low bye based on seeds (not Week 14 scores)
-        # Duel of the Fates should be Seed #1 vs Seed #2
-        bye_list_sorted = sorted(bye_list, key=lambda r:r["orig_seed"])
-        top_bye = bye_list_sorted[0] if len(bye_list_sorted) > 0 else None
-        low_bye = bye_list_sorted[1] if len(bye_list_sorted) > 1 else top_bye
-
-        # Week15 lists - also use seeds, not week 15 scores
-        top_bye15 = bye_list_sorted[0] if len(bye_list_sorted) > 0 else None
-        low_bye15 = bye_list_sorted[1] if len(bye_list_sorted) > 1 else top_bye15
-        playoff15 = [r for r in results if 3<=r["orig_seed"]<=6]
-        if wildcard_winner: playoff15.append(wildcard_winner)
-        playoff15_sorted = sorted(playoff15, key=lambda r:r["wk15"], reverse=True)[:5]
-        wild15_sorted = sorted([r for r in wildcard_list if r is not wildcard_winner],
-                              key=lambda r:r["wk15"], reverse=True)[:5]
-
-        # Combined Week14+15 (only for bye teams and wildcard losers)
-        for r in bye_list: r["combined"]=r["wk14"]+r["wk15"]
-        for r in wildcard_list: r["combined"]=r["wk14"]+r["wk15"]
-        top_bye_comb = max(bye_list, key=lambda r:r["combined"])
-        low_bye_comb = min(bye_list, key=lambda r:r["combined"])
-        
-        # Divisional Round (Seeds 3-6 + wildcard winner): Week 15 ONLY (no aggregate)
-        playoff_comb = sorted(playoff15, key=lambda r:r["wk15"], reverse=True)[:5]
-        wild_comb_sorted = sorted([r for r in wildcard_list if r is not wildcard_winner],
-                                  key=lambda r:r["combined"], reverse=True)[:5]
-
-        # Week16 lists - top 3 from Week 15 playoff advance
-        conf_list = bye_list + sorted(playoff_comb, key=lambda r:r["wk16"], reverse=True)[:3]
-        conf_sorted = sorted(conf_list, key=lambda r:r["wk16"], reverse=True)
-        # Purgatory: bottom 2 from playoff + second-best wildcard by wk16
-        purg_list = sorted(playoff_comb, key=lambda r:r["wk15"])[:2] + \
-                    [sorted(wildcard_list, key=lambda r:r["wk16"], reverse=True)[1]]
-        purg_sorted = sorted(purg_list, key=lambda r:r["wk16"], reverse=True)
-        toilet_sorted = sorted(results, key=lambda r:r["wk16"])[:4]
-        toilet_sorted = sorted(toilet_sorted, key=lambda r:r["wk16"], reverse=True)
-
-        # Week17 lists
-        conf_top3 = conf_sorted[:3]
-        conf_top3_sorted = sorted(conf_top3, key=lambda r: r["wk17"], reverse=True)
-        bottom2_conf16 = sorted(conf_list, key=lambda r: r["wk16"])[:2]
-        
-        # Build toilet_list for Week 17 calculations
-        remaining_wild = [r for r in wildcard_list if r["roster_id"] not in {t["roster_id"] for t in conf_list + purg_list}]
-        toilet_list = sorted(remaining_wild, key=lambda r: r["wk15"])[:4]
-        
-        toilet_top16 = sorted(toilet_list, key=lambda r: r["wk16"], reverse=True)[0] if toilet_list else None
-        purg17_list = purg_list + bottom2_conf16 + ([toilet_top16] if toilet_top16 else [])
-        purg17_sorted = sorted(purg17_list, key=lambda r: r["wk17"], reverse=True)
-        exclude_ids = {t["roster_id"] for t in conf_top3 + purg17_list}
-        toilet_candidates = [r for r in wildcard_list if r["roster_id"] not in exclude_ids]
-        toilet_bottom3_16 = sorted(toilet_candidates, key=lambda r: r["wk16"])[:3]
-        toilet17_sorted = sorted(toilet_bottom3_16, key=lambda r: r["wk17"], reverse=True)
-
         # Prepare data for frontend
-        global latest_data
         central_tz = pytz.timezone('America/Chicago')
         current_time = datetime.now(central_tz).strftime("%m/%d/%Y %H:%M CST")
         
-        # ——— CALCULATE PAYOUTS DATA ———
-        print("[INFO] Calculating payout data...")
-        
-        # Determine which weeks are complete based on current date
-        # NFL weeks end on Monday night, we consider them complete starting Tuesday
-        # Week 1 starts Sep 4, 2025 (Thursday)
-        # Each week is 7 days, ending on Monday night
-        # We mark as complete on Tuesday (2 days after Sunday of that week)
-        
+        # Week completion (Tuesday after MNF) comes from the shared season calendar
         now = datetime.now(central_tz)
-        
-        # NFL 2025 season start date (Week 1 Thursday, Sep 4, 2025)
-        season_start = central_tz.localize(datetime(2025, 9, 4))
-        
-        # Calculate which week we're in and which weeks are complete
-        # NFL weeks run Thursday-Monday with games primarily on Sunday
-        # Week is considered complete starting Tuesday after Monday Night Football
-        days_since_start = (now - season_start).days
-        current_nfl_week = (days_since_start // 7) + 1
-        
-        # Determine the latest fully completed week
-        # Each week starts on Thursday and is complete 5 days later (following Tuesday)
-        # Example: Week 1 starts Thu Sep 4, complete Tue Sep 9 (5 days later)
-        latest_completed_week = 0
-        for week in range(1, 18):
-            # Week starts on Thursday of that week
-            week_start = season_start + timedelta(weeks=week-1)
-            # Week is complete 5 days after Thursday start (= Tuesday)
-            week_complete_date = week_start + timedelta(days=5)
-            
-            if now >= week_complete_date:
-                latest_completed_week = week
-            else:
-                break
+        current_nfl_week = season_calendar.current_nfl_week(now)
         
         print(f"[INFO] Current date: {now.strftime('%Y-%m-%d %H:%M')}")
         print(f"[INFO] Current NFL week in progress: {current_nfl_week}")
         print(f"[INFO] Latest completed week: {latest_completed_week}")
         
-        # For tournament display, show the week after the latest completed week
-        # This ensures we show data for the upcoming/current week once previous week finishes
-        current_week_for_display = min(latest_completed_week + 1, 17)
-        
-        # Weekly high scores (only for completed weeks 1-13)
-        weekly_winners = {}
-        for week in range(1, min(14, latest_completed_week + 1)):
-            week_scores = [(r['team'], scores[r['roster_id']].get(week, 0)) for r in results]
-            # Only add if there are actual scores
-            if any(score > 0 for _, score in week_scores):
-                winner_team, winner_score = max(week_scores, key=lambda x: x[1])
-                weekly_winners[week] = {
-                    'team': winner_team,
-                    'score': winner_score,
-                    'week': week,
-                    'payout': 25,
-                    'date': ''  # Can be populated with actual dates if needed
-                }
-        
-        # Season high score (only if week 13 is complete)
-        season_high_score = None
-        if latest_completed_week >= 13:
-            season_high_team = max(results, key=lambda r: r['pre_total'])
-            season_high_score = {
-                'team': season_high_team['team'],
-                'totalScore': season_high_team['pre_total'],
-                'payout': 75,
-                'date': ''
-            }
-        
-        # Duel of Fates (only if week 15 is complete)
-        duel_of_fates = {}
-        if latest_completed_week >= 15 and len(bye_list) >= 2:
-            bye_teams_sorted = sorted(bye_list, key=lambda r: r.get("combined", 0), reverse=True)
-            
-            # Calculate payout based on winning margin
-            winner_score = bye_teams_sorted[0].get("combined", 0)
-            loser_score = bye_teams_sorted[1].get("combined", 0)
-            margin = abs(winner_score - loser_score)
-            
-            # Payout tiers based on margin
-            if margin <= 7.5:
-                win_payout, lose_payout = 60, 40
-            elif margin <= 15:
-                win_payout, lose_payout = 70, 30
-            elif margin <= 23.5:
-                win_payout, lose_payout = 80, 20
-            elif margin <= 30:
-                win_payout, lose_payout = 90, 10
-            else:
-                win_payout, lose_payout = 100, 0
-            
-            print(f"[INFO] Duel of Fates margin: {margin:.2f} points -> ${win_payout}/${lose_payout}")
-            
-            duel_of_fates[bye_teams_sorted[0]['team']] = {
-                'team': bye_teams_sorted[0]['team'],
-                'payout': win_payout,
-                'category': 'Duel of the Fates Winner',
-                'date': ''
-            }
-            duel_of_fates[bye_teams_sorted[1]['team']] = {
-                'team': bye_teams_sorted[1]['team'],
-                'payout': lose_payout,
-                'category': 'Duel of the Fates Runner-up',
-                'date': ''
-            }
-        
-        # Champion (only if week 17 is complete)
-        champion = None
-        if latest_completed_week >= 17 and conf_top3_sorted:
-            champion_team = conf_top3_sorted[0]
-            champion = {
-                'team': champion_team['team'],
-                'payout': 700,
-                'date': ''
-            }
-        
-        payouts_data = {
-            'weeklyWinners': weekly_winners,
-            'seasonHighScore': season_high_score,
-            'duelOfFates': duel_of_fates,
-            'champion': champion,
-            'lastUpdated': current_time,
-            'currentWeek': latest_completed_week,  # For payout display (completed only)
-            'currentWeekInProgress': current_week_for_display  # For tournament display (includes in-progress)
-        }
-        print(f"[OK] Payouts calculated: {len(weekly_winners)} weekly winners for completed weeks")
-        print(f"[INFO] Tournament will show data through week {current_week_for_display} (including in-progress)")
-        
-        # Calculate projected scores and payouts
-        def calculate_projected_score(team, week):
+        # Calculate projected scores (matchups indexed once per refresh)
+        matchup_index = build_matchup_index(matchups_by_week)
+        projection_lookback = 3
+        # A new data version sweeps memo entries the previous refresh never used
+        projection_memo.begin(fingerprint)
+        week_digests = {}
+
+        def lookback_digests(week):
+            """Digests of the weeks a projection for ``week`` reads (hashed on first use)."""
+            for back in range(1, projection_lookback + 1):
+                if week - back not in week_digests:
+                    week_digests[week - back] = matchup_digest(matchups_by_week.get(week - back))
+            return tuple(week_digests[week - back] for back in range(1, projection_lookback + 1))
+
+        def calculate_projected_score(roster_id, week):
             """Compute intelligent projection for the given roster and target week."""
-            roster_id = team.get("roster_id")
             if not roster_id:
                 return 0.0
 
             current_week_matchups = matchups_by_week.get(week, [])
-
-            # Default heuristic: if a player shows > 0 points this week → IN_PROGRESS; else NOT_STARTED
-            # We cannot reliably distinguish FINISHED without a schedule feed, so keep provider pluggable.
-            # This can be replaced later by injecting a real schedule-aware provider.
-            players_points_lookup = {}
-            rm = next((m for m in current_week_matchups if m.get("roster_id") == roster_id), None)
-            if rm is not None:
-                players_points_lookup = rm.get("players_points") or {}
-
-            def get_player_game_state(player_id: str):
-                live = float(players_points_lookup.get(player_id, 0.0))
-                if live > 0.0:
-                    return "IN_PROGRESS"
-                return "NOT_STARTED"
-
-            rp = compute_roster_projection(
-                roster_id=roster_id,
-                week=week,
-                matchups_by_week=matchups_by_week,
-                current_week_matchups=current_week_matchups,
-                get_player_game_state=get_player_game_state,
-                weights=(0.6, 0.3, 0.1),
-                lookback_weeks=3,
-                exclude_zero_points=True,
-                default_floor=0.0,
+            rm = matchup_index.roster_matchup(week, current_week_matchups, roster_id)
+            # Everything the projection reads: this roster's live matchup, the lookback weeks and game states
+            memo_key = (
+                roster_id,
+                week,
+                matchup_digest(rm),
+                lookback_digests(week),
+                game_state_provider(week).version,
             )
-            return rp.projected_total
-
-        def get_next_week(team, current_week):
-            """Determine next week assignment based on current week and performance"""
-            if current_week == 15:
-                if team in bye_list:
-                    return "Conf Champ"
-                elif team in playoff15_sorted[:3]:
-                    return "Conf Champ"
-                else:
-                    return "Purgatory"
-            elif current_week == 16:
-                if team in conf_sorted[:3]:
-                    return "Superbowl"
-                else:
-                    return "Purgatory"
-            elif current_week == 17:
-                if team in conf_top3_sorted[:1]:
-                    return "Champion"
-                else:
-                    return "Purgatory"
-            return ""
-
-        def get_payout(team, current_week):
-            """Calculate payout based on performance and week"""
-            if current_week == 15:
-                if team in bye_list:
-                    # For Duel of the Fates (bye teams), calculate based on winning margin
-                    if len(bye_list) >= 2:
-                        # Get the two bye teams and their combined scores
-                        bye_teams = sorted(bye_list, key=lambda r: r["combined"], reverse=True)
-                        winner = bye_teams[0]
-                        loser = bye_teams[1]
-                        
-                        if team == winner:
-                            # Calculate winning margin
-                            margin = winner["combined"] - loser["combined"]
-                            
-                            # Apply winning margin rules
-                            if margin <= 7.5:
-                                return "$60.00"
-                            elif margin <= 15:
-                                return "$70.00"
-                            elif margin <= 23.5:
-                                return "$80.00"
-                            elif margin <= 30:
-                                return "$90.00"
-                            else:
-                                return "$100.00"
-                        elif team == loser:
-                            # Calculate winning margin
-                            margin = winner["combined"] - loser["combined"]
-                            
-                            # Apply winning margin rules
-                            if margin <= 7.5:
-                                return "$40.00"
-                            elif margin <= 15:
-                                return "$30.00"
-                            elif margin <= 23.5:
-                                return "$20.00"
-                            elif margin <= 30:
-                                return "$10.00"
-                            else:
-                                return "$0.00"
-                    
-                    # Fallback for single team
-                    return "$60.00" if team == top_bye15 else "$40.00"
-                else:
-                    return "$-"
-            elif current_week == 17:
-                if team in conf_top3_sorted[:1]:
-                    return "$700.00"
-                else:
-                    return "$-"
-            return "$-"
-
-        # After calculating results and before building latest_data, add initial standings
-        initial_standings = []
-        for idx, r in enumerate(results, start=1):
-            initial_standings.append({
-                'seed': idx,
-                'team': r['team'],
-                'position': r['position'],
-                'pre_total': fmt(r['pre_total'])
-            })
-
-        # Create toilet bowl data for Week 15 (all wildcard teams except the winner)
-        toilet_bowl_teams = [r for r in wildcard_list if r is not wildcard_winner]
-        
-        # Divisional Round result logic - top 3 by Week 15 score only (no aggregate)
-        playoff_result_sorted = sorted(playoff_comb, key=lambda r: r["wk15"], reverse=True)
-        
-        # Build week15 data first
-        week15_data = {
-            'bye': [{'team': f"({top_bye15['orig_seed']}) {top_bye15['team']}", 'score': fmt(top_bye15["wk15"])}, 
-                   {'team': f"({low_bye15['orig_seed']}) {low_bye15['team']}", 'score': fmt(low_bye15["wk15"])}],
-            'playoff': [{'team': f"({t['orig_seed']}) {t['team']}", 'score': fmt(t["wk15"])} for t in playoff15_sorted],
-            'toilet': [{'team': f"({t['orig_seed']}) {t['team']}", 'score': fmt(t["wk15"])} for t in toilet_bowl_teams],
-            'bye_result': [
-                {
-                    'team': f"({t['orig_seed']}) {t['team']}",
-                    'proj_score': fmt(calculate_projected_score(t, 15)),
-                    'score': fmt(calculate_projected_score(t, 15)),
-                    'next_week': get_next_week(t, 15),
-                    'payout': get_payout(t, 15)
-                } for t in bye_list
-            ],
-            'playoff_result': [
-                {
-                    'team': f"({t['orig_seed']}) {t['team']}",
-                    'proj_score': fmt(calculate_projected_score(t, 15)),
-                    'score': fmt(t["wk15"]),
-                    'next_week': "Conf Champ" if idx < 3 else "Purgatory",
-                    'payout': get_payout(t, 15)
-                } for idx, t in enumerate(playoff_result_sorted)
-            ],
-            'toilet_result': [
-                {
-                    'team': f"({t['orig_seed']}) {t['team']}",
-                    'proj_score': fmt(calculate_projected_score(t, 15)),
-                    'score': fmt(t["combined"]),
-                    'next_week': "Purgatory" if idx == 0 else "Toilet Bowl",
-                    'payout': get_payout(t, 15)
-                } for idx, t in enumerate(wild_comb_sorted)
-            ]
-        }
-        
-        # Get teams that should be in conference championship (store roster_id for lookup)
-        conf_champ_roster_ids = set()
-        for result in week15_data['playoff_result']:
-            if result['next_week'] == 'Conf Champ':
-                # Extract roster_id from team string: "(seed) Team Name"
-                team_str = result['team']
-                for t in results:
-                    if f"({t['orig_seed']}) {t['team']}" == team_str:
-                        conf_champ_roster_ids.add(t['roster_id'])
-        for result in week15_data['bye_result']:
-            if result['next_week'] == 'Conf Champ':
-                team_str = result['team']
-                for t in results:
-                    if f"({t['orig_seed']}) {t['team']}" == team_str:
-                        conf_champ_roster_ids.add(t['roster_id'])
-        
-        # Conference Championship: all Conf Champ teams, sorted by wk16 score
-        conf_champ_teams = [t for t in results if t['roster_id'] in conf_champ_roster_ids]
-        conf_champ_sorted = sorted(conf_champ_teams, key=lambda t: t['wk16'], reverse=True)
-        conference_rows = []
-        for idx, t in enumerate(conf_champ_sorted):
-            next_week = 'Superbowl' if idx < 3 else 'Purgatory'
-            conference_rows.append({
-                'team': f"({t['orig_seed']}) {t['team']}",
-                'proj_score': fmt(calculate_projected_score(t, 16)),
-                'score': fmt(t['wk16']),
-                'next_week': next_week
-            })
-
-        # Purgatory: all teams with Purgatory in next_week from BOTH week15 playoff_result and toilet_result
-        purgatory_roster_ids = set()
-        for result in week15_data['playoff_result']:
-            if result['next_week'] == 'Purgatory':
-                team_str = result['team']
-                for t in results:
-                    if f"({t['orig_seed']}) {t['team']}" == team_str:
-                        purgatory_roster_ids.add(t['roster_id'])
-        for result in week15_data['toilet_result']:
-            if result['next_week'] == 'Purgatory':
-                team_str = result['team']
-                for t in results:
-                    if f"({t['orig_seed']}) {t['team']}" == team_str:
-                        purgatory_roster_ids.add(t['roster_id'])
-        purgatory_teams = [t for t in results if t['roster_id'] in purgatory_roster_ids]
-        purgatory_sorted = sorted(purgatory_teams, key=lambda t: t['wk16'], reverse=True)
-        purgatory_rows = []
-        for t in purgatory_sorted:
-            purgatory_rows.append({
-                'team': f"({t['orig_seed']}) {t['team']}",
-                'proj_score': fmt(calculate_projected_score(t, 16)),
-                'score': fmt(t['wk16']),
-                'next_week': 'Purgatory'
-            })
-
-        def normalize_team_string(s):
-            # Extract seed and name, ignore whitespace/case
-            m = re.match(r"\((\d+)\)\s*(.*)", s.strip())
-            if m:
-                seed, name = m.groups()
-                return int(seed), name.strip().lower()
-            return None, s.strip().lower()
-
-        # Toilet Bowl: all teams from toilet_result except the top scorer (index 0)
-        toilet_bowl_roster_ids = set()
-        # Skip the first team (top scorer) from toilet_result, include all others
-        for result in week15_data['toilet_result'][1:]:  # Skip index 0 (top scorer)
-            seed, name = normalize_team_string(result['team'])
-            for t in results:
-                if t['orig_seed'] == seed and t['team'].strip().lower() == name:
-                    toilet_bowl_roster_ids.add(t['roster_id'])
-        toilet_bowl_teams = [t for t in results if t['roster_id'] in toilet_bowl_roster_ids]
-        toilet_bowl_sorted = sorted(toilet_bowl_teams, key=lambda t: t['wk16'], reverse=True)
-        toilet_rows = []
-        for idx, t in enumerate(toilet_bowl_sorted):
-            next_week = 'Purgatory' if idx == 0 else 'Toilet Bowl'
-            toilet_rows.append({
-                'team': f"({t['orig_seed']}) {t['team']}",
-                'proj_score': fmt(calculate_projected_score(t, 16)),
-                'score': fmt(t['wk16']),
-                'next_week': next_week
-            })
-
-        latest_data = {
-            'timestamp': current_time,
-            'payouts': payouts_data,
-            'week14': {
-                'bye': [{'team': f"({top_bye['orig_seed']}) {top_bye['team']}", 'score': fmt(top_bye["wk14"])}, 
-                       {'team': f"({low_bye['orig_seed']}) {low_bye['team']}", 'score': fmt(low_bye["wk14"])}],
-                'playoff': [{'team': f"({t['orig_seed']}) {t['team']}", 'score': 'Bye Week'} for t in playoff_list[:4]],
-                'wildcard': [{'team': f"({t['orig_seed']}) {t['team']}", 'score': fmt(t["wk14"])} for t in wildcard_list]
-            },
-            'week15': week15_data,
-            'week16': {
-                'conference': conference_rows,
-                'purgatory': purgatory_rows,
-                'toilet': toilet_rows
-            },
-            'week17': {
-                'championship': [
-                    {
-                        'team': f"({t['orig_seed']}) {t['team']}", 
-                        'proj_score': fmt(calculate_projected_score(t, 17)),
-                        'score': fmt(t["wk17"]),
-                        'final_result': "Champion" if idx == 0 else "Purgatory",
-                        'payout': get_payout(t, 17)
-                    } for idx, t in enumerate(sorted([t for t in conf_champ_sorted if any(result['team'] == f"({t['orig_seed']}) {t['team']}" and result['next_week'] == 'Superbowl' for result in conference_rows)], key=lambda t: t['wk17'], reverse=True))
-                ],
-                'purgatory': [
-                    {
-                        'team': f"({t['orig_seed']}) {t['team']}", 
-                        'proj_score': fmt(calculate_projected_score(t, 17)),
-                        'score': fmt(t["wk17"]),
-                        'final_result': "Purgatory",
-                        'payout': get_payout(t, 17)
-                    } for t in sorted([t for t in results if any(result['team'] == f"({t['orig_seed']}) {t['team']}" and result['next_week'] == 'Purgatory' for result in conference_rows + purgatory_rows + toilet_rows)], key=lambda t: t['wk17'], reverse=True)
-                ],
-                'toilet': [
-                    {
-                        'team': f"({t['orig_seed']}) {t['team']}", 
-                        'proj_score': fmt(calculate_projected_score(t, 17)),
-                        'score': fmt(t["wk17"]),
-                        'final_result': "Toilet Bowl",
-                        'payout': get_payout(t, 17)
-                    } for t in sorted(toilet17_sorted, key=lambda t: t['wk17'], reverse=True)
-                ]
-            },
-            'standings': [{'seed': r['orig_seed'], 'team': r['team'], 'position': r['position'], 'pre_total': fmt(r['pre_total'])} for r in results],
-            'initial_standings': initial_standings,
-            'the_run': {
-                'teams': [
-                    {
-                        'team': r['team'],
-                        'seed': r['orig_seed'],
-                        'weekly_records': r['weekly_records'],
-                        'all_weekly_scores': r['all_weekly_scores'],
-                        'position': r['position'],
-                        'playoff_scores': {
-                            'wk14': r['wk14'],
-                            'wk15': r['wk15'], 
-                            'wk16': r['wk16'],
-                            'wk17': r['wk17']
-                        }
-                    } for r in results
-                ],
-                'playoff_results': {
-                    'week15': week15_data,
-                    'week16': {
-                        'conference': conference_rows,
-                        'purgatory': purgatory_rows,
-                        'toilet': toilet_rows
-                    },
-                    'week17': {
-                        'championship': [
-                            {
-                                'team': f"({t['orig_seed']}) {t['team']}", 
-                                'proj_score': fmt(calculate_projected_score(t, 17)),
-                                'score': fmt(t["wk17"]),
-                                'final_result': "Champion" if idx == 0 else "Purgatory",
-                                'payout': get_payout(t, 17)
-                            } for idx, t in enumerate(sorted([t for t in conf_champ_sorted if any(result['team'] == f"({t['orig_seed']}) {t['team']}" and result['next_week'] == 'Superbowl' for result in conference_rows)], key=lambda t: t['wk17'], reverse=True))
-                        ],
-                        'purgatory': [
-                            {
-                                'team': f"({t['orig_seed']}) {t['team']}", 
-                                'proj_score': fmt(calculate_projected_score(t, 17)),
-                                'score': fmt(t["wk17"]),
-                                'final_result': "Purgatory",
-                                'payout': get_payout(t, 17)
-                            } for t in sorted([t for t in results if any(result['team'] == f"({t['orig_seed']}) {t['team']}" and result['next_week'] == 'Purgatory' for result in conference_rows + purgatory_rows + toilet_rows)], key=lambda t: t['wk17'], reverse=True)
-                        ],
-                        'toilet': [
-                            {
-                                'team': f"({t['orig_seed']}) {t['team']}", 
-                                'proj_score': fmt(calculate_projected_score(t, 17)),
-                                'score': fmt(t["wk17"]),
-                                'final_result': "Toilet Bowl",
-                                'payout': get_payout(t, 17)
-                            } for t in sorted(toilet17_sorted, key=lambda t: t['wk17'], reverse=True)
-                        ]
-                    }
-                }
-            }
-        }
+            projection = projection_memo.get_or_compute(
+                memo_key, lambda: _project_roster(roster_id, week, current_week_matchups, rm)
+            )
+            # The full breakdown is kept for /api/projection; only the total goes into the sections
+            projection_breakdowns.record(memo_key, projection, week)
+            return projection.projected_total
+
+        synced_weeks = set()
+
+        def _projection_state(week):
+            """Per-week incremental state: rebuilt when the lookback weeks change, else synced once per refresh."""
+            get_player_game_state = game_state_provider(week)
+            history_key = lookback_digests(week)
+            entry = projection_states.get(week)
+            if entry is None or entry[0] != history_key:
+                state = IncrementalProjection(
+                    week,
+                    matchups_by_week,
+                    get_player_game_state,
+                    weights=(0.6, 0.3, 0.1),
+                    lookback_weeks=projection_lookback,
+                    exclude_zero_points=True,
+                    default_floor=0.0,
+                    index=matchup_index,
+                )
+                projection_states[week] = (history_key, state)
+            else:
+                state = entry[1]
+                if week not in synced_weeks:
+                    # Same lookback data: only starters whose live points moved are re-selected
+                    state.matchups_by_week, state.index = matchups_by_week, matchup_index
+                    state.sync(matchups_by_week.get(week, []), get_player_game_state)
+            synced_weeks.add(week)
+            return state
+
+        def _project_roster(roster_id, week, current_week_matchups, rm):
+            state = _projection_state(week)
+            if not state.is_tracked(roster_id):
+                state.track(roster_id, rm)
+            return state.roster_projection(roster_id)
+
+        # ——— BUILD TOURNAMENT SECTIONS (each section built once) ———
+        print("[INFO] Building tournament sections...")
+        sections = build_tournament_sections(
+            results,
+            project=calculate_projected_score,
+            latest_completed_week=latest_completed_week,
+            current_time=current_time,
+        )
+        for row in sections['standings']:
+            print(f"   #{row['seed']} {row['team']}: {row['position']}")
+
+        # Inputs of the odds simulation, which runs in the background once this version is published
+        league.team_names = dict(roster_to_name)
+        score_model = build_score_model(
+            roster_to_name,
+            matchups_by_week=matchups_by_week,
+            latest_completed_week=latest_completed_week,
+            get_player_game_state=game_state_provider(latest_completed_week + 1),
+        ) if len(roster_to_name) >= 8 else None
+        payouts_data = sections['payouts']
+        print(f"[OK] Payouts calculated: {len(payouts_data['weeklyWinners'])} weekly winners for completed weeks")
+        print(f"[INFO] Tournament will show data through week {payouts_data['currentWeekInProgress']} (including in-progress)")
+
+        league.latest_data = latest_data = {'timestamp': current_time, **sections}
         
-        # Emit updated data to all connected clients
+        # Emit only the changed sections to connected clients
         print("[INFO] Data processed successfully, emitting to clients...")
         print(f"[INFO] Timestamp being sent: {latest_data['timestamp']}")
-        socketio.emit('data_update', latest_data)
+        delta = live_state.update(latest_data)
+        if delta:
+            print(f"[INFO] Broadcasting v{delta['version']} delta for sections: {', '.join(delta['sections'])}")
+            socketio.emit('data_delta', delta, to=full_data_room(league))
+            for name, ops in delta['sections'].items():
+                section_version = delta['section_versions'][name]
+                socketio.emit('section_delta', {
+                    'name': name,
+                    'version': section_version,
+                    'base_version': section_version - 1,
+                    'ops': ops,
+                }, to=section_room(league, name))
+            # Persist for warm restarts and the static GitHub Pages build
+            if league.snapshot_path and write_snapshot(league.snapshot_path, latest_data):
+                print(f"[OK] Snapshot written to {league.snapshot_path}")
+            # Publish for the other workers (and for this one after a restart)
+            state_store.publish(league.key, StoredState(live_state.version, dict(live_state.section_versions), latest_data))
+        projection_breakdowns.publish(live_state.version)
+        league.odds_inputs = (live_state.version, score_model, league.team_names) if score_model else None
+        league.odds_builder.trigger()
+        league.fingerprint = fingerprint
+        league.refresh_stats['full_cycles'] += 1
         print("[OK] Data update complete")
         
     except Exception as e:
+        projection_breakdowns.discard()
         print(f"[ERROR] Error fetching data: {e}")
-        import traceback
-        traceback.print_exc()
-        socketio.emit('error', {'message': str(e)})
+        socketio.emit('error', {'message': str(e)}, to=league_room(league))
+        # The refresher logs the traceback and records the failure; the scheduler backs off on it
+        raise
+
+def background_cycle():
+    """One update-loop pass; returns the seconds to sleep before the next"""
+    if hold_refresh_lease():
+        # Leader: catch up with whatever a previous leader published, then crawl the leagues that are due
+        sync_from_store()
+        # The daily player dump downloads in the background; refreshes use the stored copy meanwhile
+        player_registry.refresh_if_stale(sleeper)
+        wait = scheduler.run_due(leagues)
+        idp_scoring.refresh_if_stale()
+        # Wake at least once per interval to renew the lease, even when no league is due for longer
+        return min(wait, POLL_INTERVAL_SECONDS)
+    # Follower: the leader's broadcasts reach our clients through the message queue
+    sync_from_store()
+    return FOLLOWER_POLL_SECONDS
 
 def background_update():
-    """Background thread to continuously update data"""
+    """Background task to continuously update data"""
     while True:
-        fetch_playoff_data()
-        time.sleep(60)  # Update every 60 seconds
+        socketio.sleep(background_cycle())
+
+_background_lock = threading.Lock()
+_background_pid = None
+
+def start_background_tasks():
+    """
+    Start the update loop as a Socket.IO background task, once per process.
+    Keyed on the pid so a worker forked from a preloaded master still starts its own.
+    """
+    global _background_pid
+    with _background_lock:
+        if _background_pid == os.getpid():
+            return False
+        _background_pid = os.getpid()
+    atexit.register(release_refresh_lease)
+    socketio.start_background_task(background_update)
+    return True
 
 @app.route('/')
 def index():
-    return render_template('index.html')
+    response = make_response(render_template('index.html', league_key=None, websocket_only=SOCKETIO_WEBSOCKET_ONLY))
+    response.add_etag()
+    return response.make_conditional(request)
+
+@app.route('/leagues/<key>')
+def league_index(key):
+    """Dashboard page for one hosted league (by key or league_id)"""
+    league = leagues.get(key)
+    if league is None:
+        return jsonify({'error': f"Unknown league '{key}'"}), 404
+    response = make_response(render_template('index.html', league_key=league.key, websocket_only=SOCKETIO_WEBSOCKET_ONLY))
+    response.add_etag()
+    return response.make_conditional(request)
+
+def league_room(league):
+    """Socket.IO room of every client of one league"""
+    return f'league:{league.key}'
+
+def full_data_room(league):
+    """Room of a league's clients that get full snapshots and whole-document deltas"""
+    return f'league:{league.key}:full'
+
+def section_room(league, name):
+    """Room whose members receive ``section_delta`` events for one section of one league"""
+    return f'league:{league.key}:section:{name}'
+
+def _data_response(league):
+    # latest_data serialized and compressed once per version
+    return json_response(league.data_documents.get(league.latest_data), request)
+
+def _section_response(league, section):
+    version, value = league.live_state.section(section)
+    if value is None:
+        return jsonify({'error': f"Unknown section '{section}'"}), 404
+    # Per-section documents, re-encoded only when that section's version moves
+    documents = league.section_documents.setdefault(section, DocumentCache())
+    doc = documents.get({'name': section, 'version': version, 'data': value}, key=version)
+    return json_response(doc, request)
 
 @app.route('/api/data')
 def get_data():
-    return jsonify(latest_data)
+    return _data_response(leagues.default)
 
-# Temporary static snapshot endpoint for front-end hosting convenience
+@app.route('/api/data/<section>')
+def get_data_section(section):
+    return _section_response(leagues.default, section)
+
+# Same document as the on-disk snapshot, for front-end hosting convenience
 @app.route('/data_snapshot.json')
 def data_snapshot():
-    return jsonify(latest_data)
+    return _data_response(leagues.default)
+
+@app.route('/api/leagues')
+def get_leagues():
+    """Hosted leagues with their current versions"""
+    return jsonify({'leagues': [
+        {
+            'key': league.key,
+            'league_id': league.league_id,
+            'league_name': league.config.league_name,
+            'version': league.live_state.version,
+            'timestamp': league.latest_data.get('timestamp', ''),
+        }
+        for league in leagues
+    ]})
+
+@app.route('/api/leagues/<key>/data')
+def get_league_data(key):
+    league = leagues.get(key)
+    if league is None:
+        return jsonify({'error': f"Unknown league '{key}'"}), 404
+    return _data_response(league)
+
+@app.route('/api/leagues/<key>/data/<section>')
+def get_league_data_section(key, section):
+    league = leagues.get(key)
+    if league is None:
+        return jsonify({'error': f"Unknown league '{key}'"}), 404
+    return _section_response(league, section)
+
+# Monte Carlo trials per odds computation (once per data version, after the refresh that published it)
+SIMULATION_TRIALS = int(os.environ.get('SIMULATION_TRIALS', 20000))
+
+def build_odds(league):
+    """Simulate the league's latest published version off the event loop and cache its odds document"""
+    # Loops until current: a refresh may publish a newer version while the trials run
+    while True:
+        inputs = league.odds_inputs
+        if inputs is None or league.odds_documents.key == inputs[0]:
+            return
+        version, model, team_names = inputs
+        result = offload(lambda: simulate(model, trials=SIMULATION_TRIALS, seed=version))
+        league.odds_documents.get_or_build(version, lambda: {'version': version, **result.to_dict(team_names)})
+        print(f"[OK] Odds simulated for {league.key} v{version} ({SIMULATION_TRIALS} trials)")
+
+def _odds_response(league):
+    # Never simulates: the previous version's odds (their body names it) are served while a build runs
+    doc = league.odds_documents.peek()
+    if doc is None:
+        return jsonify({'error': 'Odds are not available yet'}), 503
+    return json_response(doc, request)
+
+@app.route('/api/odds')
+def get_odds():
+    """Championship odds and expected payouts for the default league"""
+    return _odds_response(leagues.default)
+
+@app.route('/api/leagues/<key>/odds')
+def get_league_odds(key):
+    league = leagues.get(key)
+    if league is None:
+        return jsonify({'error': f"Unknown league '{key}'"}), 404
+    return _odds_response(league)
+
+def _projection_response(league, roster_id, week):
+    entry = league.projection_breakdowns.get(roster_id, week)
+    if entry is None:
+        return jsonify({'error': f"No projection for roster {roster_id} in week {week}"}), 404
+    memo_key, projection = entry
+    # Serialized on first request; the memo key changes whenever any input of the projection does
+    documents = league.breakdown_documents.setdefault((roster_id, week), DocumentCache())
+
+    def build():
+        starters = [row.player_id for row in projection.starters_breakdown]
+        return breakdown_document(projection, week, player_registry.get_many(starters))
+
+    return json_response(documents.get_or_build(memo_key, build), request)
+
+@app.route('/api/projection/<int:roster_id>/<int:week>')
+def get_projection(roster_id, week):
+    """Per-starter projection breakdown of one roster in the default league"""
+    return _projection_response(leagues.default, roster_id, week)
+
+@app.route('/api/leagues/<key>/projection/<int:roster_id>/<int:week>')
+def get_league_projection(key, roster_id, week):
+    league = leagues.get(key)
+    if league is None:
+        return jsonify({'error': f"Unknown league '{key}'"}), 404
+    return _projection_response(league, roster_id, week)
+
+@app.route('/api/stats')
+def get_stats():
+    """Refresh cycle and Sleeper traffic counters (top-level sections describe the default league)"""
+    league = leagues.default
+    return jsonify({
+        'refresh': dict(league.refresh_stats, coordinator=league.refresher.stats),
+        'sleeper': sleeper.stats,
+        'sleeper_budget': sleeper.budget.stats if sleeper.budget else None,
+        'projection': league.projection_memo.stats,
+        'projection_breakdowns': league.projection_breakdowns.stats,
+        'responses': league.data_documents.stats,
+        'idp_scoring': idp_scoring.stats,
+        'nfl_schedule': nfl_schedule.stats,
+        'players': player_registry.stats,
+        'scheduler': dict(scheduler.stats, polling=scheduler.policy.describe() if scheduler.policy else None),
+        'leagues': {
+            other.key: {
+                'version': other.live_state.version,
+                'refresh': dict(other.refresh_stats, coordinator=other.refresher.stats),
+                'next_refresh_in': scheduler.due_in(other.key),
+            }
+            for other in leagues
+        },
+        'state_store': {
+            'backend': state_store.backend,
+            'worker': worker_id(),
+            'leader': state_store.leader(),
+            'version': league.live_state.version,
+            'stored_version': state_store.version(league.key),
+        }
+    })
+
+# IDP Scoring sheet, pre-serialized; stale copies are served while one background reload runs
+idp_scoring = IdpScoringCache(
+    lambda: build_idp_payload(spreadsheet),
+    ttl=float(os.environ.get('IDP_CACHE_TTL', 300)),
+    spawn=socketio.start_background_task,
+)
 
 @app.route('/api/idp-scoring')
 def get_idp_scoring():
-    """Fetch IDP Scoring data from Google Sheet"""
-    try:
-        # Check if spreadsheet connection is available
-        if spreadsheet is None:
-            return jsonify({
-                'success': False,
-                'error': 'Google Sheets connection not available'
-            })
-        
-        # Get the IDP Scoring worksheet
-        idp_worksheet = spreadsheet.worksheet("IDP Scoring")
-        
-        # Get all values from the worksheet
-        all_values = idp_worksheet.get_all_values()
-        
-        # Convert to list of dictionaries (assuming first row is headers)
-        if all_values:
-            headers = all_values[0]
-            data = []
-            for row in all_values[1:]:
-                # Pad row to match header length
-                while len(row) < len(headers):
-                    row.append("")
-                data.append(dict(zip(headers, row)))
-            
-            return jsonify({
-                'success': True,
-                'data': data,
-                'headers': headers
-            })
-        else:
-            return jsonify({
-                'success': False,
-                'error': 'No data found in IDP Scoring worksheet'
-            })
-            
-    except gspread.exceptions.WorksheetNotFound:
-        return jsonify({
-            'success': False,
-            'error': 'IDP Scoring worksheet not found'
-        })
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': f'Error fetching IDP Scoring data: {str(e)}'
-        })
+    """IDP Scoring data from the Google Sheet (cached)"""
+    return json_response(idp_scoring.get(), request)
+
+# Socket.IO sid → key of the league the client connected to
+client_leagues = {}
+
+def _client_league():
+    return leagues.get(client_leagues.get(request.sid)) or leagues.default
 
 @socketio.on('connect')
-def handle_connect():
-    print('Client connected')
-    print(f'Sending initial data with timestamp: {latest_data.get("timestamp", "No timestamp")}')
-    
-    # If no data is available yet, trigger a fresh fetch
-    if not latest_data.get('timestamp'):
-        print('No data available, triggering fresh fetch...')
-        fetch_playoff_data()
-    
-    emit('data_update', latest_data)
+def handle_connect(auth=None):
+    auth = auth if isinstance(auth, dict) else {}
+    league = leagues.get(auth['league']) if auth.get('league') else leagues.default
+    if league is None:
+        raise ConnectionRefusedError(f"Unknown league '{auth['league']}'")
+    client_leagues[request.sid] = league.key
+    join_room(league_room(league))
+    print(f'Client connected ({league.key})')
+    print(f'Sending initial data with timestamp: {league.latest_data.get("timestamp", "No timestamp")}')
+    # Sectioned clients subscribe to the sections their open tab needs instead
+    sectioned = bool(auth.get('sections'))
+    if not sectioned:
+        join_room(full_data_room(league))
+
+    sync_from_store(league)
+    if league.latest_data.get('timestamp'):
+        if not sectioned:
+            emit('data_update', league.live_state.snapshot())
+        return
+
+    # No data yet: answer immediately and deliver the snapshot when the (single) refresh lands
+    print('No data available, waiting on background refresh...')
+    emit('status', {'state': 'warming'})
+    if refresh_leader_elsewhere():
+        # The leader's first broadcast reaches this client; a version mismatch makes it resync from us
+        return
+    sid = request.sid
+    league.refresher.trigger()
+    if not sectioned:
+        league.refresher.subscribe(lambda: socketio.emit('data_update', league.live_state.snapshot(), to=sid))
+
+@socketio.on('request_snapshot')
+def handle_request_snapshot():
+    """Full resync for a client whose version no longer matches the deltas"""
+    league = _client_league()
+    # The delta may have come from the leader (another worker) ahead of our follow poll
+    sync_from_store(league)
+    emit('data_update', league.live_state.snapshot())
+
+@socketio.on('subscribe')
+def handle_subscribe(payload):
+    """Join the rooms of the requested sections and send their current versions"""
+    league = _client_league()
+    names = [name for name in (payload or {}).get('sections', []) if isinstance(name, str)]
+    sync_from_store(league)
+    sections = {}
+    for name in names:
+        join_room(section_room(league, name))
+        version, value = league.live_state.section(name)
+        sections[name] = {'version': version, 'data': value}
+    emit('sections_update', {'sections': sections})
+
+@socketio.on('unsubscribe')
+def handle_unsubscribe(payload):
+    league = _client_league()
+    for name in (payload or {}).get('sections', []):
+        if isinstance(name, str):
+            leave_room(section_room(league, name))
 
 @socketio.on('disconnect')
 def handle_disconnect():
+    client_leagues.pop(request.sid, None)
     print('Client disconnected')
 
 if __name__ == '__main__':
-    # Initial data fetch before starting the server
+    # The first refresh runs in the background loop; clients get a "warming" status until it lands
     print("Starting application...")
-    fetch_playoff_data()
-    
-    # Start background update thread
-    update_thread = threading.Thread(target=background_update, daemon=True)
-    update_thread.start()
-    
+
     # Get port from environment variable (for cloud hosting) or default to 5004
-    import os
     port = int(os.environ.get('PORT', 5004))
     debug_mode = os.environ.get('DEBUG', 'False').lower() == 'true'
+
+    # Under the debug reloader only the child process serves requests, so only it refreshes
+    if not debug_mode or os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        start_background_tasks()
+    # SIGTERM (e.g. from the host on redeploy) exits through atexit, which releases the lease
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
     
-    # Run the app (allow_unsafe_werkzeug needed for Render deployment)
+    # Development server; production runs wsgi.py under gunicorn (see Procfile)
     socketio.run(app, debug=debug_mode, host='0.0.0.0', port=port, allow_unsafe_werkzeug=True)
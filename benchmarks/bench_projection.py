@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark: whole-league roster projections — scanning, indexed and batched.
+
+Builds a synthetic 32-team, 18-week league, then projects every roster for
+the final week three ways: by scanning each week's matchup list per starter
+(no index), through a ``MatchupIndex`` built up front (index build time
+included), and with the vectorized ``projection.batch.project_league``.
+Results are checked against the scanning path.
+
+    python benchmarks/bench_projection.py --teams 32 --weeks 18 --repeat 20
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from projection.batch import project_league as project_league_batch  # noqa: E402
+from projection.quantum_gauntlet import build_matchup_index, compute_roster_projection  # noqa: E402
+from sleeper.stub import build_synthetic_league  # noqa: E402
+
+
+def state_provider(pid):
+    return "IN_PROGRESS" if int(pid) % 2 else "NOT_STARTED"
+
+
+def project_league(matchups_by_week, roster_ids, week, mode):
+    current = matchups_by_week[week]
+    if mode == "batch":
+        totals = project_league_batch(
+            roster_ids,
+            week=week,
+            matchups_by_week=matchups_by_week,
+            current_week_matchups=current,
+            get_player_game_state=state_provider,
+        )
+        return [totals[rid] for rid in roster_ids]
+    index = build_matchup_index(matchups_by_week) if mode == "index" else None
+    return [
+        compute_roster_projection(
+            roster_id=rid,
+            week=week,
+            matchups_by_week=matchups_by_week,
+            current_week_matchups=current,
+            get_player_game_state=state_provider,
+            index=index,
+        ).projected_total
+        for rid in roster_ids
+    ]
+
+
+def bench(matchups_by_week, roster_ids, week, mode, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        totals = project_league(matchups_by_week, roster_ids, week, mode)
+        timings.append(time.perf_counter() - start)
+    return timings, totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--teams", type=int, default=32)
+    parser.add_argument("--weeks", type=int, default=18)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    league = build_synthetic_league(num_teams=args.teams, weeks=args.weeks, seed=args.teams)
+    roster_ids = [r["roster_id"] for r in league["rosters"]]
+    matchups_by_week = league["matchups"]
+
+    scan, scan_totals = bench(matchups_by_week, roster_ids, args.weeks, "scan", args.repeat)
+    indexed, index_totals = bench(matchups_by_week, roster_ids, args.weeks, "index", args.repeat)
+    batched, batch_totals = bench(matchups_by_week, roster_ids, args.weeks, "batch", args.repeat)
+    assert scan_totals == index_totals, "indexed projections diverged from the scanning path"
+    assert all(abs(a - b) <= 1e-9 for a, b in zip(scan_totals, batch_totals)), "batch projections diverged"
+
+    print(f"{args.teams} teams x {args.weeks} weeks, {len(roster_ids)} roster projections per pass")
+    for label, timings in (("scan ", scan), ("index", indexed), ("batch", batched)):
+        print(
+            f"  {label}: best {min(timings) * 1000:8.2f} ms  "
+            f"mean {sum(timings) / len(timings) * 1000:8.2f} ms  "
+            f"speedup {min(scan) / min(timings):.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
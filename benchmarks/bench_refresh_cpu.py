@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-refresh CPU time of ``fetch_playoff_data`` on synthetic leagues.
+
+Serves a synthetic 12-, 32- and 100-team league from the offline stub server,
+warms the week cache, then times with ``time.process_time``:
+- cold rebuilds (short-circuit, projection memo and forecasts reset), with the
+  number of roster projections each one computes
+- live ticks, where one starter's points change in the latest week and the
+  memo / incremental projection state carry over from the previous refresh
+
+    python benchmarks/bench_refresh_cpu.py --teams 12 32 100 --repeat 20
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app  # noqa: E402
+from dashboard.store import SQLiteStateStore  # noqa: E402
+from projection.memo import ProjectionMemo  # noqa: E402
+from sleeper.client import SleeperClient  # noqa: E402
+from sleeper.stub import SleeperStubServer, build_synthetic_league  # noqa: E402
+from sleeper.week_cache import WeekCache  # noqa: E402
+
+
+def _reset_projection_caches(league):
+    league.projection_memo = ProjectionMemo()
+    league.projection_states = {}
+
+
+def bench_league(num_teams, repeat):
+    league = build_synthetic_league(num_teams=num_teams, seed=num_teams)
+    # Pin the calendar so week 17 is the live (re-polled) week
+    latest_completed_week = app.season_calendar.latest_completed_week
+    app.season_calendar.latest_completed_week = lambda *a, **k: 16
+    with SleeperStubServer(league) as stub, tempfile.TemporaryDirectory() as tmp:
+        app.sleeper = SleeperClient(stub.base_url)
+        app.week_cache = WeekCache(os.path.join(tmp, "weeks.json"))
+        app.SNAPSHOT_PATH = os.path.join(tmp, "data_snapshot.json")
+        app.state_store = SQLiteStateStore(os.path.join(tmp, "dashboard_state.sqlite3"))
+        app.leagues = app.build_leagues([app.DEFAULT_LEAGUE])
+        dashboard = app.leagues.default
+        cold, live = [], []
+        projections = 0
+        with contextlib.redirect_stdout(io.StringIO()):
+            app.fetch_playoff_data()  # warm the week cache and connections
+            for cycle in range(repeat):
+                # Cold rebuild: no memoized projections or forecasts
+                _reset_projection_caches(dashboard)
+                dashboard.fingerprint = None
+                start = time.process_time()
+                app.fetch_playoff_data()
+                cold.append(time.process_time() - start)
+                projections = dashboard.projection_memo.stats["last"]["misses"]
+
+                # Live tick: one starter's points move in the latest week
+                row = league["matchups"][17][cycle % num_teams]
+                row["players_points"][row["starters"][0]] += 0.5
+                row["points"] += 0.5
+                start = time.process_time()
+                app.fetch_playoff_data()
+                live.append(time.process_time() - start)
+        app.sleeper.close()
+    app.season_calendar.latest_completed_week = latest_completed_week
+    return cold, live, projections
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--teams", type=int, nargs="+", default=[12, 32, 100])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    for num_teams in args.teams:
+        cold, live, projections = bench_league(num_teams, args.repeat)
+        print(
+            f"{num_teams:>4} teams: cold best {min(cold) * 1000:8.2f} ms CPU  "
+            f"mean {sum(cold) / len(cold) * 1000:8.2f} ms CPU  "
+            f"{projections:>4} roster projections  |  "
+            f"live tick best {min(live) * 1000:8.2f} ms CPU  "
+            f"mean {sum(live) / len(live) * 1000:8.2f} ms CPU"
+        )
+
+
+if __name__ == "__main__":
+    main()
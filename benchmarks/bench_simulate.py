@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Monte Carlo playoff odds with ``tournament.simulate``.
+
+Builds a synthetic league, freezes the weeks up to ``--from-week`` and runs
+``--trials`` sampled seasons through the vectorized bracket, reporting the
+time to build the score model, to sample the remaining weeks and to resolve
+the bracket, to evaluate and summarize the payouts, plus the end-to-end
+``simulate`` time with ``--workers``.
+
+    python benchmarks/bench_simulate.py --teams 12 --from-week 14 --trials 100000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sleeper.stub import build_synthetic_league  # noqa: E402
+from tournament.payouts import evaluate, summarize  # noqa: E402
+from tournament.simulate import build_score_model, resolve_outcomes, simulate  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--teams", type=int, default=12)
+    parser.add_argument("--from-week", type=int, default=14, help="latest completed week")
+    parser.add_argument("--trials", type=int, default=100_000)
+    parser.add_argument("--chunk", type=int, default=10_000)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    league = build_synthetic_league(num_teams=args.teams, seed=args.teams)
+    roster_ids = [r["roster_id"] for r in league["rosters"]]
+
+    start = time.perf_counter()
+    model = build_score_model(roster_ids, matchups_by_week=league["matchups"], latest_completed_week=args.from_week)
+    built = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scores = model.sample(args.chunk, np.random.default_rng(0))
+    sampled = time.perf_counter() - start
+    start = time.perf_counter()
+    outcomes = resolve_outcomes(scores)
+    resolved = time.perf_counter() - start
+    start = time.perf_counter()
+    summarize(evaluate(outcomes["events"]))
+    paid = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = simulate(model, trials=args.trials, chunk=args.chunk, seed=0, workers=args.workers)
+    total = time.perf_counter() - start
+
+    print(f"{args.teams} teams, weeks {args.from_week + 1}-17 sampled, {args.trials} trials, {args.workers} worker(s)")
+    print(f"  build model : {built * 1000:8.2f} ms")
+    print(f"  sample      : {sampled * 1000:8.2f} ms per {args.chunk} trials")
+    print(f"  bracket     : {resolved * 1000:8.2f} ms per {args.chunk} trials")
+    print(f"  payouts     : {paid * 1000:8.2f} ms per {args.chunk} trials")
+    print(f"  simulate    : {total * 1000:8.2f} ms ({args.trials / total:,.0f} trials/s)")
+    favourite = result.to_dict()["teams"][0]
+    print(f"  favourite   : roster {favourite['roster_id']} wins {favourite['champion']:.1%}")
+
+
+if __name__ == "__main__":
+    main()
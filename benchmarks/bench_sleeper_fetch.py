@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark: sequential vs pooled/parallel Sleeper matchup fetches.
+
+Runs entirely offline against ``sleeper.stub.SleeperStubServer`` with an
+injected per-request latency that stands in for the real round-trip time.
+"parallel" uses a fresh client per repeat, so every request is a full 200 and
+the speedup is concurrency alone; "conditional" reuses one warmed client, so
+every request is revalidated with a 304.
+
+    python benchmarks/bench_sleeper_fetch.py --latency 0.08 --workers 8
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sleeper.client import SleeperClient  # noqa: E402
+from sleeper.stub import SleeperStubServer, build_synthetic_league  # noqa: E402
+
+
+def run_sequential(base_url, league_id, weeks):
+    # Mirrors the pre-client code path: a fresh connection per requests.get
+    for wk in weeks:
+        resp = requests.get(f"{base_url}/league/{league_id}/matchups/{wk}")
+        resp.raise_for_status()
+        resp.json()
+
+
+def run_parallel(base_url, league_id, weeks, workers):
+    # Cold: no cached validators, so nothing is answered with a 304
+    client = SleeperClient(base_url, max_workers=workers)
+    try:
+        client.get_matchups_for_weeks(league_id, weeks)
+    finally:
+        client.close()
+
+
+def run_conditional(client, league_id, weeks):
+    client.get_matchups_for_weeks(league_id, weeks)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency", type=float, default=0.08, help="simulated seconds per request")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--teams", type=int, default=12)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    league = build_synthetic_league(num_teams=args.teams)
+    weeks = list(range(1, 18))
+    with SleeperStubServer(league, latency=args.latency) as stub:
+        warm = SleeperClient(stub.base_url, max_workers=args.workers)
+        warm.get_matchups_for_weeks(league["league_id"], weeks)
+        for label, fn in (
+            ("sequential", lambda: run_sequential(stub.base_url, league["league_id"], weeks)),
+            ("parallel", lambda: run_parallel(stub.base_url, league["league_id"], weeks, args.workers)),
+            ("conditional", lambda: run_conditional(warm, league["league_id"], weeks)),
+        ):
+            stub.reset_counters()
+            timings = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                fn()
+                timings.append(time.perf_counter() - start)
+            print(
+                f"{label:>11}: best {min(timings) * 1000:8.1f} ms  "
+                f"requests={stub.total_requests}  not_modified={stub.not_modified}  "
+                f"tcp_connections={stub.connections}"
+            )
+        warm.close()
+    print(f"(one round trip = {args.latency * 1000:.0f} ms, {len(weeks)} weeks)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Socket.IO connection capacity and broadcast latency of the
+production server (gunicorn + gevent worker, ``wsgi:create_app()``).
+
+Starts the offline Sleeper stub, launches gunicorn exactly as the Procfile
+does (plus a benchmark-only ``bench_broadcast`` event), then opens N raw
+Engine.IO websocket clients from gevent greenlets (at most ``--ramp``
+handshakes in flight) and reports:
+- how many clients connected, and connect latency percentiles
+- per broadcast of the full dashboard document to every client, the delivery
+  latency percentiles and the time until the last client had it
+
+    python benchmarks/bench_socketio_load.py --clients 1000 --broadcasts 10
+
+Clients and server share the machine, so on few cores the numbers include the
+load generator's own CPU time.
+"""
+
+from gevent import monkey
+
+monkey.patch_all()
+
+import argparse  # noqa: E402
+import json  # noqa: E402
+import os  # noqa: E402
+import resource  # noqa: E402
+import socket  # noqa: E402
+import subprocess  # noqa: E402
+import sys  # noqa: E402
+import tempfile  # noqa: E402
+import time  # noqa: E402
+
+import gevent  # noqa: E402
+from gevent.lock import BoundedSemaphore  # noqa: E402
+import requests  # noqa: E402
+from wsproto import ConnectionType, WSConnection  # noqa: E402
+from wsproto.events import CloseConnection, Message, Ping, Request, TextMessage  # noqa: E402
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from sleeper.stub import SleeperStubServer, build_synthetic_league  # noqa: E402
+
+
+def serve():
+    """gunicorn app factory: the production app pointed at the stub, plus ``bench_broadcast``."""
+    import wsgi  # monkey-patches and selects gevent before importing the app
+    from sleeper.client import SleeperClient
+
+    dashboard = wsgi.dashboard
+    dashboard.sleeper = SleeperClient(os.environ["BENCH_SLEEPER_URL"])
+
+    @dashboard.socketio.on("bench_broadcast")
+    def bench_broadcast():
+        dashboard.socketio.emit(
+            "bench_broadcast",
+            {"sent": time.time(), "data": dashboard.leagues.default.latest_data},
+            to=dashboard.full_data_room(dashboard.leagues.default),
+        )
+
+    return wsgi.create_app()
+
+
+def _percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class LoadClient:
+    """
+    Minimal Engine.IO v4 / Socket.IO v5 websocket client for the legacy (full
+    data) room: one greenlet and one socket, no reader threads.
+    """
+
+    def __init__(self, host, port, handshakes):
+        self.host = host
+        self.port = port
+        self.handshakes = handshakes
+        self.sock = None
+        self.ws = WSConnection(ConnectionType.CLIENT)
+        self.connect_time = None
+        self.closed = False
+        self.deliveries = {}  # broadcast "sent" timestamp → receive latency
+        self.error = None
+
+    def run(self):
+        self.handshakes.acquire()
+        start = time.perf_counter()
+        try:
+            self.sock = socket.create_connection((self.host, self.port), timeout=60)
+            self.sock.settimeout(None)
+            self._send(Request(host=f"{self.host}:{self.port}", target="/socket.io/?EIO=4&transport=websocket"))
+            text = []
+            while not self.closed:
+                data = self.sock.recv(65536)
+                if not data:
+                    break
+                self.ws.receive_data(data)
+                for event in self.ws.events():
+                    if isinstance(event, TextMessage):
+                        text.append(event.data)
+                        if event.message_finished:
+                            self._on_packet("".join(text), start)
+                            text = []
+                    elif isinstance(event, Ping):
+                        self._send(event.response())
+                    elif isinstance(event, CloseConnection):
+                        self.closed = True
+        except Exception as e:
+            if not self.closed:
+                self.error = e
+        finally:
+            self.closed = True
+            if self.connect_time is None:
+                self.handshakes.release()
+
+    def _on_packet(self, packet, start):
+        if packet.startswith("0"):  # Engine.IO open → Socket.IO connect to "/"
+            self._send(Message(data="40"))
+        elif packet.startswith("40"):
+            self.connect_time = time.perf_counter() - start
+            self.handshakes.release()
+        elif packet == "2":  # Engine.IO ping
+            self._send(Message(data="3"))
+        elif packet.startswith("42"):
+            event, *args = json.loads(packet[2:])
+            if event == "bench_broadcast":
+                sent = args[0]["sent"]
+                self.deliveries[sent] = time.time() - sent
+
+    def _send(self, event):
+        self.sock.sendall(self.ws.send(event))
+
+    @property
+    def connected(self):
+        return self.connect_time is not None and not self.closed
+
+    def emit(self, event):
+        self._send(Message(data="42" + json.dumps([event])))
+
+    def close(self):
+        if self.sock is not None and not self.closed:
+            self.closed = True
+            self.sock.close()
+
+
+def _wait_ready(base_url, timeout=60):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            if requests.get(f"{base_url}/api/data", timeout=2).json().get("timestamp"):
+                return True
+        except (requests.RequestException, ValueError):
+            pass
+        time.sleep(0.25)
+    return False
+
+
+def bench(num_clients, broadcasts, teams, ramp, worker_connections):
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (max(soft, min(hard, num_clients * 2 + 256)), hard))
+
+    league = build_synthetic_league(num_teams=teams, seed=teams)
+    port = _free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    with SleeperStubServer(league) as stub, tempfile.TemporaryDirectory() as tmp:
+        env = dict(
+            os.environ,
+            BENCH_SLEEPER_URL=stub.base_url,
+            DATA_SNAPSHOT_PATH=os.path.join(tmp, "data_snapshot.json"),
+            SLEEPER_CACHE_DIR=tmp,
+        )
+        log_path = os.path.join(tmp, "server.log")
+        with open(log_path, "w") as log:
+            server = subprocess.Popen(
+                [
+                    sys.executable, "-m", "gunicorn", "-k", "gevent", "-w", "1",
+                    "--worker-connections", str(worker_connections),
+                    "--bind", f"127.0.0.1:{port}", "--pythonpath", f"{ROOT},{os.path.join(ROOT, 'benchmarks')}",
+                    "bench_socketio_load:serve()",
+                ],
+                cwd=ROOT, env=env, stdout=log, stderr=subprocess.STDOUT,
+            )
+        try:
+            if not _wait_ready(base_url):
+                with open(log_path) as log:
+                    print(log.read()[-4000:])
+                raise RuntimeError("server did not finish its first refresh")
+            payload_kb = len(requests.get(f"{base_url}/api/data").content) / 1024
+
+            handshakes = BoundedSemaphore(ramp)
+            clients = [LoadClient("127.0.0.1", port, handshakes) for _ in range(num_clients)]
+            start = time.perf_counter()
+            greenlets = [gevent.spawn(client.run) for client in clients]
+            deadline = time.time() + 60
+            while time.time() < deadline and sum(
+                c.connect_time is not None or c.error is not None for c in clients
+            ) < num_clients:
+                gevent.sleep(0.05)
+            connect_wall = time.perf_counter() - start
+            connected = [c for c in clients if c.connect_time is not None]
+            connect_times = [c.connect_time for c in connected]
+            print(
+                f"connected {len(connected)}/{num_clients} clients in {connect_wall:6.2f} s  "
+                f"connect p50 {_percentile(connect_times, 50) * 1000:7.1f} ms  "
+                f"p95 {_percentile(connect_times, 95) * 1000:7.1f} ms  "
+                f"max {max(connect_times) * 1000:7.1f} ms"
+            )
+            errors = [c.error for c in clients if c.error is not None]
+            if errors:
+                print(f"  {len(errors)} client errors, first: {errors[0]!r}")
+
+            for round_no in range(broadcasts):
+                connected = [c for c in connected if c.connected]
+                before = {id(c): len(c.deliveries) for c in connected}
+                connected[0].emit("bench_broadcast")
+                deadline = time.time() + 30
+                while time.time() < deadline and any(len(c.deliveries) == before[id(c)] for c in connected):
+                    gevent.sleep(0.01)
+                latencies = [
+                    list(c.deliveries.values())[-1] for c in connected if len(c.deliveries) > before[id(c)]
+                ]
+                print(
+                    f"broadcast {round_no + 1:>2} ({payload_kb:5.1f} KB): delivered {len(latencies)}/{len(connected)}  "
+                    f"p50 {_percentile(latencies, 50) * 1000:7.1f} ms  "
+                    f"p95 {_percentile(latencies, 95) * 1000:7.1f} ms  "
+                    f"last {max(latencies) * 1000:7.1f} ms"
+                )
+                gevent.sleep(0.5)
+
+            for client in clients:
+                client.close()
+            gevent.joinall(greenlets, timeout=10)
+        finally:
+            server.terminate()
+            try:
+                server.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                server.kill()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument("--broadcasts", type=int, default=10)
+    parser.add_argument("--teams", type=int, default=12)
+    parser.add_argument("--ramp", type=int, default=50, help="concurrent handshakes")
+    parser.add_argument("--worker-connections", type=int, default=2000, help="as in the Procfile")
+    args = parser.parse_args()
+    bench(args.clients, args.broadcasts, args.teams, args.ramp, args.worker_connections)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Live dashboard state and delivery package for Quantum Gauntlet"""
@@ -0,0 +1,117 @@
+"""
+IDP Scoring Cache
+-----------------
+
+Serves the "IDP Scoring" Google Sheet without a Sheets round trip per view:
+- ``build_idp_payload`` reads the worksheet once and shapes the rows into the
+  ``{success, data, headers}`` payload the dashboard expects
+- ``IdpScoringCache`` keeps that payload pre-serialized (``EncodedDocument``)
+  for ``ttl`` seconds; after that the stale copy is still served while a
+  single background reload runs (stale-while-revalidate)
+- Reloads go through a ``RefreshCoordinator``, so a burst of cold requests
+  triggers one Sheets read, and a failed reload never replaces good data
+
+Public API:
+  - IdpScoringCache
+  - build_idp_payload
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+import gspread
+
+from dashboard.refresh import RefreshCoordinator
+from dashboard.responses import EncodedDocument, encode_document
+
+WORKSHEET_NAME = "IDP Scoring"
+
+
+def build_idp_payload(spreadsheet: Any) -> Dict[str, Any]:
+    """Fetch IDP Scoring data from the Google Sheet (one ``get_all_values`` call)."""
+    try:
+        # Check if spreadsheet connection is available
+        if spreadsheet is None:
+            return {"success": False, "error": "Google Sheets connection not available"}
+
+        all_values = spreadsheet.worksheet(WORKSHEET_NAME).get_all_values()
+
+        # Convert to list of dictionaries (assuming first row is headers)
+        if not all_values:
+            return {"success": False, "error": "No data found in IDP Scoring worksheet"}
+        headers = all_values[0]
+        data = []
+        for row in all_values[1:]:
+            # Pad row to match header length
+            row = list(row) + [""] * (len(headers) - len(row))
+            data.append(dict(zip(headers, row)))
+        return {"success": True, "data": data, "headers": headers}
+
+    except gspread.exceptions.WorksheetNotFound:
+        return {"success": False, "error": "IDP Scoring worksheet not found"}
+    except Exception as e:
+        return {"success": False, "error": f"Error fetching IDP Scoring data: {str(e)}"}
+
+
+class IdpScoringCache:
+    """TTL cache with stale-while-revalidate around a payload loader."""
+
+    def __init__(
+        self,
+        load: Callable[[], Dict[str, Any]],
+        *,
+        ttl: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+        spawn: Optional[Callable[[Callable[[], None]], object]] = None,
+    ) -> None:
+        self._load = load
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._doc: Optional[EncodedDocument] = None
+        self._loaded_at: Optional[float] = None
+        self._reloads = RefreshCoordinator(self._reload, spawn=spawn)
+        self.stats = {"fresh": 0, "stale": 0, "cold": 0, "loads": 0, "failed_loads": 0}
+
+    def get(self) -> EncodedDocument:
+        """The cached document; only a cold cache makes the caller wait for Sheets."""
+        with self._lock:
+            doc, loaded_at = self._doc, self._loaded_at
+            if doc is not None and self._clock() - loaded_at < self.ttl:
+                self.stats["fresh"] += 1
+                return doc
+            self.stats["stale" if doc is not None else "cold"] += 1
+        if doc is not None:
+            self._reloads.trigger()
+            return doc
+        # Cold: concurrent callers join the same load
+        self._reloads.run()
+        with self._lock:
+            if self._doc is not None:
+                return self._doc
+        return encode_document({"success": False, "error": "IDP Scoring data unavailable"})
+
+    def refresh_if_stale(self) -> bool:
+        """Background refresher hook: start a reload once the TTL has passed."""
+        with self._lock:
+            due = self._doc is None or self._clock() - self._loaded_at >= self.ttl
+        return due and self._reloads.trigger()
+
+    def _reload(self) -> None:
+        payload = self._load()
+        with self._lock:
+            self.stats["loads"] += 1
+            keep_previous = (
+                not payload.get("success")
+                and self._doc is not None
+                and self._doc.source.get("success")
+            )
+            if keep_previous:
+                # Serve the last good sheet until Sheets recovers, and retry after another TTL
+                self.stats["failed_loads"] += 1
+            else:
+                self._doc = encode_document(payload)
+            self._loaded_at = self._clock()
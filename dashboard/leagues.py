@@ -0,0 +1,236 @@
+"""
+League Registry and Refresh Scheduler
+-------------------------------------
+
+Hosts the dashboards of several leagues from one process:
+- ``LeagueConfig`` names a league by ``league_id``, or by ``username`` /
+  ``season`` / ``league_name`` (resolved once through the week cache, which
+  persists the answer, so the user → leagues lookup is not repeated)
+- ``League`` holds one league's dashboard state: versioned data, refresh
+  fingerprint and counters, projection memo, incremental state and starter
+  breakdowns, odds simulation inputs, encoded documents and its own
+  single-flight refresher (plus one for the odds, built in the background
+  after each refresh rather than on request)
+- ``LeagueRegistry`` finds leagues by key or by (resolved) league_id; the first
+  league added is the default one behind the un-namespaced routes and rooms
+- ``LeagueScheduler`` spreads the leagues' refreshes over the poll interval
+  (league i first runs at i/n of it) and runs whichever are due; the shared
+  Sleeper ``RequestBudget`` caps their combined request rate. With a
+  ``PollPolicy`` each league's next refresh follows the NFL game clock and
+  backs off after failed refreshes instead of a fixed interval
+- ``load_league_configs`` reads ``LEAGUES_FILE``, a JSON list of configs
+
+Public API:
+  - League
+  - LeagueConfig
+  - LeagueRegistry
+  - LeagueScheduler
+  - load_league_configs
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from dashboard.refresh import RefreshCoordinator
+from dashboard.responses import DocumentCache
+from dashboard.state import VersionedState
+from projection.breakdowns import BreakdownStore
+from projection.memo import ProjectionMemo
+
+
+@dataclass(frozen=True)
+class LeagueConfig:
+    key: str  # URL / room namespace, e.g. "default" or the league_id
+    league_id: Optional[str] = None
+    username: Optional[str] = None
+    season: str = "2025"
+    league_name: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, entry: Dict[str, Any]) -> "LeagueConfig":
+        league_id = entry.get("league_id")
+        key = entry.get("key") or league_id
+        if not key:
+            raise ValueError(f"League entry needs a 'key' or 'league_id': {entry}")
+        if not league_id and not (entry.get("username") and entry.get("league_name")):
+            raise ValueError(f"League '{key}' needs 'league_id' or 'username' and 'league_name'")
+        return cls(
+            key=str(key),
+            league_id=str(league_id) if league_id else None,
+            username=entry.get("username"),
+            season=str(entry.get("season", "2025")),
+            league_name=entry.get("league_name"),
+        )
+
+
+def load_league_configs(path: Optional[str], *, default: LeagueConfig) -> List[LeagueConfig]:
+    """The configured leagues, or just ``default`` when no ``path`` is given."""
+    if not path:
+        return [default]
+    with open(path, "r", encoding="utf-8") as fh:
+        entries = json.load(fh)
+    configs = [LeagueConfig.from_dict(entry) for entry in entries]
+    if len({c.key for c in configs}) != len(configs):
+        raise ValueError(f"Duplicate league keys in {path}")
+    return configs or [default]
+
+
+class League:
+    """One league's dashboard state and refresher."""
+
+    def __init__(
+        self,
+        config: LeagueConfig,
+        data: Dict[str, Any],
+        *,
+        refresh: Callable[["League"], None],
+        build_odds: Optional[Callable[["League"], None]] = None,
+        snapshot_path: Optional[str] = None,
+        spawn: Optional[Callable[[Callable[[], None]], object]] = None,
+    ) -> None:
+        self.config = config
+        self.key = config.key
+        self.league_id = config.league_id
+        self.latest_data = data
+        # Versioned copy of latest_data; refreshes broadcast per-section deltas against it
+        self.live_state = VersionedState(data)
+        # Only the default league backs data_snapshot.json
+        self.snapshot_path = snapshot_path
+        # Refresh cycle counters: full rebuilds vs. cycles skipped because Sleeper returned identical data
+        self.refresh_stats = {"full_cycles": 0, "skipped_cycles": 0}
+        self.fingerprint: Optional[str] = None
+        # Roster projections reused across refreshes while their inputs are unchanged
+        self.projection_memo = ProjectionMemo()
+        # week → (lookback digests, IncrementalProjection)
+        self.projection_states: Dict[int, Any] = {}
+        # Starter breakdowns of the last full refresh and their encoded documents, per (roster_id, week)
+        self.projection_breakdowns = BreakdownStore()
+        self.breakdown_documents: Dict[Any, DocumentCache] = {}
+        # latest_data / per-section documents, encoded once per version
+        self.data_documents = DocumentCache()
+        self.section_documents: Dict[str, DocumentCache] = {}
+        # (version, score model, team names) of the last full refresh (None until then) and the encoded odds
+        self.odds_inputs: Optional[Tuple[int, Any, Dict[int, str]]] = None
+        self.team_names: Dict[int, str] = {}
+        self.odds_documents = DocumentCache()
+        self.odds_builder = RefreshCoordinator(lambda: build_odds(self), spawn=spawn) if build_odds else None
+        # At most one refresh of this league runs at a time
+        self.refresher = RefreshCoordinator(lambda: refresh(self), spawn=spawn)
+
+    def resolve(self, client, week_cache) -> Optional[str]:
+        """The league_id, looked up (and cached on disk) from the username/name on first use."""
+        if self.league_id is None:
+            c = self.config
+            self.league_id = week_cache.resolve_league_id(client, c.username, c.season, c.league_name)
+        return self.league_id
+
+
+class LeagueRegistry:
+    """Leagues by key; also found by league_id once it is known."""
+
+    def __init__(self, leagues: Iterable[League] = ()) -> None:
+        self._leagues: Dict[str, League] = {}
+        for league in leagues:
+            self.add(league)
+
+    def add(self, league: League) -> League:
+        if league.key in self._leagues:
+            raise ValueError(f"League '{league.key}' is already registered")
+        self._leagues[league.key] = league
+        return league
+
+    @property
+    def default(self) -> League:
+        return next(iter(self._leagues.values()))
+
+    def get(self, key: Optional[str]) -> Optional[League]:
+        if key is None:
+            return None
+        league = self._leagues.get(key)
+        if league is None:
+            league = next((L for L in self._leagues.values() if L.league_id == key), None)
+        return league
+
+    def __iter__(self) -> Iterator[League]:
+        return iter(list(self._leagues.values()))
+
+    def __len__(self) -> int:
+        return len(self._leagues)
+
+
+class LeagueScheduler:
+    """
+    Staggered per-league refresh times over one poll ``interval``; with a
+    ``policy`` (``dashboard.polling.PollPolicy``) the delay after each refresh
+    comes from it, given the league's consecutive failed refreshes.
+    """
+
+    def __init__(
+        self,
+        *,
+        interval: float = 60.0,
+        policy: Optional[Any] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.interval = interval
+        self.policy = policy
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._due: Dict[str, float] = {}
+        self._failures: Dict[str, int] = {}
+        self.stats = {"runs": 0, "late": 0, "errors": 0}
+
+    def due_in(self, key: str) -> Optional[float]:
+        """Seconds until ``key`` refreshes; None if it is not scheduled (or polling has stopped)."""
+        with self._lock:
+            due = self._due.get(key)
+        return None if due is None or due == math.inf else max(0.0, due - self._clock())
+
+    def _delay_after(self, league: League) -> float:
+        failed = getattr(league.refresher, "last_error", None) is not None
+        failures = self._failures[league.key] = self._failures.get(league.key, 0) + 1 if failed else 0
+        if failed:
+            self.stats["errors"] += 1
+        if self.policy is None:
+            return self.interval
+        delay = self.policy.next_delay(failures)
+        return math.inf if delay is None else delay
+
+    def run_due(self, leagues: Iterable[League]) -> float:
+        """Refresh every league that is due; returns the seconds until the next one is (inf: none is)."""
+        leagues = list(leagues)
+        now = self._clock()
+        with self._lock:
+            known = {league.key for league in leagues}
+            for key in [k for k in self._due if k not in known]:
+                del self._due[key]
+                self._failures.pop(key, None)
+            new = [league for league in leagues if league.key not in self._due]
+            for idx, league in enumerate(new):
+                # Spread first runs evenly so leagues never poll Sleeper in lockstep
+                self._due[league.key] = now + idx * self.interval / len(new)
+            due = sorted((self._due[league.key], league.key, league) for league in leagues)
+        for due_at, key, league in due:
+            if due_at > now:
+                break
+            league.refresher.run()
+            finished = self._clock()
+            with self._lock:
+                self.stats["runs"] += 1
+                delay = self._delay_after(league)
+                # Fixed intervals keep their cadence; policy delays count from the refresh's end
+                next_due = due_at + delay if self.policy is None else finished + delay
+                if next_due <= finished:
+                    # Overran a whole interval (e.g. waiting on the request budget): restart from now
+                    self.stats["late"] += 1
+                    next_due = finished
+                self._due[key] = next_due
+        with self._lock:
+            upcoming = min((self._due[league.key] for league in leagues), default=now + self.interval)
+        return max(0.0, upcoming - self._clock())
@@ -0,0 +1,128 @@
+"""
+Adaptive Poll Policy
+--------------------
+
+Decides how long to wait before polling Sleeper again, from the NFL calendar:
+- ``live`` seconds (default 20) while a game window is in progress
+  (``season.current_game_window``)
+- ``idle`` seconds (default 300) between windows, shortened so the first poll
+  of the next window is not late. Finished weeks are frozen in the week cache
+  and never re-polled, but between windows the first unfrozen week still
+  changes: stat corrections land until it is finalized on Tuesday, and from
+  then on managers set its successor's lineups, whose starters drive the
+  projections and the odds model. Only that live week is polled
+- no polling once every week of the season is complete (frozen): the data can
+  no longer change
+- after failed refreshes, an exponential backoff from ``live`` up to
+  ``max_backoff``, jittered so several leagues/workers do not retry in
+  lockstep; it only ever lengthens the wait
+- ``predict_polls`` / ``describe`` replay the policy over a period to report
+  the expected polls per day
+
+The clock is injected (``now`` returns an aware datetime), so the policy is
+tested by replaying any moment of the season.
+
+Public API:
+  - PollPolicy
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Optional
+
+from sleeper import season
+
+
+class PollPolicy:
+    """Seconds until the next Sleeper poll of a league, or None to stop polling."""
+
+    def __init__(
+        self,
+        *,
+        live: float = 20.0,
+        idle: float = 300.0,
+        max_backoff: float = 600.0,
+        jitter: float = 0.5,
+        now: Callable[[], datetime] = lambda: datetime.now(season.CENTRAL_TZ),
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        if not 0 < live <= idle:
+            raise ValueError("expected 0 < live <= idle")
+        self.live = live
+        self.idle = idle
+        self.max_backoff = max_backoff
+        # Fraction of the backoff that is randomized ("equal jitter" at 0.5)
+        self.jitter = jitter
+        self._now = now
+        self._rng = rng or random.Random()
+
+    def mode(self, now: Optional[datetime] = None) -> str:
+        """``live`` in game windows, ``frozen`` once every week is final, else ``idle`` (corrections, lineups)."""
+        now = now or self._now()
+        if season.latest_completed_week(now) >= season.LAST_WEEK:
+            return "frozen"
+        return "live" if season.current_game_window(now) else "idle"
+
+    def interval(self, now: Optional[datetime] = None) -> Optional[float]:
+        """Seconds until the next poll after a successful one; None once the season is frozen."""
+        now = now or self._now()
+        mode = self.mode(now)
+        if mode == "frozen":
+            return None
+        if mode == "live":
+            return self.live
+        upcoming = season.next_game_window(now)
+        if upcoming is None:
+            return self.idle
+        # Wake up for the window's first poll, but never spin faster than live polling
+        return max(self.live, min(self.idle, (upcoming[0] - now).total_seconds()))
+
+    def backoff(self, failures: int) -> float:
+        """Jittered wait after ``failures`` consecutive failed polls (>= 1)."""
+        ceiling = min(self.max_backoff, self.live * 2 ** (failures - 1))
+        return ceiling * (1 - self.jitter) + self._rng.uniform(0, ceiling * self.jitter)
+
+    def next_delay(self, failures: int = 0, now: Optional[datetime] = None) -> Optional[float]:
+        """Delay after a refresh that was preceded by ``failures`` consecutive failures."""
+        delay = self.interval(now)
+        if failures <= 0:
+            return delay
+        # Failed: keep retrying even when frozen (there may be no good data yet)
+        return max(delay or 0.0, self.backoff(failures))
+
+    def predict_polls(self, start: datetime, end: datetime) -> int:
+        """Successful polls the policy would make between ``start`` and ``end``."""
+        polls, moment = 0, start
+        while moment < end:
+            mode = self.mode(moment)
+            if mode == "frozen":
+                break
+            # Count a whole stretch at once: live polls to the window's end, idle polls to the next window
+            if mode == "live":
+                stop, step = min(end, season.current_game_window(moment)[1]), self.live
+            else:
+                upcoming = season.next_game_window(moment)
+                if upcoming is None:  # after the last game: poll idly until the season freezes
+                    polls += 1
+                    moment += timedelta(seconds=self.idle)
+                    continue
+                stop, step = min(end, upcoming[0]), self.idle
+            count = max(1, math.ceil((stop - moment).total_seconds() / step))
+            polls += count
+            # Idle waits are shortened to land on the window's start
+            moment = stop if mode == "idle" and stop < end else moment + timedelta(seconds=count * step)
+        return polls
+
+    def describe(self, now: Optional[datetime] = None, days: int = 7) -> Dict[str, Any]:
+        """Current mode and interval, with the predicted polls per league per day."""
+        now = now or self._now()
+        today = season.CENTRAL_TZ.localize(datetime.combine(now.astimezone(season.CENTRAL_TZ).date(), datetime.min.time()))
+        return {
+            "mode": self.mode(now),
+            "interval": self.interval(now),
+            "predicted_polls_today": self.predict_polls(today, today + timedelta(days=1)),
+            "predicted_polls_per_day": round(self.predict_polls(now, now + timedelta(days=days)) / days, 1),
+        }
@@ -0,0 +1,137 @@
+"""
+Single-Flight Refresh Coordinator
+---------------------------------
+
+Serializes dashboard refreshes so at most one Sleeper crawl runs at a time:
+- ``trigger()`` starts a refresh in the background unless one is already in
+  flight, and never blocks the caller (used by Socket.IO connect handlers)
+- ``run()`` refreshes in the calling thread, or joins the in-flight refresh
+  instead of starting a second one (used by the periodic updater)
+- ``subscribe(callback)`` runs a callback once the in-flight refresh completes,
+  or immediately when idle, so early clients get data as soon as it exists
+- ``offload(fn)`` runs CPU-bound work (the odds simulation) in a native thread
+  of gevent's threadpool when the standard library is monkey-patched, so a
+  gevent worker keeps serving sockets meanwhile; elsewhere it calls ``fn``
+  directly (background tasks are already real threads)
+
+Public API:
+  - RefreshCoordinator
+  - offload
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import traceback
+from typing import Callable, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+def _spawn_thread(target: Callable[[], None]) -> None:
+    threading.Thread(target=target, daemon=True, name="refresh").start()
+
+
+def offload(fn: Callable[[], T]) -> T:
+    """``fn()``, computed off the gevent event loop when gevent is active; the caller yields while it runs."""
+    if "gevent" in sys.modules:
+        from gevent import monkey
+
+        if monkey.is_module_patched("threading"):
+            import gevent
+
+            return gevent.get_hub().threadpool.apply(fn)
+    return fn()
+
+
+class RefreshCoordinator:
+    """Runs ``refresh`` at most once at a time and notifies waiters on completion."""
+
+    def __init__(
+        self,
+        refresh: Callable[[], None],
+        *,
+        spawn: Optional[Callable[[Callable[[], None]], object]] = None,
+    ) -> None:
+        self._refresh = refresh
+        # How background refreshes are started, e.g. ``socketio.start_background_task``
+        self._spawn = spawn or _spawn_thread
+        self._cond = threading.Condition()
+        self._running = False
+        self._completed = 0
+        self._subscribers: List[Callable[[], None]] = []
+        self.last_error: Optional[BaseException] = None
+        self.stats = {"runs": 0, "joined": 0, "errors": 0}
+
+    @property
+    def running(self) -> bool:
+        with self._cond:
+            return self._running
+
+    def trigger(self) -> bool:
+        """Start a background refresh; returns False when one was already in flight."""
+        with self._cond:
+            if self._running:
+                self.stats["joined"] += 1
+                return False
+            self._running = True
+        self._spawn(self._execute)
+        return True
+
+    def run(self, timeout: Optional[float] = None) -> bool:
+        """
+        Refresh in the calling thread, or wait for the in-flight refresh.
+        Returns False only if ``timeout`` expired while waiting.
+        """
+        with self._cond:
+            if self._running:
+                self.stats["joined"] += 1
+                target = self._completed + 1
+                return self._cond.wait_for(lambda: self._completed >= target, timeout)
+            self._running = True
+        self._execute()
+        return True
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the in-flight refresh (if any) completes."""
+        with self._cond:
+            if not self._running:
+                return True
+            target = self._completed + 1
+            return self._cond.wait_for(lambda: self._completed >= target, timeout)
+
+    def subscribe(self, callback: Callable[[], None]) -> None:
+        """Call ``callback`` after the in-flight refresh completes, or right away when idle."""
+        with self._cond:
+            if self._running:
+                self._subscribers.append(callback)
+                return
+        callback()
+
+    def _execute(self) -> None:
+        error: Optional[BaseException] = None
+        try:
+            self._refresh()
+        except Exception as exc:
+            error = exc
+            traceback.print_exc()
+        # Notify subscribers before completing, so waiters see their deliveries done;
+        # callbacks that subscribe meanwhile are drained in the same pass
+        while True:
+            with self._cond:
+                subscribers, self._subscribers = self._subscribers, []
+                if not subscribers:
+                    self._running = False
+                    self._completed += 1
+                    self.stats["runs"] += 1
+                    if error is not None:
+                        self.stats["errors"] += 1
+                    self.last_error = error
+                    self._cond.notify_all()
+                    return
+            for callback in subscribers:
+                try:
+                    callback()
+                except Exception:
+                    traceback.print_exc()
@@ -0,0 +1,160 @@
+"""
+Precomputed JSON Responses
+--------------------------
+
+Serializes a dashboard document once per data version and serves it cheaply:
+- ``EncodedDocument`` holds the JSON body plus gzip (and brotli, when the
+  optional ``brotli`` package is installed) bodies and a strong content ETag
+- ``DocumentCache`` re-encodes only when handed a different data object (or a
+  different version key), so repeated polls of unchanged data never touch
+  ``json.dumps`` or zlib; ``get_or_build`` also defers computing the document
+  until a new version is first asked for, and ``peek`` returns whatever was
+  built last without building anything
+- ``json_response`` negotiates Content-Encoding and answers ``If-None-Match``
+  with 304 Not Modified
+
+Public API:
+  - DocumentCache
+  - EncodedDocument
+  - encode_document
+  - json_response
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from flask import Request, Response
+
+try:  # optional: br is preferred by browsers when available
+    import brotli
+except ImportError:  # pragma: no cover - exercised only without brotli installed
+    brotli = None
+
+
+@dataclass
+class EncodedDocument:
+    source: Any
+    etag: str
+    bodies: Dict[str, bytes]  # content-coding ("identity", "gzip", "br") → body
+
+    def representation_etag(self, coding: str) -> str:
+        # Each content-coding is its own representation, so strong ETags must differ
+        return self.etag if coding == "identity" else f'{self.etag[:-1]}-{coding}"'
+
+
+def encode_document(data: Any) -> EncodedDocument:
+    """Serialize like Flask's ``jsonify`` (compact, sorted keys) and compress once."""
+    body = (json.dumps(data, separators=(",", ":"), sort_keys=True) + "\n").encode("utf-8")
+    etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+    bodies = {"identity": body, "gzip": gzip.compress(body, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        bodies["br"] = brotli.compress(body)
+    return EncodedDocument(source=data, etag=etag, bodies=bodies)
+
+
+class DocumentCache:
+    """Latest ``EncodedDocument``, rebuilt only when the data object changes."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._doc: Optional[EncodedDocument] = None
+        self._key: Optional[Hashable] = None
+        self.stats = {"encodes": 0, "hits": 0}
+
+    def get(self, data: Any, *, key: Optional[Hashable] = None) -> EncodedDocument:
+        """
+        Encoded ``data``, reused while ``key`` (a version) is unchanged, or without
+        a key while the very same data object is passed.
+        """
+        with self._lock:
+            if self._doc is not None and (
+                self._key == key if key is not None else self._key is None and self._doc.source is data
+            ):
+                self.stats["hits"] += 1
+                return self._doc
+            # Refreshes replace the data object wholesale, so identity marks a new version
+            self._doc = encode_document(data)
+            self._key = key
+            self.stats["encodes"] += 1
+            return self._doc
+
+    @property
+    def key(self) -> Optional[Hashable]:
+        with self._lock:
+            return self._key
+
+    def peek(self) -> Optional[EncodedDocument]:
+        """The last encoded document (of any key), or None before the first."""
+        with self._lock:
+            if self._doc is not None:
+                self.stats["hits"] += 1
+            return self._doc
+
+    def get_or_build(self, key: Hashable, build: Callable[[], Any]) -> EncodedDocument:
+        """Encoded ``build()``, called only when ``key`` changed; concurrent callers share one build."""
+        with self._lock:
+            if self._doc is not None and self._key == key:
+                self.stats["hits"] += 1
+                return self._doc
+            self._doc = encode_document(build())
+            self._key = key
+            self.stats["encodes"] += 1
+            return self._doc
+
+
+def _preferred_coding(accept_encoding: str, available) -> str:
+    offered = {}
+    for part in (accept_encoding or "").split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        offered[coding] = q
+    for coding in ("br", "gzip"):
+        if coding in available and offered.get(coding, offered.get("*", 0.0)) > 0:
+            return coding
+    return "identity"
+
+
+def _etag_matches(if_none_match: str, doc: EncodedDocument) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    known = {doc.representation_etag(coding) for coding in doc.bodies}
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate in known:
+            return True
+    return False
+
+
+def json_response(doc: EncodedDocument, request: Request) -> Response:
+    """200 with the best precomputed encoding, or 304 when the client's ETag is current."""
+    coding = _preferred_coding(request.headers.get("Accept-Encoding", ""), doc.bodies)
+    headers = {
+        "ETag": doc.representation_etag(coding),
+        "Vary": "Accept-Encoding",
+        "Cache-Control": "no-cache",
+    }
+    if _etag_matches(request.headers.get("If-None-Match", ""), doc):
+        return Response(status=304, headers=headers)
+    response = Response(doc.bodies[coding], status=200, mimetype="application/json", headers=headers)
+    if coding != "identity":
+        response.headers["Content-Encoding"] = coding
+    return response
@@ -0,0 +1,73 @@
+"""
+Dashboard Snapshot File
+-----------------------
+
+Persists the latest computed ``latest_data`` to ``data_snapshot.json`` so a
+restarted server (and the static GitHub Pages build) has data immediately:
+- ``write_snapshot`` replaces the file atomically (temp file + ``os.replace``),
+  so readers never see a half-written snapshot
+- ``load_snapshot`` returns the saved data, or None when the file is missing,
+  unreadable or has never held a completed refresh (empty ``timestamp``)
+- ``restore_json_keys`` undoes what a JSON round trip does to the data's
+  integer keys (``payouts.weeklyWinners`` is keyed by week number), so loaded
+  data compares equal to a fresh refresh and produces no spurious deltas
+
+Public API:
+  - load_snapshot
+  - restore_json_keys
+  - write_snapshot
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from typing import Any, Dict, Optional
+
+
+def restore_json_keys(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn the week-number keys JSON stringified back into ints (in place); returns ``data``."""
+    payouts = data.get("payouts")
+    if isinstance(payouts, dict) and isinstance(payouts.get("weeklyWinners"), dict):
+        payouts["weeklyWinners"] = {
+            int(week) if isinstance(week, str) and week.isdigit() else week: winner
+            for week, winner in payouts["weeklyWinners"].items()
+        }
+    return data
+
+
+def load_snapshot(path: str) -> Optional[Dict[str, Any]]:
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        # utf-8-sig: the shipped placeholder file starts with a BOM
+        with open(path, "r", encoding="utf-8-sig") as fh:
+            data = json.load(fh)
+    except (OSError, ValueError) as e:
+        print(f"Warning: Ignoring unreadable snapshot {path}: {e}")
+        return None
+    if not isinstance(data, dict) or not data.get("timestamp"):
+        return None
+    return restore_json_keys(data)
+
+
+def write_snapshot(path: str, data: Dict[str, Any]) -> bool:
+    """Atomically write ``data`` to ``path``; returns False (and logs) on failure."""
+    directory = os.path.dirname(os.path.abspath(path))
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".snapshot-", suffix=".tmp")
+    except OSError as e:
+        print(f"Warning: Could not write snapshot {path}: {e}")
+        return False
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(data, fh, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        return True
+    except (OSError, TypeError, ValueError) as e:
+        print(f"Warning: Could not write snapshot {path}: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return False
@@ -0,0 +1,147 @@
+"""
+Versioned Dashboard State
+-------------------------
+
+Keeps the latest ``latest_data`` dict under a monotonically increasing version
+and turns each refresh into a compact, section-keyed delta:
+- Each top-level key of ``latest_data`` (``week15``, ``payouts``, ``the_run``, …)
+  is a section; unchanged sections are omitted from the delta
+- Changed sections carry RFC 6902 style operations (add/remove/replace) whose
+  paths are relative to the section root (``""`` replaces the whole section)
+- Clients apply a delta only if its ``base_version`` matches their version,
+  otherwise they ask for a full snapshot
+- Every section also carries its own version, bumped only when that section
+  changes, so clients can hold and resync individual sections
+- ``restore`` adopts a version published by another worker (see
+  ``dashboard.store``) without producing a delta
+
+Public API:
+  - VersionedState
+  - json_diff
+  - apply_patch
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def _escape(token: Any) -> str:
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def json_diff(old: Any, new: Any, path: str = "") -> List[dict]:
+    """
+    Operations that turn ``old`` into ``new``. Dicts are diffed per key, lists
+    of equal length per index; anything else that differs is replaced whole.
+    """
+    if old is new:
+        return []
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops: List[dict] = []
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in new.items():
+            child = f"{path}/{_escape(key)}"
+            if key not in old:
+                ops.append({"op": "add", "path": child, "value": value})
+            else:
+                ops.extend(json_diff(old[key], value, child))
+        return ops
+    if isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+        ops = []
+        for idx, (a, b) in enumerate(zip(old, new)):
+            ops.extend(json_diff(a, b, f"{path}/{idx}"))
+        return ops
+    if type(old) is type(new) and old == new:
+        return []
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+def apply_patch(doc: Any, ops: List[dict]) -> Any:
+    """Apply ``json_diff`` operations to ``doc`` in place and return the new root."""
+    for op in ops:
+        if op["path"] == "":
+            doc = op.get("value")
+            continue
+        tokens = [_unescape(t) for t in op["path"].split("/")[1:]]
+        parent = doc
+        for token in tokens[:-1]:
+            parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+        last = tokens[-1]
+        if isinstance(parent, list):
+            if op["op"] == "add":
+                parent.insert(len(parent) if last == "-" else int(last), op["value"])
+            elif op["op"] == "remove":
+                del parent[int(last)]
+            else:
+                parent[int(last)] = op["value"]
+        else:
+            if op["op"] == "remove":
+                parent.pop(last, None)
+            else:
+                parent[last] = op["value"]
+    return doc
+
+
+class VersionedState:
+    """Latest dashboard data plus the version counter clients sync against."""
+
+    def __init__(self, data: Optional[Dict[str, Any]] = None) -> None:
+        self._lock = threading.Lock()
+        self.version = 0
+        self.data: Dict[str, Any] = data or {}
+        self.section_versions: Dict[str, int] = {name: 0 for name in self.data}
+
+    def update(self, new_data: Dict[str, Any]) -> Optional[dict]:
+        """
+        Replace the state with ``new_data`` and return the delta event payload,
+        or None when nothing changed (the version is not bumped).
+        """
+        with self._lock:
+            sections: Dict[str, List[dict]] = {}
+            for name in self.data:
+                if name not in new_data:
+                    sections[name] = [{"op": "replace", "path": "", "value": None}]
+            for name, value in new_data.items():
+                if name not in self.data:
+                    sections[name] = [{"op": "replace", "path": "", "value": value}]
+                    continue
+                ops = json_diff(self.data[name], value)
+                if ops:
+                    sections[name] = ops
+            self.data = new_data
+            if not sections:
+                return None
+            self.version += 1
+            for name in sections:
+                self.section_versions[name] = self.section_versions.get(name, 0) + 1
+            return {
+                "version": self.version,
+                "base_version": self.version - 1,
+                "sections": sections,
+                "section_versions": {name: self.section_versions[name] for name in sections},
+            }
+
+    def restore(self, version: int, data: Dict[str, Any], section_versions: Dict[str, int]) -> None:
+        """Adopt a state another worker published; no delta, the publisher broadcast it."""
+        with self._lock:
+            self.version = version
+            self.data = data
+            self.section_versions = dict(section_versions)
+
+    def section(self, name: str) -> Tuple[int, Any]:
+        """``(section_version, value)``; sections not present yet are ``(version, None)``."""
+        with self._lock:
+            return self.section_versions.get(name, 0), self.data.get(name)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Full ``data_update`` payload: every section plus the current version."""
+        with self._lock:
+            return dict(self.data, version=self.version)
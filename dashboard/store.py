@@ -0,0 +1,209 @@
+"""
+Shared Dashboard State Store
+----------------------------
+
+Lets several server workers share one refresh: a single leader crawls Sleeper
+and publishes each new version; the other workers adopt it from the store:
+- ``acquire_leadership(owner, ttl)`` takes or renews a lease; only the holder
+  runs the refresher, and a crashed leader is replaced once its lease expires
+- ``publish(key, state)`` stores a league's ``StoredState`` (version,
+  per-section versions, data) and ignores versions that are not newer, so a
+  deposed leader cannot roll back
+- ``load_if_newer(key, version)`` is a cheap version check that only reads the
+  document when another worker has published past ``version``
+- ``SQLiteStateStore`` (default, a file shared by the workers on one host) and
+  ``RedisStateStore`` (any client with ``get``/``set``/``mset``/``pexpire``/
+  ``delete``; the ``redis`` package is only needed for ``redis://`` URLs)
+
+Public API:
+  - RedisStateStore
+  - SQLiteStateStore
+  - StoredState
+  - open_state_store
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, Optional
+
+
+@dataclass
+class StoredState:
+    version: int
+    section_versions: Dict[str, int]
+    data: Dict[str, Any]
+
+
+class SQLiteStateStore:
+    """State and leader lease in one SQLite file; safe across processes."""
+
+    backend = "sqlite"
+
+    def __init__(self, path: str, *, clock: Callable[[], float] = time.time) -> None:
+        self.path = path
+        self._clock = clock
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with self._connect() as db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS league_state ("
+                " league TEXT PRIMARY KEY,"
+                " version INTEGER NOT NULL, section_versions TEXT NOT NULL, data TEXT NOT NULL)"
+            )
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS lease ("
+                " name TEXT PRIMARY KEY, owner TEXT NOT NULL, expires REAL NOT NULL)"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # One short-lived connection per call: cheap, and never shared between greenlets/threads
+        db = sqlite3.connect(self.path, timeout=10, isolation_level="IMMEDIATE")
+        try:
+            with db:  # commit, or roll back on error
+                yield db
+        finally:
+            db.close()
+
+    def acquire_leadership(self, owner: str, ttl: float) -> bool:
+        now = self._clock()
+        try:
+            with self._connect() as db:
+                db.execute(
+                    "INSERT INTO lease (name, owner, expires) VALUES ('refresh', ?, ?)"
+                    " ON CONFLICT(name) DO UPDATE SET owner = excluded.owner, expires = excluded.expires"
+                    " WHERE lease.owner = excluded.owner OR lease.expires <= ?",
+                    (owner, now + ttl, now),
+                )
+                row = db.execute("SELECT owner FROM lease WHERE name = 'refresh'").fetchone()
+        except sqlite3.Error as e:
+            print(f"Warning: Could not reach state store {self.path}: {e}")
+            return False
+        return row is not None and row[0] == owner
+
+    def release_leadership(self, owner: str) -> None:
+        with self._connect() as db:
+            db.execute("DELETE FROM lease WHERE name = 'refresh' AND owner = ?", (owner,))
+
+    def leader(self) -> Optional[str]:
+        with self._connect() as db:
+            row = db.execute(
+                "SELECT owner FROM lease WHERE name = 'refresh' AND expires > ?", (self._clock(),)
+            ).fetchone()
+        return row[0] if row else None
+
+    def publish(self, key: str, state: StoredState) -> bool:
+        """Store ``state`` unless the stored version is already as new; returns whether it was written."""
+        try:
+            with self._connect() as db:
+                cursor = db.execute(
+                    "INSERT INTO league_state (league, version, section_versions, data) VALUES (?, ?, ?, ?)"
+                    " ON CONFLICT(league) DO UPDATE SET version = excluded.version,"
+                    " section_versions = excluded.section_versions, data = excluded.data"
+                    " WHERE excluded.version > league_state.version",
+                    (key, state.version, json.dumps(state.section_versions), json.dumps(state.data)),
+                )
+                return cursor.rowcount > 0
+        except sqlite3.Error as e:
+            print(f"Warning: Could not publish to state store {self.path}: {e}")
+            return False
+
+    def version(self, key: str) -> int:
+        with self._connect() as db:
+            row = db.execute("SELECT version FROM league_state WHERE league = ?", (key,)).fetchone()
+        return row[0] if row else 0
+
+    def load_if_newer(self, key: str, version: int) -> Optional[StoredState]:
+        try:
+            with self._connect() as db:
+                row = db.execute(
+                    "SELECT version, section_versions, data FROM league_state WHERE league = ? AND version > ?",
+                    (key, version),
+                ).fetchone()
+        except sqlite3.Error as e:
+            print(f"Warning: Could not read state store {self.path}: {e}")
+            return None
+        if row is None:
+            return None
+        return StoredState(version=row[0], section_versions=json.loads(row[1]), data=json.loads(row[2]))
+
+
+class RedisStateStore:
+    """
+    State and leader lease in Redis, for workers on several hosts. The lease is
+    a key with a server-side expiry; renewal checks ownership first, so renew
+    well inside ``ttl``.
+    """
+
+    backend = "redis"
+
+    def __init__(self, client: Any, *, prefix: str = "quantum_gauntlet") -> None:
+        self.client = client
+        self._prefix = prefix
+        self._lease_key = f"{prefix}:refresh_leader"
+
+    @staticmethod
+    def _text(value: Any) -> Optional[str]:
+        return value.decode("utf-8") if isinstance(value, bytes) else value
+
+    def acquire_leadership(self, owner: str, ttl: float) -> bool:
+        ttl_ms = max(1, int(ttl * 1000))
+        if self.client.set(self._lease_key, owner, nx=True, px=ttl_ms):
+            return True
+        if self._text(self.client.get(self._lease_key)) == owner:
+            self.client.pexpire(self._lease_key, ttl_ms)
+            return True
+        return False
+
+    def release_leadership(self, owner: str) -> None:
+        if self._text(self.client.get(self._lease_key)) == owner:
+            self.client.delete(self._lease_key)
+
+    def leader(self) -> Optional[str]:
+        return self._text(self.client.get(self._lease_key))
+
+    def publish(self, key: str, state: StoredState) -> bool:
+        if state.version <= self.version(key):
+            return False
+        body = json.dumps({"version": state.version, "section_versions": state.section_versions, "data": state.data})
+        # MSET is atomic: readers never see a version without its document
+        self.client.mset({f"{self._prefix}:{key}:state": body, f"{self._prefix}:{key}:version": state.version})
+        return True
+
+    def version(self, key: str) -> int:
+        value = self._text(self.client.get(f"{self._prefix}:{key}:version"))
+        return int(value) if value else 0
+
+    def load_if_newer(self, key: str, version: int) -> Optional[StoredState]:
+        if self.version(key) <= version:
+            return None
+        body = self._text(self.client.get(f"{self._prefix}:{key}:state"))
+        if not body:
+            return None
+        stored = json.loads(body)
+        return StoredState(
+            version=stored["version"], section_versions=stored["section_versions"], data=stored["data"]
+        )
+
+
+def open_state_store(url: str):
+    """
+    ``sqlite:///path/to/file`` (or a bare path) → ``SQLiteStateStore``;
+    ``redis://…`` / ``rediss://…`` → ``RedisStateStore`` (requires ``redis``).
+    """
+    if url.startswith(("redis://", "rediss://")):
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError(f"STATE_STORE_URL={url} requires the 'redis' package (pip install redis)") from e
+        return RedisStateStore(redis.Redis.from_url(url))
+    if url.startswith("sqlite:///"):
+        url = url[len("sqlite:///"):]
+    return SQLiteStateStore(url)
@@ -0,0 +1,167 @@
+"""
+Quantum Gauntlet Batch Projection
+---------------------------------
+
+Vectorized counterpart of ``compute_tournament_projection`` for a whole league:
+- Every starter's lookback history is packed into a players × weeks array
+  (most recent → least recent) with a mask of usable games
+- Zero-point games are dropped from the mask when excluding DNPs, and the
+  surviving games take the normalized weights in order, as in ``_weighted_avg``
+- The NOT_STARTED / IN_PROGRESS / FINISHED selection rule runs as array ops
+- Per-roster totals are summed in starter order and rounded like the scalar path
+
+Public API:
+  - PlayerBatch
+  - pack_league
+  - project_batch
+  - project_league
+
+Results match ``compute_roster_projection(...).projected_total`` for the same
+inputs; use the scalar API when the per-player breakdown is needed.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from projection.quantum_gauntlet import GameState, MatchupIndex, build_matchup_index
+
+_STATE_CODES = {"NOT_STARTED": 0, "IN_PROGRESS": 1}
+_FINISHED = 2  # any other state is treated as final, like the scalar rule
+
+
+@dataclass
+class PlayerBatch:
+    roster_ids: List[int]
+    # players: position of each starter's roster in ``roster_ids``
+    roster_pos: np.ndarray
+    # players × lookback points (NaN where the player has no game that week)
+    history: np.ndarray
+    # players × lookback, True where the game counts towards the forecast
+    mask: np.ndarray
+    live: np.ndarray
+    states: np.ndarray
+
+
+def pack_league(
+    roster_ids: Iterable[int],
+    *,
+    week: int,
+    matchups_by_week: Dict[int, List[dict]],
+    current_week_matchups: List[dict],
+    get_player_game_state: Callable[[str], GameState],
+    lookback_weeks: int = 3,
+    exclude_zero_points: bool = True,
+    index: Optional[MatchupIndex] = None,
+) -> PlayerBatch:
+    """Collect every roster's starters, histories, live points and states into arrays."""
+    if index is None:
+        index = build_matchup_index({**matchups_by_week, week: current_week_matchups})
+    roster_ids = [int(rid) for rid in roster_ids]
+    prior_weeks = [week - back for back in range(1, lookback_weeks + 1) if week - back >= 1]
+
+    roster_pos: List[int] = []
+    rows: List[List[float]] = []
+    live: List[float] = []
+    states: List[int] = []
+    for pos, rid in enumerate(roster_ids):
+        roster_matchup = index.roster_matchup(week, current_week_matchups, rid) or {}
+        players_points_current = roster_matchup.get("players_points") or {}
+        for player_id in roster_matchup.get("starters") or []:
+            row = [np.nan] * lookback_weeks
+            for col, prior_week in enumerate(prior_weeks):
+                points = None
+                rm = index.rosters.get(prior_week, {}).get(rid)
+                if rm is not None:
+                    points = (rm.get("players_points") or {}).get(player_id)
+                if points is None:
+                    points = index.player_points.get(prior_week, {}).get(player_id)
+                if points is not None:
+                    row[col] = float(points)
+            roster_pos.append(pos)
+            rows.append(row)
+            live.append(float(players_points_current.get(player_id, 0.0)))
+            states.append(_STATE_CODES.get(get_player_game_state(player_id), _FINISHED))
+
+    history = np.array(rows, dtype=float).reshape(len(rows), lookback_weeks)
+    mask = ~np.isnan(history)
+    if exclude_zero_points:
+        mask &= history != 0.0
+    return PlayerBatch(
+        roster_ids=roster_ids,
+        roster_pos=np.array(roster_pos, dtype=np.intp),
+        history=history,
+        mask=mask,
+        live=np.array(live, dtype=float),
+        states=np.array(states, dtype=np.int8),
+    )
+
+
+def project_batch(
+    batch: PlayerBatch,
+    *,
+    weights: Tuple[float, ...] = (0.6, 0.3, 0.1),
+    default_floor: float = 0.0,
+) -> Dict[int, float]:
+    """Forecast every packed player and return ``roster_id → projected total``."""
+    players, lookback = batch.history.shape
+    # The k-th usable game (in recency order) takes weights[k]; games past the
+    # end of the weights get none, exactly like the scalar truncation.
+    slot = np.cumsum(batch.mask, axis=1) - 1
+    padded = np.zeros(max(lookback, len(weights)), dtype=float)
+    padded[:len(weights)] = weights
+    used = np.where(batch.mask, padded[np.clip(slot, 0, None)], 0.0)
+    values = np.where(batch.mask, batch.history, 0.0)
+
+    counts = batch.mask.sum(axis=1)
+    weight_sum = used.sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        weighted = (values * (used / weight_sum[:, None])).sum(axis=1)
+        # All used weights zero: plain mean of the games the weights would have covered
+        in_window = batch.mask & (slot < len(weights))
+        mean = np.where(in_window, values, 0.0).sum(axis=1) / in_window.sum(axis=1)
+    forecast = np.where(weight_sum != 0, weighted, mean)
+    forecast = np.where(counts > 0, forecast, float(default_floor))
+
+    chosen = np.where(
+        batch.states == 0,
+        forecast,
+        np.where(
+            batch.states == 1,
+            np.where(batch.live < forecast, forecast, batch.live),
+            batch.live,
+        ),
+    )
+    # bincount accumulates in player order, so each total adds up like the scalar loop
+    totals = np.bincount(batch.roster_pos, weights=chosen, minlength=len(batch.roster_ids))
+    return {rid: round(float(total), 2) for rid, total in zip(batch.roster_ids, totals)}
+
+
+def project_league(
+    roster_ids: Iterable[int],
+    *,
+    week: int,
+    matchups_by_week: Dict[int, List[dict]],
+    current_week_matchups: List[dict],
+    get_player_game_state: Callable[[str], GameState],
+    weights: Tuple[float, ...] = (0.6, 0.3, 0.1),
+    lookback_weeks: int = 3,
+    exclude_zero_points: bool = True,
+    default_floor: float = 0.0,
+    index: Optional[MatchupIndex] = None,
+) -> Dict[int, float]:
+    """Project every roster for ``week`` in one call: ``roster_id → projected total``."""
+    batch = pack_league(
+        roster_ids,
+        week=week,
+        matchups_by_week=matchups_by_week,
+        current_week_matchups=current_week_matchups,
+        get_player_game_state=get_player_game_state,
+        lookback_weeks=lookback_weeks,
+        exclude_zero_points=exclude_zero_points,
+        index=index,
+    )
+    return project_batch(batch, weights=weights, default_floor=default_floor)
@@ -0,0 +1,93 @@
+"""
+Quantum Gauntlet Projection Breakdowns
+--------------------------------------
+
+Keeps the per-starter ``RosterProjection`` rows of the latest refresh so a
+team's projection can be inspected without shipping it to every client:
+- During a refresh each projected (roster, week) is ``record``-ed with its memo
+  key; ``publish(version)`` swaps the collected set in once the refresh
+  completes, so readers always see one whole data version (a failed refresh
+  leaves the previous one in place)
+- The memo key digests every input of the projection, so it doubles as the
+  cache key of the serialized breakdown: unchanged projections are never
+  re-serialized across versions
+- ``breakdown_document`` turns one projection into the JSON document, naming
+  starters through an optional ``player_id → player`` lookup (anything with
+  ``full_name`` / ``position`` / ``team``), only when it is requested
+
+Public API:
+  - BreakdownStore
+  - breakdown_document
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict, Hashable, Mapping, Optional, Tuple
+
+from projection.quantum_gauntlet import RosterProjection
+
+# (roster_id, week) → (memo key, projection)
+Entries = Dict[Tuple[int, int], Tuple[Hashable, RosterProjection]]
+
+
+class BreakdownStore:
+    """Starter breakdowns of the last published data version."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: Entries = {}
+        self._pending: Entries = {}
+        self.version: Optional[Hashable] = None
+        self.stats = {"publishes": 0, "entries": 0}
+
+    def record(self, key: Hashable, projection: RosterProjection, week: int) -> None:
+        """Collect a projection of the refresh in progress."""
+        with self._lock:
+            self._pending[(int(projection.roster_id), int(week))] = (key, projection)
+
+    def publish(self, version: Hashable) -> None:
+        """Make the collected projections the ones served for ``version``."""
+        with self._lock:
+            self._entries, self._pending = self._pending, {}
+            self.version = version
+            self.stats["publishes"] += 1
+            self.stats["entries"] = len(self._entries)
+
+    def discard(self) -> None:
+        """Drop the projections of a refresh that did not complete."""
+        with self._lock:
+            self._pending = {}
+
+    def get(self, roster_id: int, week: int) -> Optional[Tuple[Hashable, RosterProjection]]:
+        with self._lock:
+            return self._entries.get((int(roster_id), int(week)))
+
+
+def breakdown_document(
+    projection: RosterProjection,
+    week: int,
+    players: Optional[Mapping[str, Any]] = None,
+) -> Dict[str, Any]:
+    """JSON-ready breakdown of one roster's projection for ``week``."""
+    players = players or {}
+    starters = []
+    for row in projection.starters_breakdown:
+        player = players.get(row.player_id)
+        starters.append({
+            "player_id": row.player_id,
+            "name": player.full_name if player is not None else row.player_id,
+            "position": player.position if player is not None else "",
+            "nfl_team": player.team if player is not None else "",
+            "game_state": row.game_state,
+            "live_points": row.live_points,
+            "forecast_points": row.forecast_points,
+            "chosen_points": row.chosen_points,
+            "rationale": row.rationale,
+        })
+    return {
+        "roster_id": projection.roster_id,
+        "week": int(week),
+        "projected_total": projection.projected_total,
+        "starters": starters,
+    }
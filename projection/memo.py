@@ -0,0 +1,83 @@
+"""
+Quantum Gauntlet Projection Memo
+--------------------------------
+
+Reuses roster projections across refreshes:
+- Entries are keyed by roster, week and digests of exactly the matchup data a
+  projection reads (the roster's current-week matchup and the lookback weeks)
+- ``begin(version)`` starts a generation whenever the refreshed data version
+  changes; entries not used during the previous generation are evicted, so the
+  memo never holds more than one refresh's working set
+- Hit / miss / eviction counters, both cumulative and for the latest generation
+
+Public API:
+  - ProjectionMemo
+  - matchup_digest
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Set
+
+
+def matchup_digest(payload: Any) -> str:
+    """Stable sha1 of a JSON-compatible matchup payload (``None`` hashes too)."""
+    data = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(data.encode("utf-8")).hexdigest()
+
+
+class ProjectionMemo:
+    """Generation-swept memo of projection results."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: Dict[Hashable, Any] = {}
+        self._used: Set[Hashable] = set()
+        self.version: Optional[Hashable] = None
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "entries": 0,
+            "last": {"version": None, "hits": 0, "misses": 0, "evictions": 0},
+        }
+
+    def begin(self, version: Hashable) -> None:
+        """Start a generation for ``version``; a new version evicts entries the last one never used."""
+        with self._lock:
+            if version == self.version:
+                return
+            stale = [key for key in self._entries if key not in self._used]
+            for key in stale:
+                del self._entries[key]
+            self._used = set()
+            self.version = version
+            self.stats["evictions"] += len(stale)
+            self.stats["entries"] = len(self._entries)
+            self.stats["last"] = {"version": str(version), "hits": 0, "misses": 0, "evictions": len(stale)}
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        with self._lock:
+            if key in self._entries:
+                self._used.add(key)
+                self.stats["hits"] += 1
+                self.stats["last"]["hits"] += 1
+                return self._entries[key]
+        value = compute()
+        with self._lock:
+            self._entries[key] = value
+            self._used.add(key)
+            self.stats["misses"] += 1
+            self.stats["last"]["misses"] += 1
+            self.stats["entries"] = len(self._entries)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._used.clear()
+            self.version = None
+            self.stats["entries"] = 0
@@ -8,8 +8,16 @@ Implements an intelligent projection for a roster's starters based on:
 - Game state selection rule per starter (NOT_STARTED, IN_PROGRESS, FINISHED)
 
 Public API:
+  - build_matchup_index
   - compute_roster_projection
   - compute_tournament_projection
+  - IncrementalProjection
+
+Pass a ``MatchupIndex`` (``week → roster_id → matchup`` and
+``week → player_id → points``, built once per refresh) to avoid rescanning
+every week's matchups for each starter; without one the lists are scanned.
+``IncrementalProjection`` keeps a week's forecasts and updates only the
+starters whose live points changed between polls.
 
 This module is intentionally decoupled from Flask and Sleeper-specific models.
 It consumes plain dicts consistent with Sleeper's matchup responses.
@@ -40,6 +48,41 @@ class RosterProjection:
     projected_total: float
 
 
+@dataclass
+class MatchupIndex:
+    # week → roster_id → first matchup dict for that roster
+    rosters: Dict[int, Dict[int, dict]]
+    # week → player_id → points from the first matchup listing that player
+    player_points: Dict[int, Dict[str, Any]]
+    # week → the matchup list the index was built from
+    source: Dict[int, List[dict]]
+
+    def roster_matchup(self, week: int, matchups: List[dict], roster_id: int) -> Optional[dict]:
+        """Indexed lookup when ``matchups`` is the list indexed for ``week``, else a scan."""
+        if self.source.get(week) is matchups:
+            return self.rosters.get(week, {}).get(int(roster_id))
+        return _get_roster_matchup(matchups, roster_id)
+
+
+def build_matchup_index(matchups_by_week: Dict[int, List[dict]]) -> MatchupIndex:
+    """Index every week once; first occurrences win, matching the scanning lookups."""
+    rosters: Dict[int, Dict[int, dict]] = {}
+    player_points: Dict[int, Dict[str, Any]] = {}
+    for week, matchups in matchups_by_week.items():
+        week_rosters: Dict[int, dict] = {}
+        week_points: Dict[str, Any] = {}
+        for mu in matchups or []:
+            try:
+                week_rosters.setdefault(int(mu.get("roster_id")), mu)
+            except Exception:
+                pass
+            for player_id, points in (mu.get("players_points") or {}).items():
+                week_points.setdefault(player_id, points)
+        rosters[week] = week_rosters
+        player_points[week] = week_points
+    return MatchupIndex(rosters=rosters, player_points=player_points, source=dict(matchups_by_week))
+
+
 def _get_roster_matchup(matchups: List[dict], roster_id: int) -> Optional[dict]:
     """Return the first matchup dict for a given roster_id from the provided list."""
     for matchup in matchups or []:
@@ -58,31 +101,41 @@ def _get_recent_points(
     lookback: int,
     exclude_zero: bool,
     roster_id: Optional[int] = None,
+    index: Optional[MatchupIndex] = None,
 ) -> List[float]:
     """
     Collect the player's points from the previous N weeks (week-1 .. week-lookback).
     If roster_id is provided, prefer the matchup for that roster (faster lookup),
-    otherwise scan all matchups for the player points map.
+    otherwise look the player up across all matchups of the week. With an
+    index both lookups are O(1); without one the week's matchups are scanned.
     """
     recent: List[float] = []
     for back in range(1, lookback + 1):
         prior_week = week - back
         if prior_week < 1:
             break
-        week_matchups = matchups_by_week.get(prior_week) or []
 
         points: Optional[float] = None
-        if roster_id is not None:
-            rm = _get_roster_matchup(week_matchups, roster_id)
-            if rm is not None:
-                points = (rm.get("players_points") or {}).get(player_id)
-        if points is None:
-            # Fallback: scan all matchups for this player id (slower but robust)
-            for mu in week_matchups:
-                pp = mu.get("players_points") or {}
-                if player_id in pp:
-                    points = pp.get(player_id)
-                    break
+        if index is not None:
+            if roster_id is not None:
+                rm = index.rosters.get(prior_week, {}).get(int(roster_id))
+                if rm is not None:
+                    points = (rm.get("players_points") or {}).get(player_id)
+            if points is None:
+                points = index.player_points.get(prior_week, {}).get(player_id)
+        else:
+            week_matchups = matchups_by_week.get(prior_week) or []
+            if roster_id is not None:
+                rm = _get_roster_matchup(week_matchups, roster_id)
+                if rm is not None:
+                    points = (rm.get("players_points") or {}).get(player_id)
+            if points is None:
+                # Fallback: scan all matchups for this player id (slower but robust)
+                for mu in week_matchups:
+                    pp = mu.get("players_points") or {}
+                    if player_id in pp:
+                        points = pp.get(player_id)
+                        break
 
         if points is None:
             continue
@@ -112,6 +165,63 @@ def _weighted_avg(values: List[float], weights: Tuple[float, ...]) -> float:
     return sum(v * w for v, w in zip(values[:use_n], norm))
 
 
+def _forecast(
+    player_id: str,
+    week: int,
+    matchups_by_week: Dict[int, List[dict]],
+    *,
+    roster_id: Optional[int],
+    weights: Tuple[float, ...],
+    lookback_weeks: int,
+    exclude_zero_points: bool,
+    default_floor: float,
+    index: Optional[MatchupIndex],
+) -> float:
+    """Weighted rolling average of prior weeks; depends only on weeks before ``week``."""
+    recent_points = _get_recent_points(
+        player_id=player_id,
+        week=week,
+        matchups_by_week=matchups_by_week,
+        lookback=lookback_weeks,
+        exclude_zero=exclude_zero_points,
+        roster_id=roster_id,
+        index=index,
+    )
+    if not recent_points:
+        return float(default_floor)
+    return float(_weighted_avg(recent_points, weights))
+
+
+def _select(game_state: GameState, live_points: float, forecast: float) -> Tuple[float, str]:
+    """Selection rule: returns (chosen_points, rationale)."""
+    if game_state == "NOT_STARTED":
+        return forecast, "not_started → forecast"
+    if game_state == "IN_PROGRESS":
+        if live_points < forecast:
+            return forecast, "in_progress & live < forecast → forecast"
+        return live_points, "in_progress & live ≥ forecast → live"
+    # FINISHED
+    return live_points, "finished → final live"
+
+
+def _player_projection(
+    player_id: str,
+    live_points: float,
+    forecast: float,
+    game_state: GameState,
+    chosen: float,
+    rationale: str,
+) -> PlayerProjection:
+    return PlayerProjection(
+        player_id=player_id,
+        live_points=round(live_points, 2),
+        forecast_points=round(forecast, 2),
+        game_state=game_state,
+        chosen_points=round(chosen, 2),
+        rationale=rationale,
+    )
+
+
 def compute_roster_projection(
     roster_id: int,
     week: int,
@@ -123,14 +233,19 @@ def compute_roster_projection(
     lookback_weeks: int = 3,
     exclude_zero_points: bool = True,
     default_floor: float = 0.0,
+    index: Optional[MatchupIndex] = None,
 ) -> RosterProjection:
     """
     Returns the projected score and per-player breakdown for a roster's starters.
     The projection is a sum across starters of chosen_points according to the
     game-state selection rule described in the module docstring.
+    ``index`` must have been built from ``matchups_by_week``.
     """
     # Locate current week's roster matchup
-    roster_matchup = _get_roster_matchup(current_week_matchups, roster_id) or {}
+    if index is not None:
+        roster_matchup = index.roster_matchup(week, current_week_matchups, roster_id) or {}
+    else:
+        roster_matchup = _get_roster_matchup(current_week_matchups, roster_id) or {}
     starters: List[str] = list(roster_matchup.get("starters") or [])
     players_points_current: Dict[str, float] = dict(roster_matchup.get("players_points") or {})
 
@@ -139,48 +254,25 @@ def compute_roster_projection(
 
     for player_id in starters:
         # Gather recent points history excluding zeros if configured
-        recent_points = _get_recent_points(
-            player_id=player_id,
-            week=week,
-            matchups_by_week=matchups_by_week,
-            lookback=lookback_weeks,
-            exclude_zero=exclude_zero_points,
+        forecast = _forecast(
+            player_id,
+            week,
+            matchups_by_week,
             roster_id=roster_id,
+            weights=weights,
+            lookback_weeks=lookback_weeks,
+            exclude_zero_points=exclude_zero_points,
+            default_floor=default_floor,
+            index=index,
         )
 
-        if not recent_points:
-            forecast = float(default_floor)
-        else:
-            forecast = float(_weighted_avg(recent_points, weights))
-
         # Current week live points and state
         live_points = float(players_points_current.get(player_id, 0.0))
         game_state = get_player_game_state(player_id)
 
-        # Selection rule
-        if game_state == "NOT_STARTED":
-            chosen = forecast
-            rationale = "not_started → forecast"
-        elif game_state == "IN_PROGRESS":
-            if live_points < forecast:
-                chosen = forecast
-                rationale = "in_progress & live < forecast → forecast"
-            else:
-                chosen = live_points
-                rationale = "in_progress & live ≥ forecast → live"
-        else:  # FINISHED
-            chosen = live_points
-            rationale = "finished → final live"
-
+        chosen, rationale = _select(game_state, live_points, forecast)
         starters_breakdown.append(
-            PlayerProjection(
-                player_id=player_id,
-                live_points=round(live_points, 2),
-                forecast_points=round(forecast, 2),
-                game_state=game_state,
-                chosen_points=round(chosen, 2),
-                rationale=rationale,
-            )
+            _player_projection(player_id, live_points, forecast, game_state, chosen, rationale)
         )
         running_total += chosen
 
@@ -202,13 +294,18 @@ def compute_tournament_projection(
     lookback_weeks: int = 3,
     exclude_zero_points: bool = True,
     default_floor: float = 0.0,
+    index: Optional[MatchupIndex] = None,
 ) -> Tuple[float, List[RosterProjection]]:
     """
     Compute projections for multiple rosters and return the summed total with
-    individual roster breakdowns.
+    individual roster breakdowns. An index is built once for the batch when
+    none is supplied.
     """
     breakdowns: List[RosterProjection] = []
     total: float = 0.0
+    if index is None:
+        # History lookups only touch earlier weeks, so the current week's slot is free
+        index = build_matchup_index({**matchups_by_week, week: current_week_matchups})
 
     for rid in roster_ids:
         rp = compute_roster_projection(
@@ -221,9 +318,189 @@ def compute_tournament_projection(
             lookback_weeks=lookback_weeks,
             exclude_zero_points=exclude_zero_points,
             default_floor=default_floor,
+            index=index,
         )
         breakdowns.append(rp)
         total += rp.projected_total
 
     return round(total, 2), breakdowns
 
+
+
+@dataclass
+class _TrackedRoster:
+    starters: List[str]
+    forecast: Dict[str, float]
+    live: Dict[str, float]
+    state: Dict[str, GameState]
+    chosen: Dict[str, float]
+    rationale: Dict[str, str]
+    total: float = 0.0
+
+    def retotal(self) -> None:
+        # Summed in starter order so totals match compute_roster_projection exactly
+        running_total = 0.0
+        for player_id in self.starters:
+            running_total += self.chosen[player_id]
+        self.total = running_total
+
+
+class IncrementalProjection:
+    """
+    Projection state for one week, updated in place as live points change.
+
+    Forecasts depend only on prior weeks, so they are computed once per tracked
+    starter and kept for the week. ``apply_live_points`` re-runs the selection
+    rule for the changed players only and re-totals just their rosters, giving
+    the same results as ``compute_roster_projection`` on the updated matchups.
+    Rosters are tracked lazily on first use; a changed lineup re-tracks its roster.
+    """
+
+    def __init__(
+        self,
+        week: int,
+        matchups_by_week: Dict[int, List[dict]],
+        get_player_game_state: Callable[[str], GameState],
+        *,
+        weights: Tuple[float, float, float] = (0.6, 0.3, 0.1),
+        lookback_weeks: int = 3,
+        exclude_zero_points: bool = True,
+        default_floor: float = 0.0,
+        index: Optional[MatchupIndex] = None,
+    ) -> None:
+        self.week = week
+        self.matchups_by_week = matchups_by_week
+        self.get_player_game_state = get_player_game_state
+        self.weights = weights
+        self.lookback_weeks = lookback_weeks
+        self.exclude_zero_points = exclude_zero_points
+        self.default_floor = default_floor
+        self.index = index
+        self._rosters: Dict[int, _TrackedRoster] = {}
+        self.stats = {"forecasts": 0, "selections": 0}
+
+    def is_tracked(self, roster_id: int) -> bool:
+        return int(roster_id) in self._rosters
+
+    def track(self, roster_id: int, roster_matchup: Optional[dict]) -> None:
+        """(Re)compute forecasts and selections for a roster's current starters."""
+        roster_id = int(roster_id)
+        roster_matchup = roster_matchup or {}
+        starters: List[str] = list(roster_matchup.get("starters") or [])
+        players_points_current: Dict[str, float] = dict(roster_matchup.get("players_points") or {})
+        tracked = _TrackedRoster(starters=starters, forecast={}, live={}, state={}, chosen={}, rationale={})
+        for player_id in starters:
+            tracked.forecast[player_id] = _forecast(
+                player_id,
+                self.week,
+                self.matchups_by_week,
+                roster_id=roster_id,
+                weights=self.weights,
+                lookback_weeks=self.lookback_weeks,
+                exclude_zero_points=self.exclude_zero_points,
+                default_floor=self.default_floor,
+                index=self.index,
+            )
+            self.stats["forecasts"] += 1
+            tracked.live[player_id] = float(players_points_current.get(player_id, 0.0))
+            self._reselect(tracked, player_id)
+        tracked.retotal()
+        self._rosters[roster_id] = tracked
+
+    def apply_live_points(self, changes: Dict[Tuple[int, str], float]) -> set:
+        """
+        Apply ``{(roster_id, player_id): live_points}`` and return the rosters whose
+        totals were recomputed. Entries for untracked rosters or non-starters are ignored.
+        """
+        dirty = set()
+        for (roster_id, player_id), points in changes.items():
+            tracked = self._rosters.get(int(roster_id))
+            if tracked is None or player_id not in tracked.forecast:
+                continue
+            tracked.live[player_id] = float(points)
+            self._reselect(tracked, player_id)
+            dirty.add(int(roster_id))
+        for roster_id in dirty:
+            self._rosters[roster_id].retotal()
+        return dirty
+
+    def diff_live_points(self, current_week_matchups: List[dict]) -> Tuple[Dict[Tuple[int, str], float], List[int]]:
+        """
+        Compare tracked starters against the latest matchups and game states. Returns
+        the live-point changes for ``apply_live_points`` (including starters whose
+        game state changed) and the rosters whose lineup changed.
+        """
+        changes: Dict[Tuple[int, str], float] = {}
+        relineup: List[int] = []
+        by_roster: Dict[int, dict] = {}
+        for mu in current_week_matchups or []:
+            try:
+                by_roster.setdefault(int(mu.get("roster_id")), mu)
+            except Exception:
+                continue
+        for roster_id, tracked in self._rosters.items():
+            roster_matchup = by_roster.get(roster_id) or {}
+            if list(roster_matchup.get("starters") or []) != tracked.starters:
+                relineup.append(roster_id)
+                continue
+            players_points_current = roster_matchup.get("players_points") or {}
+            for player_id in tracked.starters:
+                live = float(players_points_current.get(player_id, 0.0))
+                # A game that started or ended re-selects the player even at unchanged points
+                if live != tracked.live[player_id] or self.get_player_game_state(player_id) != tracked.state[player_id]:
+                    changes[(roster_id, player_id)] = live
+        return changes, relineup
+
+    def sync(
+        self,
+        current_week_matchups: List[dict],
+        get_player_game_state: Optional[Callable[[str], GameState]] = None,
+    ) -> set:
+        """Bring every tracked roster up to date with the latest matchups; returns changed rosters."""
+        if get_player_game_state is not None:
+            self.get_player_game_state = get_player_game_state
+        changes, relineup = self.diff_live_points(current_week_matchups)
+        changed = self.apply_live_points(changes)
+        if relineup:
+            relineup_set = set(relineup)
+            for mu in current_week_matchups or []:
+                try:
+                    roster_id = int(mu.get("roster_id"))
+                except Exception:
+                    continue
+                if roster_id in relineup_set:
+                    relineup_set.discard(roster_id)
+                    self.track(roster_id, mu)
+            for roster_id in relineup_set:
+                self.track(roster_id, None)
+            changed.update(relineup)
+        return changed
+
+    def projected_total(self, roster_id: int) -> float:
+        return round(self._rosters[int(roster_id)].total, 2)
+
+    def roster_projection(self, roster_id: int) -> RosterProjection:
+        tracked = self._rosters[int(roster_id)]
+        return RosterProjection(
+            roster_id=int(roster_id),
+            starters_breakdown=[
+                _player_projection(
+                    player_id,
+                    tracked.live[player_id],
+                    tracked.forecast[player_id],
+                    tracked.state[player_id],
+                    tracked.chosen[player_id],
+                    tracked.rationale[player_id],
+                )
+                for player_id in tracked.starters
+            ],
+            projected_total=round(tracked.total, 2),
+        )
+
+    def _reselect(self, tracked: _TrackedRoster, player_id: str) -> None:
+        game_state = self.get_player_game_state(player_id)
+        chosen, rationale = _select(game_state, tracked.live[player_id], tracked.forecast[player_id])
+        tracked.state[player_id] = game_state
+        tracked.chosen[player_id] = chosen
+        tracked.rationale[player_id] = rationale
+        self.stats["selections"] += 1
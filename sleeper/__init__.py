@@ -0,0 +1 @@
+"""Sleeper API access package for Quantum Gauntlet"""
@@ -0,0 +1,63 @@
+"""
+Sleeper Request Budget
+----------------------
+
+A process-wide requests-per-second cap shared by every league's refresh:
+- Token bucket: ``rate`` tokens per second, holding at most ``burst`` tokens,
+  so short fan-outs (a league's per-week matchups) go out at once while the
+  sustained rate never exceeds the budget
+- ``acquire()`` blocks the calling thread/greenlet until a token is free;
+  ``SleeperClient`` calls it before every request that reaches the network
+- ``stats`` counts requests and the total time callers spent waiting
+
+Public API:
+  - RequestBudget
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable, Optional
+
+
+class RequestBudget:
+    """Token bucket limiting Sleeper requests across all callers."""
+
+    def __init__(
+        self,
+        rate: float,
+        *,
+        burst: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(1.0, rate))
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._updated = clock()
+        self.stats = {"acquired": 0, "waited": 0, "wait_seconds": 0.0}
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until one is available; returns the seconds waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    self.stats["acquired"] += 1
+                    if waited:
+                        self.stats["waited"] += 1
+                        self.stats["wait_seconds"] += waited
+                    return waited
+                delay = (1.0 - self._tokens) / self.rate
+            self._sleep(delay)
+            waited += delay
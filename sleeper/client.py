@@ -0,0 +1,182 @@
+"""
+Sleeper API Client
+------------------
+
+Pooled, concurrent access to Sleeper's public read-only API:
+- One keep-alive ``requests.Session`` shared by every call, so a refresh reuses
+  TLS connections instead of opening a new one per request
+- A bounded thread pool that fans independent GETs out in parallel
+  (per-week ``/matchups/{week}`` calls, rosters + users)
+- Conditional requests: ETag / Last-Modified validators are replayed as
+  If-None-Match / If-Modified-Since, and a 304 returns the cached body
+- A digest of every raw response body, so callers can fingerprint a refresh
+  and skip recomputation when nothing changed
+- An optional shared ``RequestBudget`` that every request waits on, so many
+  leagues polled from one process stay under one requests-per-second cap
+
+Public API:
+  - SleeperClient
+
+The base URL defaults to https://api.sleeper.app/v1 and can be overridden with
+the ``SLEEPER_API_BASE`` environment variable or the ``base_url`` argument
+(used by the offline stub server in ``sleeper.stub``). The NFL schedule is
+served outside ``/v1``, from the same host.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from sleeper.budget import RequestBudget
+
+DEFAULT_BASE_URL = "https://api.sleeper.app/v1"
+
+
+def _build_session(pool_size: int) -> requests.Session:
+    """Create a session whose connection pool can serve every worker at once."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"Accept": "application/json"})
+    return session
+
+
+class SleeperClient:
+    """Keep-alive Sleeper client with a bounded parallel fan-out."""
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        *,
+        max_workers: int = 8,
+        timeout: float = 10.0,
+        session: Optional[requests.Session] = None,
+        conditional: bool = True,
+        budget: Optional[RequestBudget] = None,
+    ) -> None:
+        self.base_url = (base_url or os.environ.get("SLEEPER_API_BASE") or DEFAULT_BASE_URL).rstrip("/")
+        # Host root, for the few endpoints that are not versioned
+        self.site_url = self.base_url[: -len("/v1")] if self.base_url.endswith("/v1") else self.base_url
+        self.timeout = timeout
+        self.max_workers = max(1, int(max_workers))
+        self.session = session or _build_session(self.max_workers)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="sleeper")
+        self.conditional = conditional
+        self.budget = budget
+        self._lock = threading.Lock()
+        # path → (etag, last_modified, decoded body) for conditional requests
+        self._validators: Dict[str, Tuple[Optional[str], Optional[str], Any]] = {}
+        # path → sha1 of the latest raw response body
+        self._digests: Dict[str, str] = {}
+        self.stats = {"requests": 0, "not_modified": 0}
+
+    # ——— Low-level ———
+
+    def get_json(self, path: str, *, root: bool = False, conditional: bool = True) -> Any:
+        """
+        GET ``base_url + path`` (``site_url + path`` with ``root``) and return the decoded JSON body.
+        Bodies served from a 304 are shared with earlier callers; treat them as read-only.
+        ``conditional=False`` neither sends validators nor keeps the body (for large, rare downloads).
+        """
+        conditional = conditional and self.conditional
+        headers = {}
+        with self._lock:
+            cached = self._validators.get(path) if conditional else None
+        if cached is not None:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        if self.budget is not None:
+            self.budget.acquire()
+        base = self.site_url if root else self.base_url
+        resp = self.session.get(f"{base}{path}", headers=headers, timeout=self.timeout)
+        if resp.status_code == 304 and cached is not None:
+            with self._lock:
+                self.stats["requests"] += 1
+                self.stats["not_modified"] += 1
+            return cached[2]
+        resp.raise_for_status()
+
+        body = resp.json()
+        digest = hashlib.sha1(resp.content).hexdigest()
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+        with self._lock:
+            self.stats["requests"] += 1
+            self._digests[path] = digest
+            if conditional and (etag or last_modified):
+                self._validators[path] = (etag, last_modified, body)
+        return body
+
+    def fingerprint(self, prefix: str = "") -> str:
+        """
+        Hash of the latest raw response digests for every path under ``prefix``.
+        Stays identical across refreshes whose responses were byte-for-byte equal.
+        """
+        with self._lock:
+            items = sorted((p, d) for p, d in self._digests.items() if p.startswith(prefix))
+        h = hashlib.sha256()
+        for path, digest in items:
+            h.update(f"{path}={digest};".encode("utf-8"))
+        return h.hexdigest()
+
+    def fetch_many(self, paths: Iterable[str]) -> List[Any]:
+        """
+        GET several paths concurrently and return their bodies in input order.
+        The first failure is re-raised once all requests have been submitted.
+        """
+        paths = list(paths)
+        if len(paths) <= 1:
+            return [self.get_json(p) for p in paths]
+        return list(self._executor.map(self.get_json, paths))
+
+    # ——— Endpoints ———
+
+    def get_user(self, username: str) -> dict:
+        return self.get_json(f"/user/{username}")
+
+    def get_leagues(self, user_id: str, season: str, sport: str = "nfl") -> List[dict]:
+        return self.get_json(f"/user/{user_id}/leagues/{sport}/{season}")
+
+    def get_rosters(self, league_id: str) -> List[dict]:
+        return self.get_json(f"/league/{league_id}/rosters")
+
+    def get_users(self, league_id: str) -> List[dict]:
+        return self.get_json(f"/league/{league_id}/users")
+
+    def get_rosters_and_users(self, league_id: str) -> tuple:
+        """Fetch ``/rosters`` and ``/users`` for a league in parallel."""
+        rosters, users = self.fetch_many([f"/league/{league_id}/rosters", f"/league/{league_id}/users"])
+        return rosters, users
+
+    def get_matchups(self, league_id: str, week: int) -> List[dict]:
+        return self.get_json(f"/league/{league_id}/matchups/{week}")
+
+    def get_matchups_for_weeks(self, league_id: str, weeks: Iterable[int]) -> Dict[int, List[dict]]:
+        """Fetch ``/matchups/{week}`` for every week in parallel, keyed by week."""
+        weeks = list(weeks)
+        payloads = self.fetch_many(f"/league/{league_id}/matchups/{wk}" for wk in weeks)
+        return dict(zip(weeks, payloads))
+
+    def get_players(self, sport: str = "nfl") -> Dict[str, dict]:
+        """Every player keyed by player_id (several MB; Sleeper asks for at most one call a day)."""
+        return self.get_json(f"/players/{sport}", conditional=False)
+
+    def get_nfl_schedule(self, season: str, season_type: str = "regular") -> List[dict]:
+        """Games of a season: ``week``, ``date``, ``home``, ``away``, ``status`` (``pre_game``/``in_game``/``complete``)."""
+        return self.get_json(f"/schedule/nfl/{season_type}/{season}", root=True)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
+        self.session.close()
@@ -0,0 +1,207 @@
+"""
+Sleeper Player Registry
+-----------------------
+
+Names, positions and NFL teams of every player, without keeping Sleeper's
+multi-megabyte ``/players/nfl`` dump in memory:
+- ``refresh`` downloads the dump at most once per ``max_age`` (a day, as
+  Sleeper asks) and stores one row per player in a SQLite file; the JSON is
+  parsed only then and dropped once written. Failed downloads keep the
+  previous rows and are retried after ``retry_after``
+- ``refresh_if_stale`` is the background refresher's hook: it starts that
+  download as a background task (at most one at a time), so no league
+  refresh ever waits for it
+- Opening a registry reads one metadata row, so process startup pays no parse
+  cost; workers sharing the file adopt each other's downloads
+- ``get`` / ``get_many`` fetch just the requested rows; ``column`` loads one
+  column for every player as a ``{player_id: value}`` dict, kept until the
+  next download (e.g. the team map behind the schedule's game states)
+
+Public API:
+  - Player
+  - PlayerRegistry
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, Optional
+
+COLUMNS = ("full_name", "position", "team", "status")
+
+
+def _spawn_thread(target: Callable[[], None]) -> None:
+    threading.Thread(target=target, daemon=True, name="player-registry").start()
+
+
+@dataclass(frozen=True)
+class Player:
+    player_id: str
+    full_name: str
+    position: str
+    team: str
+    status: str
+
+
+def _row(player_id: str, player: dict):
+    """Registry row for one entry of the dump (team defenses only have first/last names)."""
+    name = player.get("full_name") or " ".join(
+        part for part in (player.get("first_name"), player.get("last_name")) if part
+    )
+    return (
+        player_id,
+        name or player_id,
+        player.get("position") or "",
+        player.get("team") or "",
+        player.get("status") or "",
+    )
+
+
+class PlayerRegistry:
+    """Daily-refreshed player rows in SQLite, read lazily."""
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        max_age: float = 86400.0,
+        retry_after: float = 600.0,
+        clock: Callable[[], float] = time.time,
+        spawn: Optional[Callable[[Callable[[], None]], object]] = None,
+    ) -> None:
+        self.path = str(path)
+        self.max_age = max_age
+        self.retry_after = retry_after
+        self._clock = clock
+        self._lock = threading.Lock()
+        # Held for a whole download, so lookups (under _lock) never wait on the network
+        self._refresh_lock = threading.Lock()
+        self._columns: Dict[str, Dict[str, str]] = {}
+        self._failed = float("-inf")
+        # How background downloads are started, e.g. ``socketio.start_background_task``
+        self._spawn = spawn or _spawn_thread
+        self._in_flight = False
+        self.stats = {"downloads": 0, "errors": 0, "players": 0}
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with self._connect() as db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS players ("
+                " player_id TEXT PRIMARY KEY, full_name TEXT NOT NULL, position TEXT NOT NULL,"
+                " team TEXT NOT NULL, status TEXT NOT NULL)"
+            )
+            db.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value REAL NOT NULL)")
+        self.fetched_at = self._stored_fetched_at()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # One short-lived connection per call, like the state store
+        db = sqlite3.connect(self.path, timeout=10, isolation_level="IMMEDIATE")
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
+
+    def _stored_fetched_at(self) -> Optional[float]:
+        with self._connect() as db:
+            row = db.execute("SELECT value FROM meta WHERE key = 'fetched_at'").fetchone()
+        return row[0] if row else None
+
+    def _fresh(self, now: float) -> bool:
+        return self.fetched_at is not None and now - self.fetched_at < self.max_age
+
+    def _due(self, now: float) -> bool:
+        return not self._fresh(now) and now - self._failed >= self.retry_after
+
+    def refresh_if_stale(self, client) -> bool:
+        """Start ``refresh`` in the background when it is due; returns whether one was started."""
+        with self._lock:
+            if self._in_flight or not self._due(self._clock()):
+                return False
+            self._in_flight = True
+
+        def download() -> None:
+            try:
+                self.refresh(client)
+            finally:
+                with self._lock:
+                    self._in_flight = False
+
+        self._spawn(download)
+        return True
+
+    def refresh(self, client) -> bool:
+        """Download the dump if the stored copy is older than ``max_age``; returns whether it did."""
+        now = self._clock()
+        if not self._due(now):
+            return False
+        with self._refresh_lock:
+            # Another thread or worker may have downloaded it meanwhile
+            stored = self._stored_fetched_at()
+            if stored != self.fetched_at:
+                self._adopt(stored)
+            if self._fresh(now):
+                return False
+            try:
+                players = client.get_players()
+                rows = [_row(pid, player or {}) for pid, player in players.items()]
+                del players
+                with self._connect() as db:
+                    db.execute("DELETE FROM players")
+                    db.executemany("INSERT INTO players VALUES (?, ?, ?, ?, ?)", rows)
+                    db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('fetched_at', ?)", (now,))
+            except Exception as e:
+                self._failed = now
+                self.stats["errors"] += 1
+                print(f"Warning: Could not refresh the player registry: {e}")
+                return False
+            self._adopt(now)
+            self.stats["downloads"] += 1
+            self.stats["players"] = len(rows)
+            print(f"[OK] Player registry refreshed: {len(rows)} players")
+            return True
+
+    def _adopt(self, fetched_at: Optional[float]) -> None:
+        with self._lock:
+            self.fetched_at, self._columns = fetched_at, {}
+
+    def get(self, player_id: str) -> Optional[Player]:
+        return self.get_many([player_id]).get(player_id)
+
+    def get_many(self, player_ids: Iterable[str]) -> Dict[str, Player]:
+        """Rows for the known ``player_ids`` (unknown ids are left out)."""
+        ids = list(dict.fromkeys(str(pid) for pid in player_ids))
+        found: Dict[str, Player] = {}
+        # Stay under SQLite's bound-parameter limit
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            with self._connect() as db:
+                rows = db.execute(
+                    f"SELECT player_id, {', '.join(COLUMNS)} FROM players"
+                    f" WHERE player_id IN ({', '.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+            found.update((row[0], Player(*row)) for row in rows)
+        return found
+
+    def column(self, name: str) -> Dict[str, str]:
+        """``{player_id: value}`` of one column for every player, loaded once per download."""
+        if name not in COLUMNS:
+            raise ValueError(f"Unknown player column '{name}'")
+        with self._lock:
+            values = self._columns.get(name)
+            if values is None:
+                with self._connect() as db:
+                    values = dict(db.execute(f"SELECT player_id, {name} FROM players"))
+                self._columns[name] = values
+            return values
+
+    def __len__(self) -> int:
+        with self._connect() as db:
+            return db.execute("SELECT COUNT(*) FROM players").fetchone()[0]
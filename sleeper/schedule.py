@@ -0,0 +1,283 @@
+"""
+NFL Schedule Game States
+------------------------
+
+Resolves ``get_player_game_state`` for the projections from the NFL schedule
+instead of guessing from live points (which never reports FINISHED and sees a
+scoreless finished player as not started):
+- ``NflSchedule`` downloads the season schedule from Sleeper, persists it to
+  a JSON file and reloads it once per NFL week; while a game window is open it
+  is re-checked every ``live_ttl`` seconds (a conditional GET, normally a
+  304) to pick up final statuses early. Each player's NFL team comes from the
+  ``sleeper.players`` registry (its ``team`` column), which is refreshed on
+  its own background schedule, never from here
+- ``GameStates`` is one week's index at one moment: every team's state is
+  computed once, so a player lookup is two dict reads. A game is NOT_STARTED
+  before kickoff, IN_PROGRESS for ``GAME_DURATION`` after it and FINISHED
+  afterwards; without a ``start_time`` the game's day window from
+  ``sleeper.season`` stands in for kickoff and end. ``in_game`` / ``complete``
+  statuses take precedence over the clock, and teams without a game that week
+  (byes) and free agents are FINISHED
+- players the map does not know fall back to ``points_game_state``, the
+  live-points heuristic, as does everything when the schedule is unavailable
+  or has no games for the week (not yet published, or a partial feed)
+- ``GameStates.version`` digests the team states and the registry download
+  the player teams come from, so memo keys and refresh fingerprints change
+  exactly when a state (or a player's team) does
+
+Public API:
+  - GameStates
+  - NflSchedule
+  - points_game_state
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time as _time
+from datetime import date, datetime, time, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from sleeper import season as season_calendar
+from sleeper.players import PlayerRegistry
+
+CACHE_FORMAT_VERSION = 2
+# A game is assumed over this long after kickoff (NFL games run about 3h15)
+GAME_DURATION = timedelta(hours=4)
+# Day window for games on days without a regular one (holiday games)
+DEFAULT_GAME_DAY = (time(12, 0), time(23, 30))
+
+_STATUS_STATES = {"complete": "FINISHED", "in_game": "IN_PROGRESS"}
+
+
+def points_game_state(players_points: Dict[str, float]) -> Callable[[str], str]:
+    """Live-points heuristic: a player with points > 0 is IN_PROGRESS, anyone else NOT_STARTED."""
+
+    def get_player_game_state(player_id: str) -> str:
+        if float(players_points.get(player_id, 0.0)) > 0.0:
+            return "IN_PROGRESS"
+        return "NOT_STARTED"
+
+    return get_player_game_state
+
+
+def _game_times(game: dict) -> Tuple[datetime, datetime]:
+    """(kickoff, end) of a schedule entry, in Central time."""
+    start = game.get("start_time")
+    if start is not None:
+        if isinstance(start, (int, float)):
+            kickoff = datetime.fromtimestamp(start / 1000, season_calendar.CENTRAL_TZ)
+        else:
+            kickoff = datetime.fromisoformat(str(start)).astimezone(season_calendar.CENTRAL_TZ)
+        return kickoff, kickoff + GAME_DURATION
+    day = date.fromisoformat(game["date"])
+    opens, closes = next(
+        ((start, end) for weekday, start, end, _ in season_calendar.GAME_WINDOWS if weekday == day.weekday()),
+        DEFAULT_GAME_DAY,
+    )
+    localize = season_calendar.CENTRAL_TZ.localize
+    return localize(datetime.combine(day, opens)), localize(datetime.combine(day, closes))
+
+
+def _game_state(game: dict, now: datetime) -> str:
+    state = _STATUS_STATES.get(game.get("status"))
+    if state == "FINISHED":
+        return state
+    kickoff, ends = _game_times(game)
+    if now >= ends:
+        return "FINISHED"
+    if state == "IN_PROGRESS" or now >= kickoff:
+        return "IN_PROGRESS"
+    return "NOT_STARTED"
+
+
+class GameStates:
+    """Player → game state for one week at one moment, backed by a per-team index."""
+
+    def __init__(
+        self,
+        team_states: Dict[str, str],
+        player_teams: Dict[str, str],
+        fallback: Optional[Callable[[str], str]] = None,
+        players_version: Any = None,
+    ) -> None:
+        self.team_states = team_states
+        self.player_teams = player_teams
+        self.fallback = fallback or (lambda player_id: "NOT_STARTED")
+        digest = hashlib.sha1(json.dumps([sorted(team_states.items()), players_version]).encode("utf-8"))
+        self.version = digest.hexdigest()[:16] if team_states else "points"
+
+    @classmethod
+    def build(
+        cls,
+        games: Iterable[dict],
+        teams: Iterable[str],
+        player_teams: Dict[str, str],
+        now: datetime,
+        fallback: Optional[Callable[[str], str]] = None,
+        players_version: Any = None,
+    ) -> "GameStates":
+        """
+        Index ``games`` of one week; the other ``teams`` have no game and are
+        FINISHED. Without any games the week is unknown rather than a league-wide
+        bye, so every player gets the ``fallback``.
+        """
+        games = list(games)
+        if not games:
+            return cls({}, {}, fallback)
+        team_states = {team: "FINISHED" for team in teams}
+        for game in games:
+            state = _game_state(game, now)
+            team_states[game["home"]] = team_states[game["away"]] = state
+        return cls(team_states, player_teams, fallback, players_version)
+
+    def __call__(self, player_id: str) -> str:
+        team = self.player_teams.get(player_id)
+        if team is None:
+            # Team defenses use the team abbreviation as their player_id
+            team = player_id if player_id in self.team_states else None
+            if team is None:
+                return self.fallback(player_id)
+        # Free agents ("") and teams missing from the schedule do not play
+        return self.team_states.get(team, "FINISHED")
+
+
+class NflSchedule:
+    """Disk-backed NFL schedule plus the registry's player teams, shared by every league and refresh."""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        *,
+        players: Optional[PlayerRegistry] = None,
+        season: str = str(season_calendar.SEASON_START.year),
+        live_ttl: float = 300.0,
+        clock: Callable[[], float] = _time.time,
+        now: Callable[[], datetime] = lambda: datetime.now(season_calendar.CENTRAL_TZ),
+    ) -> None:
+        self.path = str(path) if path else None
+        self.players = players
+        self.season = season
+        self.live_ttl = live_ttl
+        self._clock = clock
+        self._now = now
+        self._lock = threading.Lock()
+        self._schedule_body: Optional[List[dict]] = None
+        self._games: Dict[int, List[dict]] = {}
+        self._teams: List[str] = []
+        # NFL week the schedule was downloaded in, and when it was last checked / a load failed
+        self._loaded_week: Optional[int] = None
+        self._checked = float("-inf")
+        self._failed = float("-inf")
+        self.stats = {"loads": 0, "checks": 0, "errors": 0}
+        self._load()
+
+    def game_states(
+        self,
+        client,
+        week: int,
+        *,
+        fallback: Optional[Callable[[str], str]] = None,
+        now: Optional[datetime] = None,
+    ) -> GameStates:
+        """States of ``week``'s games at ``now``; reloads the schedule first when it is due."""
+        now = now or self._now()
+        self.refresh(client, now)
+        with self._lock:
+            games, teams = self._games.get(week, []), self._teams
+        if not teams:
+            return GameStates({}, {}, fallback)
+        if self.players is None:
+            return GameStates.build(games, teams, {}, now, fallback)
+        return GameStates.build(games, teams, self.players.column("team"), now, fallback, self.players.fetched_at)
+
+    def refresh(self, client, now: Optional[datetime] = None) -> None:
+        """
+        Download the schedule once per NFL week and every ``live_ttl`` seconds
+        during game windows. Failures keep the previous data and are retried
+        after ``live_ttl``.
+        """
+        now = now or self._now()
+        tick = self._clock()
+        nfl_week = season_calendar.current_nfl_week(now)
+        with self._lock:
+            if tick - self._failed < self.live_ttl:
+                return
+            # Once the season is over the data stays as it is
+            frozen = season_calendar.latest_completed_week(now) >= season_calendar.LAST_WEEK and self._teams
+            weekly = self._loaded_week != nfl_week and not frozen
+            live = season_calendar.current_game_window(now) is not None and tick - self._checked >= self.live_ttl
+            if not (weekly or live):
+                return
+            try:
+                schedule = client.get_nfl_schedule(self.season)
+            except Exception as e:
+                self._failed = tick
+                self.stats["errors"] += 1
+                print(f"Warning: Could not load the NFL schedule: {e}")
+                return
+            self._checked = tick
+            self.stats["checks"] += 1
+            # A 304 hands back the very same body: nothing to re-index or persist
+            changed = schedule is not self._schedule_body
+            if changed:
+                self._index_schedule(schedule)
+            if weekly:
+                self._loaded_week = nfl_week
+                self.stats["loads"] += 1
+            if changed or weekly:
+                self._save_locked()
+
+    # ——— Internals ———
+
+    def _index_schedule(self, schedule: List[dict]) -> None:
+        self._schedule_body = schedule
+        games: Dict[int, List[dict]] = {}
+        teams = set()
+        for game in schedule or []:
+            if not game.get("home") or not game.get("away"):
+                continue
+            games.setdefault(int(game["week"]), []).append(game)
+            teams.update((game["home"], game["away"]))
+        self._games = games
+        self._teams = sorted(teams)
+
+    def _load(self) -> None:
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as fh:
+                data = json.load(fh)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Ignoring unreadable schedule cache {self.path}: {e}")
+            return
+        if data.get("version") != CACHE_FORMAT_VERSION or data.get("season") != self.season:
+            return
+        self._index_schedule(data.get("schedule", []))
+        self._loaded_week = data.get("loaded_week")
+
+    def _save_locked(self) -> None:
+        """Atomically persist the schedule (lock held)."""
+        if not self.path:
+            return
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        payload: Dict[str, Any] = {
+            "version": CACHE_FORMAT_VERSION,
+            "season": self.season,
+            "loaded_week": self._loaded_week,
+            "schedule": self._schedule_body or [],
+        }
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".schedule-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(payload, fh, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Warning: Could not persist schedule cache {self.path}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
@@ -0,0 +1,114 @@
+"""
+NFL Season Calendar
+-------------------
+
+Week boundaries for the 2025 season, in US Central time:
+- Week 1 starts Thursday, Sep 4, 2025; every week is 7 days long
+- A week is considered complete starting Tuesday (5 days after its Thursday
+  start), once Monday Night Football has finished
+- Boundaries are local midnights: calendar days are counted in Central time,
+  so the November DST change does not move them to 23:00 (mid-MNF)
+- Games are played in windows: Thursday and Monday nights, Sunday afternoon
+  through Sunday night, and Saturdays from week 15; each window runs until
+  an hour after the last kickoff's usual finish
+
+Public API:
+  - current_game_window
+  - latest_completed_week
+  - current_nfl_week
+  - next_game_window
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, time, timedelta
+from typing import Optional, Tuple
+
+import pytz
+
+CENTRAL_TZ = pytz.timezone('America/Chicago')
+
+# NFL 2025 season start date (Week 1 Thursday, Sep 4, 2025)
+SEASON_START = CENTRAL_TZ.localize(datetime(2025, 9, 4))
+LAST_WEEK = 17
+
+# (weekday, start, end, first week it applies to), Central time; Monday is 0
+GAME_WINDOWS = (
+    (3, time(19, 0), time(23, 30), 1),   # Thursday Night Football
+    (5, time(12, 0), time(23, 30), 15),  # Late-season Saturday slates
+    (6, time(12, 0), time(23, 30), 1),   # Sunday early, late and night games
+    (0, time(19, 0), time(23, 30), 1),   # Monday Night Football
+)
+
+
+def _now(now: Optional[datetime]) -> datetime:
+    return now if now is not None else datetime.now(CENTRAL_TZ)
+
+
+def _midnight_after(season_start: datetime, days: int) -> datetime:
+    """Central midnight starting the day ``days`` calendar days after ``season_start``."""
+    day = season_start.astimezone(CENTRAL_TZ).date() + timedelta(days=days)
+    return CENTRAL_TZ.localize(datetime.combine(day, time.min))
+
+
+def current_nfl_week(now: Optional[datetime] = None, season_start: datetime = SEASON_START) -> int:
+    """Week number in progress (1-based, unbounded) for the given moment."""
+    local_day = _now(now).astimezone(CENTRAL_TZ).date()
+    days_since_start = (local_day - season_start.astimezone(CENTRAL_TZ).date()).days
+    return (days_since_start // 7) + 1
+
+
+def latest_completed_week(
+    now: Optional[datetime] = None,
+    season_start: datetime = SEASON_START,
+    last_week: int = LAST_WEEK,
+) -> int:
+    """Latest fully completed week (0 before Week 1 finishes, capped at last_week)."""
+    now = _now(now)
+    completed = 0
+    for week in range(1, last_week + 1):
+        # Week starts on Thursday; it is complete 5 days later (= Tuesday)
+        week_complete_date = _midnight_after(season_start, 7 * (week - 1) + 5)
+        if now >= week_complete_date:
+            completed = week
+        else:
+            break
+    return completed
+
+
+def _windows_on(day: datetime, season_start: datetime):
+    for weekday, start, end, first_week in GAME_WINDOWS:
+        if day.weekday() != weekday:
+            continue
+        opens = CENTRAL_TZ.localize(datetime.combine(day.date(), start))
+        if current_nfl_week(opens, season_start) < first_week:
+            continue
+        yield opens, CENTRAL_TZ.localize(datetime.combine(day.date(), end))
+
+
+def current_game_window(
+    now: Optional[datetime] = None, season_start: datetime = SEASON_START
+) -> Optional[Tuple[datetime, datetime]]:
+    """``(start, end)`` of the game window in progress, or None between windows."""
+    now = _now(now).astimezone(CENTRAL_TZ)
+    for opens, closes in _windows_on(now, season_start):
+        if opens <= now < closes:
+            return opens, closes
+    return None
+
+
+def next_game_window(
+    now: Optional[datetime] = None,
+    season_start: datetime = SEASON_START,
+    last_week: int = LAST_WEEK,
+) -> Optional[Tuple[datetime, datetime]]:
+    """The next window that has not started yet, or None once the season's games are over."""
+    now = _now(now).astimezone(CENTRAL_TZ)
+    season_end = _midnight_after(season_start, 7 * (last_week - 1) + 5)
+    day = max(now, season_start)
+    while day < season_end + timedelta(days=1):
+        for opens, closes in _windows_on(day, season_start):
+            if now < opens < season_end:
+                return opens, closes
+        day += timedelta(days=1)
+    return None
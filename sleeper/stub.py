@@ -0,0 +1,252 @@
+"""
+Offline Sleeper Stub Server
+---------------------------
+
+A local stand-in for api.sleeper.app used by tests and benchmarks:
+- ``build_synthetic_league`` produces a deterministic league (users, rosters,
+  head-to-head matchups with starters and players_points for every week)
+- The server takes one league or a list of them (distinct ``league_id`` /
+  ``username``), for multi-league tests and benchmarks
+- ``SleeperStubServer`` serves it over HTTP/1.1 keep-alive on 127.0.0.1 with
+  an optional per-request latency, and records every request path and every
+  accepted TCP connection so callers can assert on traffic
+- Responses carry a content ETag and honour If-None-Match with 304, like a
+  CDN-fronted API would
+- ``nfl_schedule`` / ``players`` optionally serve the NFL schedule and the
+  player registry (404 when not given)
+
+Only the endpoints used by the dashboard are implemented.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Union
+
+
+def build_synthetic_league(
+    num_teams: int = 12,
+    *,
+    weeks: int = 17,
+    starters_per_team: int = 9,
+    seed: int = 0,
+    username: str = "LactatingLtinas",
+    season: str = "2025",
+    league_name: str = "The Shake Weight Fantasy League",
+    league_id: str = "100000000000000001",
+) -> Dict[str, Any]:
+    """
+    Build a deterministic synthetic league shaped like Sleeper's responses.
+    Each roster keeps the same starters every week; teams are paired into
+    head-to-head matchups by rotating the schedule week over week.
+    """
+    rng = random.Random(seed)
+    users = []
+    rosters = []
+    starters_by_roster: Dict[int, List[str]] = {}
+    for rid in range(1, num_teams + 1):
+        owner_id = f"{900000 + rid}"
+        users.append({
+            "user_id": owner_id,
+            "display_name": f"owner{rid}",
+            "metadata": {"team_name": f"Team {rid}"},
+        })
+        starters = [str(rid * 100 + slot) for slot in range(starters_per_team)]
+        starters_by_roster[rid] = starters
+        rosters.append({"roster_id": rid, "owner_id": owner_id, "starters": list(starters)})
+
+    matchups: Dict[int, List[dict]] = {}
+    roster_ids = list(starters_by_roster)
+    for wk in range(1, weeks + 1):
+        order = roster_ids[wk % num_teams:] + roster_ids[:wk % num_teams]
+        week_rows = []
+        for idx, rid in enumerate(order):
+            players_points = {pid: round(rng.uniform(0.0, 25.0), 2) for pid in starters_by_roster[rid]}
+            week_rows.append({
+                "roster_id": rid,
+                "matchup_id": idx // 2 + 1,
+                "points": round(sum(players_points.values()), 2),
+                "starters": list(starters_by_roster[rid]),
+                "players_points": players_points,
+            })
+        week_rows.sort(key=lambda m: m["roster_id"])
+        matchups[wk] = week_rows
+
+    return {
+        "username": username,
+        "user_id": "800000000000000001",
+        "season": season,
+        "league_name": league_name,
+        "league_id": league_id,
+        "users": users,
+        "rosters": rosters,
+        "matchups": matchups,
+    }
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    _routes = [
+        (re.compile(r"^/v1/user/(?P<username>[^/]+)$"), "user"),
+        (re.compile(r"^/v1/user/(?P<user_id>[^/]+)/leagues/nfl/(?P<season>[^/]+)$"), "leagues"),
+        (re.compile(r"^/v1/league/(?P<league_id>[^/]+)/rosters$"), "rosters"),
+        (re.compile(r"^/v1/league/(?P<league_id>[^/]+)/users$"), "users"),
+        (re.compile(r"^/v1/league/(?P<league_id>[^/]+)/matchups/(?P<week>\d+)$"), "matchups"),
+        (re.compile(r"^/v1/players/nfl$"), "players"),
+        (re.compile(r"^/schedule/nfl/regular/(?P<season>[^/]+)$"), "schedule"),
+    ]
+
+    def do_GET(self) -> None:  # noqa: N802 (http.server naming)
+        server: "SleeperStubServer" = self.server.stub  # type: ignore[attr-defined]
+        path = self.path.split("?", 1)[0]
+        server._record(path)
+        if server.latency:
+            time.sleep(server.latency)
+
+        body = server._resolve(path)
+        if body is None:
+            self._send(404, {"error": "not found"})
+            return
+
+        data = json.dumps(body).encode("utf-8")
+        etag = '"' + hashlib.sha1(data).hexdigest() + '"'
+        if server.etags and self.headers.get("If-None-Match") == etag:
+            server._record_not_modified()
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self._send(200, body, etag=etag if server.etags else None)
+
+    def _send(self, status: int, payload: Any, etag: Optional[str] = None) -> None:
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        if etag:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):  # silence per-request logging
+        return
+
+
+class _CountingHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def process_request(self, request, client_address):
+        self.stub._record_connection()  # type: ignore[attr-defined]
+        super().process_request(request, client_address)
+
+
+class SleeperStubServer:
+    """Threaded local HTTP server that mimics the Sleeper endpoints."""
+
+    def __init__(
+        self,
+        league: Union[Dict[str, Any], List[Dict[str, Any]], None] = None,
+        *,
+        latency: float = 0.0,
+        etags: bool = True,
+        nfl_schedule: Optional[List[dict]] = None,
+        players: Optional[Dict[str, dict]] = None,
+    ) -> None:
+        self.leagues = list(league) if isinstance(league, list) else [league or build_synthetic_league()]
+        self.league = self.leagues[0]
+        self.latency = latency
+        self.etags = etags
+        self.nfl_schedule = nfl_schedule
+        self.players = players
+        self.requests: Counter = Counter()
+        self.connections = 0
+        self.not_modified = 0
+        self._lock = threading.Lock()
+        self._httpd = _CountingHTTPServer(("127.0.0.1", 0), _StubHandler)
+        self._httpd.stub = self  # type: ignore[attr-defined]
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    @property
+    def total_requests(self) -> int:
+        with self._lock:
+            return sum(self.requests.values())
+
+    def reset_counters(self) -> None:
+        with self._lock:
+            self.requests.clear()
+            self.connections = 0
+            self.not_modified = 0
+
+    def start(self) -> "SleeperStubServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "SleeperStubServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    # ——— Internals ———
+
+    def _record(self, path: str) -> None:
+        with self._lock:
+            self.requests[path] += 1
+
+    def _record_not_modified(self) -> None:
+        with self._lock:
+            self.not_modified += 1
+
+    def _record_connection(self) -> None:
+        with self._lock:
+            self.connections += 1
+
+    def _resolve(self, path: str) -> Any:
+        for pattern, name in _StubHandler._routes:
+            m = pattern.match(path)
+            if not m:
+                continue
+            if name == "user":
+                league = next((L for L in self.leagues if L["username"] == m["username"]), None)
+                if league is None:
+                    return None
+                return {"user_id": league["user_id"], "username": league["username"]}
+            if name == "players":
+                return self.players
+            if name == "schedule":
+                return self.nfl_schedule
+            if name == "leagues":
+                return [
+                    {"league_id": L["league_id"], "name": L["league_name"], "season": m["season"]}
+                    for L in self.leagues
+                    if L["user_id"] == m["user_id"]
+                ]
+            league = next((L for L in self.leagues if L["league_id"] == m["league_id"]), None)
+            if league is None:
+                return None
+            if name == "rosters":
+                return league["rosters"]
+            if name == "users":
+                return league["users"]
+            if name == "matchups":
+                return league["matchups"].get(int(m["week"]), [])
+        return None
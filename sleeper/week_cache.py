@@ -0,0 +1,173 @@
+"""
+Immutable-Week Matchup Cache
+----------------------------
+
+Matchups for a week never change once the week is complete, so they only need
+to be downloaded once per season:
+- Weeks at or before ``latest_completed_week`` are frozen after their first
+  download and persisted to a JSON file, so a cold restart needs no network
+- The in-progress week (``latest_completed_week + 1``) is always fetched
+- Future weeks, rosters and users are refreshed on a slower TTL
+- The username → league_id resolution is persisted alongside frozen weeks
+
+Public API:
+  - WeekCache
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+CACHE_FORMAT_VERSION = 1
+
+
+class WeekCache:
+    """Disk-backed per-week matchup cache shared by every refresh cycle."""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        *,
+        slow_ttl: float = 600.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = str(path) if path else None
+        self.slow_ttl = slow_ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._leagues: Dict[str, dict] = {}
+        self._frozen: Dict[str, Dict[str, List[dict]]] = {}
+        # Volatile entries (in memory only): key → (fetched_at, payload)
+        self._volatile: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+        self._load()
+
+    # ——— League resolution ———
+
+    def resolve_league_id(self, client, username: str, season: str, league_name: str) -> Optional[str]:
+        """Return the league_id for ``league_name``, hitting the API only on first use."""
+        key = f"{username}/{season}/{league_name}"
+        with self._lock:
+            cached = self._leagues.get(key)
+        if cached:
+            return cached["league_id"]
+
+        user_id = client.get_user(username)["user_id"]
+        leagues = client.get_leagues(user_id, season)
+        league_id = next((L["league_id"] for L in leagues if L.get("name") == league_name), None)
+        if league_id:
+            with self._lock:
+                self._leagues[key] = {"league_id": league_id, "user_id": user_id}
+                self._save_locked()
+        return league_id
+
+    # ——— Rosters / users (slow TTL) ———
+
+    def get_rosters_and_users(self, client, league_id: str) -> Tuple[List[dict], List[dict]]:
+        now = self._clock()
+        with self._lock:
+            rosters = self._fresh((league_id, "rosters"), now)
+            users = self._fresh((league_id, "users"), now)
+        if rosters is not None and users is not None:
+            return rosters, users
+
+        rosters, users = client.get_rosters_and_users(league_id)
+        with self._lock:
+            self._volatile[(league_id, "rosters")] = (now, rosters)
+            self._volatile[(league_id, "users")] = (now, users)
+        return rosters, users
+
+    # ——— Matchups ———
+
+    def get_matchups(
+        self,
+        client,
+        league_id: str,
+        weeks: Iterable[int],
+        latest_completed_week: int,
+    ) -> Dict[int, List[dict]]:
+        """
+        Return ``{week: matchups}`` for the requested weeks, downloading (in one
+        parallel batch) only the live week, unfrozen completed weeks and stale
+        future weeks.
+        """
+        weeks = list(weeks)
+        live_week = latest_completed_week + 1
+        now = self._clock()
+
+        cached: Dict[int, List[dict]] = {}
+        to_fetch: List[int] = []
+        with self._lock:
+            frozen = self._frozen.get(league_id, {})
+            for wk in weeks:
+                if str(wk) in frozen:
+                    cached[wk] = frozen[str(wk)]
+                    continue
+                if wk > live_week:
+                    upcoming = self._fresh((league_id, f"matchups/{wk}"), now)
+                    if upcoming is not None:
+                        cached[wk] = upcoming
+                        continue
+                to_fetch.append(wk)
+
+        fetched = client.get_matchups_for_weeks(league_id, to_fetch) if to_fetch else {}
+
+        with self._lock:
+            newly_frozen = False
+            for wk, payload in fetched.items():
+                if wk <= latest_completed_week:
+                    self._frozen.setdefault(league_id, {})[str(wk)] = payload
+                    newly_frozen = True
+                elif wk > live_week:
+                    self._volatile[(league_id, f"matchups/{wk}")] = (now, payload)
+            if newly_frozen:
+                self._save_locked()
+
+        return {wk: cached[wk] if wk in cached else fetched[wk] for wk in weeks}
+
+    def frozen_weeks(self, league_id: str) -> List[int]:
+        with self._lock:
+            return sorted(int(wk) for wk in self._frozen.get(league_id, {}))
+
+    # ——— Internals ———
+
+    def _fresh(self, key: Tuple[str, str], now: float) -> Any:
+        entry = self._volatile.get(key)
+        if entry is None or now - entry[0] >= self.slow_ttl:
+            return None
+        return entry[1]
+
+    def _load(self) -> None:
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as fh:
+                data = json.load(fh)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Ignoring unreadable week cache {self.path}: {e}")
+            return
+        if data.get("version") != CACHE_FORMAT_VERSION:
+            return
+        self._leagues = data.get("leagues", {})
+        self._frozen = data.get("frozen", {})
+
+    def _save_locked(self) -> None:
+        """Atomically persist league resolution and frozen weeks (lock held)."""
+        if not self.path:
+            return
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        payload = {"version": CACHE_FORMAT_VERSION, "leagues": self._leagues, "frozen": self._frozen}
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".weeks-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(payload, fh, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Warning: Could not persist week cache {self.path}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
@@ -0,0 +1,48 @@
+import pytest
+
+from sleeper.stub import SleeperStubServer, build_synthetic_league
+
+
+@pytest.fixture
+def synthetic_league():
+    return build_synthetic_league(num_teams=12, seed=7)
+
+
+@pytest.fixture
+def sleeper_stub(synthetic_league):
+    """Local Sleeper API stand-in serving ``synthetic_league`` on 127.0.0.1."""
+    with SleeperStubServer(synthetic_league) as stub:
+        yield stub
+
+
+@pytest.fixture
+def app_module(sleeper_stub, monkeypatch, tmp_path):
+    """The Flask app module pointed at the stub server with an empty week cache."""
+    import app as app_module
+    from dashboard.leagues import LeagueScheduler
+    from dashboard.store import SQLiteStateStore
+    from sleeper.client import SleeperClient
+    from sleeper.players import PlayerRegistry
+    from sleeper.schedule import NflSchedule
+    from sleeper.week_cache import WeekCache
+
+    client = SleeperClient(sleeper_stub.base_url)
+    monkeypatch.setattr(app_module, "sleeper", client)
+    monkeypatch.setattr(app_module, "week_cache", WeekCache(tmp_path / "sleeper_weeks.json"))
+    players = PlayerRegistry(tmp_path / "sleeper_players.sqlite3", spawn=lambda download: download())
+    monkeypatch.setattr(app_module, "player_registry", players)
+    monkeypatch.setattr(app_module, "nfl_schedule", NflSchedule(tmp_path / "nfl_schedule.json", players=players))
+    monkeypatch.setattr(app_module, "SNAPSHOT_PATH", str(tmp_path / "data_snapshot.json"))
+    monkeypatch.setattr(app_module, "SHIPPED_SNAPSHOT_PATH", str(tmp_path / "shipped_snapshot.json"))
+    monkeypatch.setattr(app_module, "state_store", SQLiteStateStore(str(tmp_path / "dashboard_state.sqlite3")))
+    # A fresh default league: empty data, caches, counters and refresher
+    monkeypatch.setattr(app_module, "leagues", app_module.build_leagues([app_module.DEFAULT_LEAGUE]))
+    monkeypatch.setattr(app_module, "scheduler", LeagueScheduler(interval=app_module.POLL_INTERVAL_SECONDS))
+    monkeypatch.setattr(app_module, "client_leagues", {})
+    # Every full refresh now simulates odds in the background
+    monkeypatch.setattr(app_module, "SIMULATION_TRIALS", 500)
+    yield app_module
+    for league in app_module.leagues:
+        league.refresher.wait(timeout=10)
+        league.odds_builder.wait(timeout=10)
+    client.close()
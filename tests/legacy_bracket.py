@@ -0,0 +1,390 @@
+"""
+Reference implementation of the Quantum Gauntlet bracket builder as it
+stood before the roster-id engine: advancement is recovered by matching
+"(seed) Team" strings. Used only as an oracle by test_bracket.py.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List
+
+
+def fmt(x):
+    return f"{x:.2f}" if isinstance(x, (int, float)) else x
+
+
+def _label(t: dict) -> str:
+    return f"({t['orig_seed']}) {t['team']}"
+
+
+def _duel_payouts(margin: float):
+    """Duel of the Fates (winner, runner-up) payout for a winning margin."""
+    if margin <= 7.5:
+        return 60, 40
+    elif margin <= 15:
+        return 70, 30
+    elif margin <= 23.5:
+        return 80, 20
+    elif margin <= 30:
+        return 90, 10
+    return 100, 0
+
+
+def build_tournament_sections(
+    results: List[dict],
+    *,
+    project: Callable[[dict, int], float],
+    latest_completed_week: int,
+    current_time: str,
+) -> Dict[str, Any]:
+    """
+    Build every dashboard section from ``results`` (rows sorted by pre_total
+    with ``orig_seed`` assigned). Returns the sections in ``latest_data`` order,
+    without the top-level ``timestamp``.
+    """
+    # ——— IDENTIFY WILDCARD WINNER ———
+    wildcards = [r for r in results if 7 <= r["orig_seed"] <= 12]
+    wildcard_winner = max(wildcards, key=lambda r: r["wk14"]) if wildcards else None
+
+    # ——— ASSIGN ROUND 1 POSITIONS ———
+    for r in results:
+        seed = r["orig_seed"]
+        if seed <= 2:
+            r["position"] = "Bye"
+        elif seed <= 6:
+            r["position"] = "Playoff"
+        else:
+            r["position"] = "Wildcard Winner" if r is wildcard_winner else "Toliet Bowl"
+
+    # ——— BUILD LISTS ———
+    bye_list = [r for r in results if r["position"] == "Bye"]
+    playoff_list = sorted([r for r in results if r["position"] == "Playoff"], key=lambda r: r["wk14"], reverse=True)
+    wildcard_list = sorted([r for r in results if r["position"] in ("Wildcard Winner", "Toliet Bowl")],
+                           key=lambda r: r["wk14"], reverse=True)
+
+    # Week 14/15: Duel of the Fates is Seed #1 vs Seed #2 (seeds, not weekly scores)
+    bye_list_sorted = sorted(bye_list, key=lambda r: r["orig_seed"])
+    top_bye = bye_list_sorted[0] if len(bye_list_sorted) > 0 else None
+    low_bye = bye_list_sorted[1] if len(bye_list_sorted) > 1 else top_bye
+    playoff15 = [r for r in results if 3 <= r["orig_seed"] <= 6]
+    if wildcard_winner:
+        playoff15.append(wildcard_winner)
+    playoff15_sorted = sorted(playoff15, key=lambda r: r["wk15"], reverse=True)[:5]
+
+    # Combined Week14+15 (only for bye teams and wildcard losers)
+    for r in bye_list:
+        r["combined"] = r["wk14"] + r["wk15"]
+    for r in wildcard_list:
+        r["combined"] = r["wk14"] + r["wk15"]
+
+    # Divisional Round (Seeds 3-6 + wildcard winner): Week 15 ONLY (no aggregate)
+    playoff_comb = sorted(playoff15, key=lambda r: r["wk15"], reverse=True)[:5]
+    wild_comb_sorted = sorted([r for r in wildcard_list if r is not wildcard_winner],
+                              key=lambda r: r["combined"], reverse=True)[:5]
+
+    # Week16 lists - top 3 from Week 15 playoff advance
+    conf_list = bye_list + sorted(playoff_comb, key=lambda r: r["wk16"], reverse=True)[:3]
+    conf_sorted = sorted(conf_list, key=lambda r: r["wk16"], reverse=True)
+    # Purgatory: bottom 2 from playoff + second-best wildcard by wk16
+    purg_list = sorted(playoff_comb, key=lambda r: r["wk15"])[:2] + \
+        [sorted(wildcard_list, key=lambda r: r["wk16"], reverse=True)[1]]
+
+    # Week17 lists
+    conf_top3 = conf_sorted[:3]
+    conf_top3_sorted = sorted(conf_top3, key=lambda r: r["wk17"], reverse=True)
+    bottom2_conf16 = sorted(conf_list, key=lambda r: r["wk16"])[:2]
+
+    conf_purg_ids = {t["roster_id"] for t in conf_list + purg_list}
+    remaining_wild = [r for r in wildcard_list if r["roster_id"] not in conf_purg_ids]
+    toilet_list = sorted(remaining_wild, key=lambda r: r["wk15"])[:4]
+
+    toilet_top16 = sorted(toilet_list, key=lambda r: r["wk16"], reverse=True)[0] if toilet_list else None
+    purg17_list = purg_list + bottom2_conf16 + ([toilet_top16] if toilet_top16 else [])
+    exclude_ids = {t["roster_id"] for t in conf_top3 + purg17_list}
+    toilet_candidates = [r for r in wildcard_list if r["roster_id"] not in exclude_ids]
+    toilet_bottom3_16 = sorted(toilet_candidates, key=lambda r: r["wk16"])[:3]
+    toilet17_sorted = sorted(toilet_bottom3_16, key=lambda r: r["wk17"], reverse=True)
+
+    # ——— PAYOUTS ———
+    # For tournament display, show the week after the latest completed week
+    current_week_for_display = min(latest_completed_week + 1, 17)
+
+    # Weekly high scores (only for completed weeks 1-13)
+    weekly_winners = {}
+    for week in range(1, min(14, latest_completed_week + 1)):
+        week_scores = [(r['team'], r['all_weekly_scores'][week - 1]) for r in results]
+        # Only add if there are actual scores
+        if any(score > 0 for _, score in week_scores):
+            winner_team, winner_score = max(week_scores, key=lambda x: x[1])
+            weekly_winners[week] = {
+                'team': winner_team,
+                'score': winner_score,
+                'week': week,
+                'payout': 25,
+                'date': ''  # Can be populated with actual dates if needed
+            }
+
+    # Season high score (only if week 13 is complete)
+    season_high_score = None
+    if latest_completed_week >= 13:
+        season_high_team = max(results, key=lambda r: r['pre_total'])
+        season_high_score = {
+            'team': season_high_team['team'],
+            'totalScore': season_high_team['pre_total'],
+            'payout': 75,
+            'date': ''
+        }
+
+    # Duel of Fates (only if week 15 is complete)
+    duel_of_fates = {}
+    if latest_completed_week >= 15 and len(bye_list) >= 2:
+        bye_teams_sorted = sorted(bye_list, key=lambda r: r.get("combined", 0), reverse=True)
+        margin = abs(bye_teams_sorted[0].get("combined", 0) - bye_teams_sorted[1].get("combined", 0))
+        win_payout, lose_payout = _duel_payouts(margin)
+        duel_of_fates[bye_teams_sorted[0]['team']] = {
+            'team': bye_teams_sorted[0]['team'],
+            'payout': win_payout,
+            'category': 'Duel of the Fates Winner',
+            'date': ''
+        }
+        duel_of_fates[bye_teams_sorted[1]['team']] = {
+            'team': bye_teams_sorted[1]['team'],
+            'payout': lose_payout,
+            'category': 'Duel of the Fates Runner-up',
+            'date': ''
+        }
+
+    # Champion (only if week 17 is complete)
+    champion = None
+    if latest_completed_week >= 17 and conf_top3_sorted:
+        champion = {
+            'team': conf_top3_sorted[0]['team'],
+            'payout': 700,
+            'date': ''
+        }
+
+    payouts_data = {
+        'weeklyWinners': weekly_winners,
+        'seasonHighScore': season_high_score,
+        'duelOfFates': duel_of_fates,
+        'champion': champion,
+        'lastUpdated': current_time,
+        'currentWeek': latest_completed_week,  # For payout display (completed only)
+        'currentWeekInProgress': current_week_for_display  # For tournament display (includes in-progress)
+    }
+
+    # ——— ROW HELPERS ———
+    bye_ids = {t["roster_id"] for t in bye_list}
+    champion_id = conf_top3_sorted[0]["roster_id"] if conf_top3_sorted else None
+
+    def get_next_week_15(team):
+        if team["roster_id"] in bye_ids:
+            return "Conf Champ"
+        elif any(team["roster_id"] == t["roster_id"] for t in playoff15_sorted[:3]):
+            return "Conf Champ"
+        return "Purgatory"
+
+    def get_payout(team, current_week):
+        """Payout label for the Week 15 Duel of the Fates and the Week 17 champion"""
+        if current_week == 15:
+            if team["roster_id"] not in bye_ids:
+                return "$-"
+            if len(bye_list) >= 2:
+                bye_teams = sorted(bye_list, key=lambda r: r["combined"], reverse=True)
+                winner, loser = bye_teams[0], bye_teams[1]
+                win_payout, lose_payout = _duel_payouts(winner["combined"] - loser["combined"])
+                if team["roster_id"] == winner["roster_id"]:
+                    return f"${win_payout:.2f}"
+                elif team["roster_id"] == loser["roster_id"]:
+                    return f"${lose_payout:.2f}"
+            # Fallback for single team
+            return "$60.00" if top_bye is not None and team["roster_id"] == top_bye["roster_id"] else "$40.00"
+        elif current_week == 17:
+            return "$700.00" if team["roster_id"] == champion_id else "$-"
+        return "$-"
+
+    def projected(team, week):
+        return fmt(project(team, week))
+
+    # ——— STANDINGS ———
+    initial_standings = [
+        {'seed': idx, 'team': r['team'], 'position': r['position'], 'pre_total': fmt(r['pre_total'])}
+        for idx, r in enumerate(results, start=1)
+    ]
+    standings = [
+        {'seed': r['orig_seed'], 'team': r['team'], 'position': r['position'], 'pre_total': fmt(r['pre_total'])}
+        for r in results
+    ]
+
+    # ——— WEEK 14 ———
+    week14_data = {
+        'bye': [{'team': _label(top_bye), 'score': fmt(top_bye["wk14"])},
+                {'team': _label(low_bye), 'score': fmt(low_bye["wk14"])}],
+        'playoff': [{'team': _label(t), 'score': 'Bye Week'} for t in playoff_list[:4]],
+        'wildcard': [{'team': _label(t), 'score': fmt(t["wk14"])} for t in wildcard_list]
+    }
+
+    # ——— WEEK 15 ———
+    # Toilet bowl data for Week 15 (all wildcard teams except the winner)
+    toilet_bowl15 = [r for r in wildcard_list if r is not wildcard_winner]
+    # Divisional Round result logic - top 3 by Week 15 score only (no aggregate)
+    playoff_result_sorted = sorted(playoff_comb, key=lambda r: r["wk15"], reverse=True)
+
+    bye_result = []
+    for t in bye_list:
+        proj = projected(t, 15)
+        bye_result.append({
+            'team': _label(t),
+            'proj_score': proj,
+            'score': proj,
+            'next_week': get_next_week_15(t),
+            'payout': get_payout(t, 15)
+        })
+    week15_data = {
+        'bye': [{'team': _label(top_bye), 'score': fmt(top_bye["wk15"])},
+                {'team': _label(low_bye), 'score': fmt(low_bye["wk15"])}],
+        'playoff': [{'team': _label(t), 'score': fmt(t["wk15"])} for t in playoff15_sorted],
+        'toilet': [{'team': _label(t), 'score': fmt(t["wk15"])} for t in toilet_bowl15],
+        'bye_result': bye_result,
+        'playoff_result': [
+            {
+                'team': _label(t),
+                'proj_score': projected(t, 15),
+                'score': fmt(t["wk15"]),
+                'next_week': "Conf Champ" if idx < 3 else "Purgatory",
+                'payout': get_payout(t, 15)
+            } for idx, t in enumerate(playoff_result_sorted)
+        ],
+        'toilet_result': [
+            {
+                'team': _label(t),
+                'proj_score': projected(t, 15),
+                'score': fmt(t["combined"]),
+                'next_week': "Purgatory" if idx == 0 else "Toilet Bowl",
+                'payout': get_payout(t, 15)
+            } for idx, t in enumerate(wild_comb_sorted)
+        ]
+    }
+
+    # ——— WEEK 16 ———
+    # Rows are matched back to teams by their "(seed) Team" label
+    by_label = {_label(t): t for t in results}
+
+    def teams_with(rows, next_week):
+        return {by_label[r['team']]['roster_id'] for r in rows if r['next_week'] == next_week and r['team'] in by_label}
+
+    # Conference Championship: all Conf Champ teams, sorted by wk16 score
+    conf_champ_roster_ids = teams_with(week15_data['playoff_result'], 'Conf Champ') | \
+        teams_with(week15_data['bye_result'], 'Conf Champ')
+    conf_champ_sorted = sorted([t for t in results if t['roster_id'] in conf_champ_roster_ids],
+                               key=lambda t: t['wk16'], reverse=True)
+    conference_rows = [
+        {
+            'team': _label(t),
+            'proj_score': projected(t, 16),
+            'score': fmt(t['wk16']),
+            'next_week': 'Superbowl' if idx < 3 else 'Purgatory'
+        } for idx, t in enumerate(conf_champ_sorted)
+    ]
+
+    # Purgatory: all teams with Purgatory in next_week from BOTH week15 playoff_result and toilet_result
+    purgatory_roster_ids = teams_with(week15_data['playoff_result'], 'Purgatory') | \
+        teams_with(week15_data['toilet_result'], 'Purgatory')
+    purgatory_sorted = sorted([t for t in results if t['roster_id'] in purgatory_roster_ids],
+                              key=lambda t: t['wk16'], reverse=True)
+    purgatory_rows = [
+        {
+            'team': _label(t),
+            'proj_score': projected(t, 16),
+            'score': fmt(t['wk16']),
+            'next_week': 'Purgatory'
+        } for t in purgatory_sorted
+    ]
+
+    # Toilet Bowl: all teams from toilet_result except the top scorer (index 0)
+    toilet_bowl_roster_ids = {by_label[r['team']]['roster_id'] for r in week15_data['toilet_result'][1:]}
+    toilet_bowl_sorted = sorted([t for t in results if t['roster_id'] in toilet_bowl_roster_ids],
+                                key=lambda t: t['wk16'], reverse=True)
+    toilet_rows = [
+        {
+            'team': _label(t),
+            'proj_score': projected(t, 16),
+            'score': fmt(t['wk16']),
+            'next_week': 'Purgatory' if idx == 0 else 'Toilet Bowl'
+        } for idx, t in enumerate(toilet_bowl_sorted)
+    ]
+
+    week16_data = {
+        'conference': conference_rows,
+        'purgatory': purgatory_rows,
+        'toilet': toilet_rows
+    }
+
+    # ——— WEEK 17 ———
+    superbowl_labels = {r['team'] for r in conference_rows if r['next_week'] == 'Superbowl'}
+    purgatory17_labels = {r['team'] for r in conference_rows + purgatory_rows + toilet_rows
+                          if r['next_week'] == 'Purgatory'}
+    week17_data = {
+        'championship': [
+            {
+                'team': _label(t),
+                'proj_score': projected(t, 17),
+                'score': fmt(t["wk17"]),
+                'final_result': "Champion" if idx == 0 else "Purgatory",
+                'payout': get_payout(t, 17)
+            } for idx, t in enumerate(sorted([t for t in conf_champ_sorted if _label(t) in superbowl_labels],
+                                             key=lambda t: t['wk17'], reverse=True))
+        ],
+        'purgatory': [
+            {
+                'team': _label(t),
+                'proj_score': projected(t, 17),
+                'score': fmt(t["wk17"]),
+                'final_result': "Purgatory",
+                'payout': get_payout(t, 17)
+            } for t in sorted([t for t in results if _label(t) in purgatory17_labels],
+                              key=lambda t: t['wk17'], reverse=True)
+        ],
+        'toilet': [
+            {
+                'team': _label(t),
+                'proj_score': projected(t, 17),
+                'score': fmt(t["wk17"]),
+                'final_result': "Toilet Bowl",
+                'payout': get_payout(t, 17)
+            } for t in sorted(toilet17_sorted, key=lambda t: t['wk17'], reverse=True)
+        ]
+    }
+
+    return {
+        'payouts': payouts_data,
+        'week14': week14_data,
+        'week15': week15_data,
+        'week16': week16_data,
+        'week17': week17_data,
+        'standings': standings,
+        'initial_standings': initial_standings,
+        'the_run': {
+            'teams': [
+                {
+                    'team': r['team'],
+                    'seed': r['orig_seed'],
+                    'weekly_records': r['weekly_records'],
+                    'all_weekly_scores': r['all_weekly_scores'],
+                    'position': r['position'],
+                    'playoff_scores': {
+                        'wk14': r['wk14'],
+                        'wk15': r['wk15'],
+                        'wk16': r['wk16'],
+                        'wk17': r['wk17']
+                    }
+                } for r in results
+            ],
+            # Same section objects as above, not rebuilt copies
+            'playoff_results': {
+                'week15': week15_data,
+                'week16': week16_data,
+                'week17': week17_data
+            }
+        }
+    }
@@ -0,0 +1,312 @@
+import json
+import os
+import subprocess
+import sys
+import threading
+
+from app import compute_team_records
+from dashboard.state import apply_patch
+
+
+def test_refresh_downloads_each_week_once(app_module, sleeper_stub, synthetic_league):
+    app_module.fetch_playoff_data()
+
+    league_id = synthetic_league["league_id"]
+    matchup_calls = {p: n for p, n in sleeper_stub.requests.items() if "/matchups/" in p}
+    assert matchup_calls == {f"/v1/league/{league_id}/matchups/{wk}": 1 for wk in range(1, 18)}
+    # user + leagues + rosters + users + 17 weeks + the NFL schedule (not served: live-points states)
+    assert sleeper_stub.total_requests == 22
+    assert sleeper_stub.requests["/schedule/nfl/regular/2025"] == 1
+    assert app_module.leagues.default.latest_data["timestamp"]
+
+
+def test_team_records_from_prefetched_matchups():
+    matchups_by_week = {
+        1: [
+            {"roster_id": 1, "matchup_id": 1, "points": 100.0},
+            {"roster_id": 2, "matchup_id": 1, "points": 90.0},
+        ],
+        2: [
+            {"roster_id": 1, "matchup_id": 1, "points": 80.0},
+            {"roster_id": 2, "matchup_id": 1, "points": 95.0},
+        ],
+    }
+    records = compute_team_records(matchups_by_week, [1, 2], [1, 2])
+
+    assert (records[1]["wins"], records[1]["losses"]) == (1, 1)
+    assert records[2]["weekly_records"] == [
+        {"week": 1, "wins": 0, "losses": 1},
+        {"week": 2, "wins": 1, "losses": 1},
+    ]
+
+
+def test_steady_state_refresh_polls_only_the_live_week(app_module, sleeper_stub, monkeypatch):
+    monkeypatch.setattr(app_module.season_calendar, "latest_completed_week", lambda *a, **k: 14)
+    app_module.fetch_playoff_data()
+
+    sleeper_stub.reset_counters()
+    app_module.fetch_playoff_data()
+    assert [p.rsplit("/", 1)[-1] for p in sleeper_stub.requests] == ["15"]
+    assert sleeper_stub.total_requests == 1
+
+
+def test_unchanged_responses_skip_rebuild_and_broadcast(app_module, sleeper_stub, synthetic_league, monkeypatch):
+    emitted = []
+    monkeypatch.setattr(app_module.socketio, "emit", lambda event, *a, **k: emitted.append(event))
+    monkeypatch.setattr(app_module.season_calendar, "latest_completed_week", lambda *a, **k: 14)
+
+    app_module.fetch_playoff_data()
+    app_module.fetch_playoff_data()
+    assert app_module.leagues.default.refresh_stats == {"full_cycles": 1, "skipped_cycles": 1}
+    assert emitted.count("data_delta") == 1
+    assert set(emitted) == {"data_delta", "section_delta"}
+    emitted.clear()
+    assert sleeper_stub.not_modified == 1  # live week answered 304
+
+    synthetic_league["matchups"][15][0]["points"] += 1.5
+    app_module.fetch_playoff_data()
+    assert app_module.leagues.default.refresh_stats == {"full_cycles": 2, "skipped_cycles": 1}
+    assert emitted.count("data_delta") == 1
+
+
+def test_socket_clients_get_snapshot_then_deltas(app_module, synthetic_league, monkeypatch):
+    monkeypatch.setattr(app_module.season_calendar, "latest_completed_week", lambda *a, **k: 14)
+    app_module.fetch_playoff_data()
+
+    client = app_module.socketio.test_client(app_module.app)
+    received = client.get_received()
+    assert [m["name"] for m in received] == ["data_update"]
+    snapshot = received[0]["args"][0]
+    assert snapshot["version"] == app_module.leagues.default.live_state.version == 1
+    assert snapshot["week15"] == app_module.leagues.default.latest_data["week15"]
+
+    synthetic_league["matchups"][15][0]["points"] += 3.0
+    app_module.fetch_playoff_data()
+    received = client.get_received()
+    assert [m["name"] for m in received] == ["data_delta"]
+    delta = received[0]["args"][0]
+    assert (delta["base_version"], delta["version"]) == (1, 2)
+    assert "the_run" in delta["sections"] and "standings" not in delta["sections"]
+
+    client.emit("request_snapshot")
+    received = client.get_received()
+    assert received[0]["name"] == "data_update"
+    assert received[0]["args"][0]["version"] == 2
+    client.disconnect()
+
+
+def test_projection_memo_reuses_unchanged_rosters(app_module, synthetic_league, monkeypatch):
+    monkeypatch.setattr(app_module.season_calendar, "latest_completed_week", lambda *a, **k: 14)
+    app_module.fetch_playoff_data()
+    first = dict(app_module.leagues.default.projection_memo.stats["last"])
+    assert first["misses"] > 0
+
+    # One live stat change on roster 1 invalidates only projections that read it
+    row = synthetic_league["matchups"][15][0]
+    player_id = row["starters"][0]
+    row["players_points"][player_id] += 4.0
+    row["points"] += 4.0
+    app_module.fetch_playoff_data()
+    second = app_module.leagues.default.projection_memo.stats["last"]
+    assert second["hits"] > first["hits"]
+    assert 0 < second["misses"] < first["misses"]
+
+    # Memoized output matches a rebuild from scratch
+    memoized = {k: v for k, v in app_module.leagues.default.latest_data.items() if k != "timestamp"}
+    app_module.leagues.default.projection_memo.clear()
+    app_module.leagues.default.fingerprint = None
+    app_module.fetch_playoff_data()
+    assert {k: v for k, v in app_module.leagues.default.latest_data.items() if k != "timestamp"} == memoized
+
+    stats = app_module.app.test_client().get("/api/stats").get_json()
+    assert stats["projection"] == app_module.leagues.default.projection_memo.stats
+
+
+def test_live_change_reselects_only_changed_players(app_module, synthetic_league, monkeypatch):
+    monkeypatch.setattr(app_module.season_calendar, "latest_completed_week", lambda *a, **k: 14)
+    app_module.fetch_playoff_data()
+    week15 = app_module.leagues.default.projection_states[15][1]
+    before = dict(week15.stats)
+
+    row = synthetic_league["matchups"][15][0]
+    row["players_points"][row["starters"][0]] += 2.0
+    row["points"] += 2.0
+    app_module.fetch_playoff_data()
+
+    assert app_module.leagues.default.projection_states[15][1] is week15
+    assert week15.stats == {"forecasts": before["forecasts"], "selections": before["selections"] + 1}
+
+
+def test_cold_connect_answers_warming_without_fetching_inline(app_module, sleeper_stub, monkeypatch):
+    release = threading.Event()
+    fetch = app_module.fetch_playoff_data
+
+    def slow_fetch(league=None):
+        release.wait(5)
+        fetch(league)
+
+    monkeypatch.setattr(app_module, "fetch_playoff_data", slow_fetch)
+    clients = [app_module.socketio.test_client(app_module.app) for _ in range(3)]
+    for client in clients:
+        assert [m["name"] for m in client.get_received()] == ["status"]
+    assert sleeper_stub.total_requests == 0
+    assert app_module.leagues.default.refresher.running
+
+    release.set()
+    assert app_module.leagues.default.refresher.wait(timeout=10)
+    assert app_module.leagues.default.refresher.stats["runs"] == 1
+    assert app_module.leagues.default.refresh_stats["full_cycles"] == 1
+    for client in clients:
+        received = client.get_received()
+        snapshots = [m["args"][0] for m in received if m["name"] == "data_update"]
+        assert snapshots and snapshots[-1]["version"] == 1
+        client.disconnect()
+
+
+def test_sectioned_clients_receive_only_subscribed_sections(app_module, synthetic_league, monkeypatch):
+    monkeypatch.setattr(app_module.season_calendar, "latest_completed_week", lambda *a, **k: 14)
+    app_module.fetch_playoff_data()
+
+    client = app_module.socketio.test_client(app_module.app, auth={"sections": True})
+    legacy = app_module.socketio.test_client(app_module.app)
+    assert client.get_received() == []  # no full snapshot for sectioned clients
+    legacy.get_received()
+
+    client.emit("subscribe", {"sections": ["week15", "standings"]})
+    (update,) = client.get_received()
+    assert update["name"] == "sections_update"
+    sections = update["args"][0]["sections"]
+    assert set(sections) == {"week15", "standings"}
+    assert sections["week15"]["data"] == app_module.leagues.default.latest_data["week15"]
+    week15 = sections["week15"]
+
+    row = synthetic_league["matchups"][15][0]
+    row["points"] += 3.0
+    app_module.fetch_playoff_data()
+    received = client.get_received()
+    assert [m["name"] for m in received] == ["section_delta"]
+    delta = received[0]["args"][0]
+    assert delta["name"] == "week15"
+    assert (delta["base_version"], delta["version"]) == (week15["version"], week15["version"] + 1)
+    assert apply_patch(week15["data"], delta["ops"]) == app_module.leagues.default.latest_data["week15"]
+    assert [m["name"] for m in legacy.get_received()] == ["data_delta"]
+
+    # The Run is only sent once its tab subscribes
+    client.emit("subscribe", {"sections": ["the_run"]})
+    (update,) = client.get_received()
+    assert update["args"][0]["sections"]["the_run"]["data"] == app_module.leagues.default.latest_data["the_run"]
+    client.disconnect()
+    legacy.disconnect()
+
+
+def test_section_endpoint_is_versioned_and_cached(app_module, synthetic_league, monkeypatch):
+    monkeypatch.setattr(app_module.season_calendar, "latest_completed_week", lambda *a, **k: 14)
+    app_module.fetch_playoff_data()
+    http = app_module.app.test_client()
+
+    first = http.get("/api/data/week16")
+    body = first.get_json()
+    assert body == {"name": "week16", "version": 1, "data": json.loads(json.dumps(app_module.leagues.default.latest_data["week16"]))}
+    assert http.get("/api/data/week16", headers={"If-None-Match": first.headers["ETag"]}).status_code == 304
+    assert http.get("/api/data/nope").status_code == 404
+
+    synthetic_league["matchups"][15][0]["points"] += 3.0
+    app_module.fetch_playoff_data()
+    # week16 did not change: same version, same cached document
+    assert http.get("/api/data/week16", headers={"If-None-Match": first.headers["ETag"]}).status_code == 304
+    assert app_module.leagues.default.section_documents["week16"].stats == {"encodes": 1, "hits": 2}
+    assert http.get("/api/data/week15").get_json()["version"] == 2
+
+
+def test_background_tasks_start_once_per_process(app_module, monkeypatch):
+    started = []
+    monkeypatch.setattr(app_module.socketio, "start_background_task", lambda target: started.append(target))
+    monkeypatch.setattr(app_module, "_background_pid", None)
+
+    assert app_module.socketio.async_mode == "threading"
+    assert app_module.start_background_tasks() is True
+    assert app_module.start_background_tasks() is False
+    assert started == [app_module.background_update]
+
+    # A forked worker inherits the flag but must start its own loop
+    monkeypatch.setattr(app_module.os, "getpid", lambda: -1)
+    assert app_module.start_background_tasks() is True
+    assert len(started) == 2
+
+
+def test_followers_adopt_the_leaders_version_without_crawling(app_module, sleeper_stub, monkeypatch):
+    monkeypatch.setattr(app_module, "LEADER_ELECTION", True)
+    monkeypatch.setattr(app_module.season_calendar, "latest_completed_week", lambda *a, **k: 14)
+    monkeypatch.setattr(app_module.idp_scoring, "refresh_if_stale", lambda: False)
+
+    # No lease holder yet: this worker becomes leader, crawls and publishes
+    assert 0 < app_module.background_cycle() <= app_module.POLL_INTERVAL_SECONDS
+    assert app_module.state_store.version("default") == app_module.leagues.default.live_state.version == 1
+    # Adopted exactly, integer week keys included (no JSON-stringified keys to cause spurious deltas)
+    published = app_module.leagues.default.live_state.snapshot()
+    requests_after_leader = sleeper_stub.total_requests
+
+    # A second worker: its own identity and an empty local state
+    monkeypatch.setattr(app_module, "worker_id", lambda: "other-host:2")
+    monkeypatch.setattr(app_module, "leagues", app_module.build_leagues([app_module.DEFAULT_LEAGUE]))
+
+    assert app_module.background_cycle() == app_module.FOLLOWER_POLL_SECONDS
+    assert sleeper_stub.total_requests == requests_after_leader
+    assert app_module.leagues.default.live_state.snapshot() == published
+    served = app_module.app.test_client().get("/api/data").get_json()
+    assert served == json.loads(json.dumps(app_module.leagues.default.latest_data))
+    stats = app_module.app.test_client().get("/api/stats").get_json()["state_store"]
+    assert stats["leader"] != stats["worker"] and stats["version"] == stats["stored_version"] == 1
+
+
+def test_cold_follower_leaves_the_crawl_to_the_leader(app_module, sleeper_stub, monkeypatch):
+    monkeypatch.setattr(app_module, "LEADER_ELECTION", True)
+    assert app_module.state_store.acquire_leadership("other-host:2", ttl=180)
+    client = app_module.socketio.test_client(app_module.app)
+    assert [m["name"] for m in client.get_received()] == ["status"]
+    assert not app_module.leagues.default.refresher.running
+    assert app_module.leagues.default.refresher.stats["runs"] == 0 and sleeper_stub.total_requests == 0
+
+    # Once the leader publishes, a resync request is answered from the store
+    app_module.state_store.publish(
+        "default",
+        app_module.StoredState(4, {"timestamp": 4}, {"timestamp": "12/21/2025 13:00 CST", "standings": []}),
+    )
+    client.emit("request_snapshot")
+    snapshot = [m["args"][0] for m in client.get_received() if m["name"] == "data_update"][-1]
+    assert snapshot["version"] == 4 and snapshot["timestamp"] == "12/21/2025 13:00 CST"
+    client.disconnect()
+
+
+def test_restarted_worker_takes_over_its_predecessors_lease(app_module, monkeypatch):
+    monkeypatch.setattr(app_module, "LEADER_ELECTION", True)
+    monkeypatch.setattr(app_module.idp_scoring, "refresh_if_stale", lambda: False)
+    monkeypatch.setattr(app_module.scheduler, "run_due", lambda leagues: 60)
+    host = app_module.socket.gethostname()
+    # A live process of this host, and one on another host, keep their leases
+    for owner in (f"{host}:{os.getppid()}", "other-host:2"):
+        assert app_module.state_store.acquire_leadership(owner, ttl=180)
+        assert app_module.background_cycle() == app_module.FOLLOWER_POLL_SECONDS
+        app_module.state_store.release_leadership(owner)
+
+    # The previous process of this host is gone: no need to wait out its lease
+    dead = subprocess.Popen([sys.executable, "-c", "pass"])
+    dead.wait()
+    assert app_module.state_store.acquire_leadership(f"{host}:{dead.pid}", ttl=180)
+    assert app_module.background_cycle() == 60
+    assert app_module.state_store.leader() == app_module.worker_id()
+
+    # Exiting hands the lease over
+    app_module.release_refresh_lease()
+    assert app_module.state_store.leader() is None
+
+
+def test_lone_worker_skips_the_election(app_module, monkeypatch):
+    monkeypatch.setattr(app_module, "LEADER_ELECTION", False)
+    monkeypatch.setattr(app_module.idp_scoring, "refresh_if_stale", lambda: False)
+    monkeypatch.setattr(app_module.scheduler, "run_due", lambda leagues: 60)
+    # A lease left in the store by an earlier multi-worker run is ignored
+    assert app_module.state_store.acquire_leadership("other-host:2", ttl=180)
+    assert not app_module.refresh_leader_elsewhere()
+    assert app_module.background_cycle() == 60
+    assert app_module.state_store.leader() == "other-host:2"
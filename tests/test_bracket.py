@@ -0,0 +1,101 @@
+import copy
+import json
+import random
+from collections import Counter
+
+import pytest
+
+from legacy_bracket import build_tournament_sections as legacy_build_tournament_sections
+from tournament.bracket import build_tournament_sections, resolve_bracket, teams_from_results
+
+
+def _results(num_teams=12, seed=0, played_through=17):
+    rng = random.Random(seed)
+    results = []
+    for rid in range(1, num_teams + 1):
+        # Unplayed weeks are 0.0 for everyone, which exercises tie ordering
+        weekly = [round(rng.uniform(60, 160), 2) if wk <= played_through else 0.0 for wk in range(1, 18)]
+        results.append({
+            "roster_id": rid,
+            "team": f"Team {rid}",
+            "pre_total": sum(weekly[:13]),
+            "wk14": weekly[13], "wk15": weekly[14], "wk16": weekly[15], "wk17": weekly[16],
+            "weekly_records": [],
+            "all_weekly_scores": weekly,
+        })
+    results.sort(key=lambda r: r["pre_total"], reverse=True)
+    for idx, r in enumerate(results, start=1):
+        r["orig_seed"] = idx
+    return results
+
+
+def test_sections_are_built_once_and_shared_with_the_run():
+    calls = Counter()
+
+    def project(roster_id, week):
+        calls[(roster_id, week)] += 1
+        return 100.0
+
+    sections = build_tournament_sections(
+        _results(), project=project, latest_completed_week=17, current_time="12/30/2025 10:00 CST"
+    )
+
+    playoff_results = sections["the_run"]["playoff_results"]
+    for week in ("week15", "week16", "week17"):
+        assert playoff_results[week] is sections[week]
+    projected_rows = sum(
+        len(rows) for week in ("week15", "week16", "week17")
+        for key, rows in sections[week].items() if rows and "proj_score" in rows[0]
+    )
+    # One projection per displayed row (week 17 is no longer computed twice)
+    assert sum(calls.values()) == projected_rows
+
+
+def test_payouts_follow_completed_weeks():
+    sections = build_tournament_sections(
+        _results(seed=4), project=lambda t, w: 0.0, latest_completed_week=15, current_time=""
+    )
+    payouts = sections["payouts"]
+
+    assert sorted(payouts["weeklyWinners"]) == list(range(1, 14))
+    assert payouts["seasonHighScore"]["payout"] == 75
+    assert sorted(p["payout"] for p in payouts["duelOfFates"].values()) in ([40, 60], [30, 70], [20, 80], [10, 90], [0, 100])
+    assert payouts["champion"] is None
+    assert payouts["currentWeekInProgress"] == 16
+    champion_rows = [r for r in sections["week17"]["championship"] if r["final_result"] == "Champion"]
+    assert len(champion_rows) == 1
+
+
+def test_resolve_bracket_indexes_rounds_by_roster_id():
+    bracket = resolve_bracket(teams_from_results(_results(seed=9)))
+
+    assert bracket.rounds["bye"] == bracket.rounds["seeded"][:2]
+    assert bracket.wildcard_winner in bracket.members["divisional"]
+    assert bracket.members["conference"] == bracket.members["bye"] | set(bracket.rounds["divisional"][:3])
+    assert bracket.champion in bracket.members["conference"]
+    assert bracket.teams[bracket.wildcard_winner].position == "Wildcard Winner"
+    # Every week 16 team lands in exactly one Week 16 round
+    week16 = [bracket.members[name] for name in ("conference", "purgatory16", "toilet16")]
+    assert sum(len(m) for m in week16) == len(set().union(*week16))
+
+
+@pytest.mark.parametrize("case", range(60))
+def test_engine_matches_string_matching_builder(case):
+    rng = random.Random(case)
+    num_teams = rng.choice([8, 10, 12, 12, 14, 20, 32])
+    played_through = rng.choice([13, 14, 15, 16, 17])
+    latest_completed_week = rng.choice([12, 13, 14, 15, 16, 17])
+    results = _results(num_teams, seed=case, played_through=played_through)
+    if case % 3 == 0:
+        # Duplicate team names must not confuse advancement
+        for r in results[::4]:
+            r["team"] = "Same Name"
+    projections = {(r["roster_id"], wk): round(rng.uniform(50, 150), 2) for r in results for wk in (15, 16, 17)}
+    kwargs = dict(latest_completed_week=latest_completed_week, current_time="01/01/2026 00:00 CST")
+
+    expected = legacy_build_tournament_sections(
+        copy.deepcopy(results), project=lambda row, wk: projections[(row["roster_id"], wk)], **kwargs
+    )
+    actual = build_tournament_sections(results, project=lambda rid, wk: projections[(rid, wk)], **kwargs)
+
+    assert json.dumps(actual) == json.dumps(expected)
@@ -0,0 +1,90 @@
+import pytest
+
+from projection.breakdowns import BreakdownStore, breakdown_document
+from projection.quantum_gauntlet import PlayerProjection, RosterProjection
+from sleeper.players import Player
+
+
+def _projection(roster_id, total):
+    rows = [
+        PlayerProjection("4046", 12.5, 20.1, "IN_PROGRESS", 20.1, "in_progress & live < forecast → forecast"),
+        PlayerProjection("NYJ", 3.0, 6.0, "FINISHED", 3.0, "finished → final live"),
+    ]
+    return RosterProjection(roster_id=roster_id, starters_breakdown=rows, projected_total=total)
+
+
+def test_store_serves_only_completed_refreshes():
+    store = BreakdownStore()
+    store.record(("key", 1), _projection(1, 23.1), 15)
+    assert store.get(1, 15) is None  # not published yet
+    store.publish(3)
+    assert store.get(1, 15)[0] == ("key", 1) and store.version == 3
+
+    # A refresh that fails halfway leaves version 3 in place
+    store.record(("key", 2), _projection(1, 30.0), 15)
+    store.discard()
+    store.publish(4)
+    assert store.get(1, 15) is None and store.stats == {"publishes": 2, "entries": 0}
+
+
+def test_breakdown_document_names_known_players():
+    players = {"4046": Player("4046", "Jalen Hurts", "QB", "PHI", "Active")}
+    doc = breakdown_document(_projection(7, 23.1), 15, players)
+    assert doc["roster_id"] == 7 and doc["week"] == 15 and doc["projected_total"] == 23.1
+    hurts, unknown = doc["starters"]
+    assert (hurts["name"], hurts["position"], hurts["nfl_team"]) == ("Jalen Hurts", "QB", "PHI")
+    assert hurts["chosen_points"] == 20.1 and hurts["game_state"] == "IN_PROGRESS"
+    assert (unknown["name"], unknown["nfl_team"]) == ("NYJ", "")
+
+
+@pytest.fixture
+def refreshed(app_module, monkeypatch):
+    monkeypatch.setattr(app_module.season_calendar, "latest_completed_week", lambda *a, **k: 14)
+    app_module.fetch_playoff_data()
+    return app_module
+
+
+def test_projection_endpoint_serves_the_broadcast_totals(refreshed, synthetic_league):
+    league = refreshed.leagues.default
+    client = refreshed.app.test_client()
+    name_to_roster = {name: rid for rid, name in league.team_names.items()}
+    week15 = {
+        name_to_roster[row["team"].split(") ", 1)[-1]]: float(row["proj_score"])
+        for rows in league.latest_data["week15"].values()
+        for row in rows
+        if "proj_score" in row
+    }
+    assert week15
+
+    starters = {m["roster_id"]: m["starters"] for m in synthetic_league["matchups"][15]}
+    for roster_id, total in week15.items():
+        doc = client.get(f"/api/projection/{roster_id}/15").get_json()
+        assert doc["projected_total"] == total
+        assert [row["player_id"] for row in doc["starters"]] == starters[roster_id]
+        assert sum(row["chosen_points"] for row in doc["starters"]) == pytest.approx(total, abs=0.05)
+    # Only the totals are broadcast
+    assert "starters" not in str(league.latest_data)
+
+    assert client.get("/api/projection/999/15").status_code == 404
+    assert client.get("/api/projection/1/3").status_code == 404
+    assert client.get("/api/leagues/nope/projection/1/15").status_code == 404
+    roster_id = next(iter(week15))
+    assert client.get(f"/api/leagues/default/projection/{roster_id}/15").get_json()["projected_total"] == week15[roster_id]
+
+
+def test_unchanged_projections_are_not_reserialized(refreshed):
+    league = refreshed.leagues.default
+    client = refreshed.app.test_client()
+    roster_id = next(rid for rid in league.team_names if league.projection_breakdowns.get(rid, 15))
+    url = f"/api/projection/{roster_id}/15"
+
+    first = client.get(url)
+    assert client.get(url, headers={"If-None-Match": first.headers["ETag"]}).status_code == 304
+
+    # A forced rebuild publishes a new version with the same memoized projection
+    league.fingerprint = None
+    refreshed.fetch_playoff_data()
+    assert league.projection_breakdowns.stats["publishes"] == 2
+    again = client.get(url)
+    assert again.headers["ETag"] == first.headers["ETag"]
+    assert league.breakdown_documents[(roster_id, 15)].stats == {"encodes": 1, "hits": 2}
@@ -0,0 +1,80 @@
+import copy
+import random
+
+from dashboard.state import VersionedState, apply_patch, json_diff
+
+
+def _sample():
+    return {
+        "timestamp": "12/14/2025 13:05 CST",
+        "week15": {
+            "bye": [{"team": "(1) Alpha", "score": "101.20"}, {"team": "(2) Beta", "score": "88.00"}],
+            "playoff": [{"team": "(3) Gamma", "score": "75.10"}],
+        },
+        "payouts": {"weeklyWinners": {"1": {"team": "Alpha", "payout": 25}}, "champion": None},
+        "the_run": {"teams": [{"team": "Alpha", "all_weekly_scores": [1.0, 2.0, 3.0]}]},
+    }
+
+
+def test_delta_contains_only_changed_sections():
+    state = VersionedState(_sample())
+    new = _sample()
+    new["timestamp"] = "12/14/2025 13:06 CST"
+    new["week15"]["bye"][0]["score"] = "104.70"
+
+    delta = state.update(new)
+
+    assert delta["version"] == 1 and delta["base_version"] == 0
+    assert set(delta["sections"]) == {"timestamp", "week15"}
+    assert delta["sections"]["week15"] == [{"op": "replace", "path": "/bye/0/score", "value": "104.70"}]
+    assert state.update(copy.deepcopy(new)) is None
+    assert state.snapshot()["version"] == 1
+
+
+def test_applying_deltas_reproduces_every_snapshot():
+    rng = random.Random(3)
+    state = VersionedState(_sample())
+    client = copy.deepcopy(state.snapshot())
+
+    for _ in range(50):
+        new = copy.deepcopy(state.data)
+        new["timestamp"] = str(rng.random())
+        new["week15"]["playoff"] = [{"team": f"({i}) T{i}", "score": str(rng.random())} for i in range(rng.randint(1, 4))]
+        new["payouts"]["weeklyWinners"][str(rng.randint(1, 13))] = {"team": "x/y~z", "payout": 25}
+        if rng.random() < 0.3:
+            new["payouts"].pop("champion", None)
+        new["the_run"]["teams"][0]["all_weekly_scores"][rng.randrange(3)] = rng.random()
+
+        delta = state.update(new)
+        assert delta["base_version"] == client["version"]
+        for name, ops in delta["sections"].items():
+            client[name] = apply_patch(client.get(name), ops)
+        client["version"] = delta["version"]
+        assert client == state.snapshot()
+
+
+def test_json_diff_escapes_keys_and_replaces_resized_lists():
+    ops = json_diff({"a/b": 1, "l": [1, 2]}, {"a/b": 2, "l": [1, 2, 3]})
+    assert ops == [
+        {"op": "replace", "path": "/a~1b", "value": 2},
+        {"op": "replace", "path": "/l", "value": [1, 2, 3]},
+    ]
+
+
+def test_sections_are_versioned_independently():
+    state = VersionedState(_sample())
+    assert state.section("week15") == (0, state.data["week15"])
+    assert state.section("week16") == (0, None)
+
+    new = _sample()
+    new["week15"]["bye"][0]["score"] = "90.00"
+    assert state.update(new)["section_versions"] == {"week15": 1}
+
+    newer = copy.deepcopy(new)
+    newer["week15"]["playoff"] = []
+    newer["week16"] = {"bye": []}
+    delta = state.update(newer)
+    assert delta["version"] == 2
+    assert delta["section_versions"] == {"week15": 2, "week16": 1}
+    assert state.section("the_run")[0] == 0
+    assert state.section("week16") == (1, {"bye": []})
@@ -0,0 +1,132 @@
+import threading
+
+import gspread
+
+from dashboard.idp import IdpScoringCache, build_idp_payload
+
+
+class FakeWorksheet:
+    def __init__(self, values, *, gate=None):
+        self.values = values
+        self.calls = 0
+        self.gate = gate
+        self.error = None
+
+    def get_all_values(self):
+        self.calls += 1
+        if self.gate is not None:
+            self.gate.wait(5)
+        if self.error is not None:
+            raise self.error
+        return [list(row) for row in self.values]
+
+
+class FakeSpreadsheet:
+    def __init__(self, worksheet=None):
+        self.sheet = worksheet
+
+    def worksheet(self, name):
+        assert name == "IDP Scoring"
+        if self.sheet is None:
+            raise gspread.exceptions.WorksheetNotFound(name)
+        return self.sheet
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _sync(target):
+    target()
+
+
+SHEET = [["Stat", "Points"], ["Sack", "4"], ["Tackle"]]
+
+
+def test_payload_matches_the_sheet_shape():
+    assert build_idp_payload(FakeSpreadsheet(FakeWorksheet(SHEET))) == {
+        "success": True,
+        "headers": ["Stat", "Points"],
+        "data": [{"Stat": "Sack", "Points": "4"}, {"Stat": "Tackle", "Points": ""}],
+    }
+    assert build_idp_payload(None)["error"] == "Google Sheets connection not available"
+    assert build_idp_payload(FakeSpreadsheet())["error"] == "IDP Scoring worksheet not found"
+    assert build_idp_payload(FakeSpreadsheet(FakeWorksheet([])))["success"] is False
+
+
+def test_stale_while_revalidate_and_failed_reload_keeps_good_data():
+    sheet = FakeWorksheet(SHEET)
+    clock = FakeClock()
+    cache = IdpScoringCache(lambda: build_idp_payload(FakeSpreadsheet(sheet)), ttl=300, clock=clock, spawn=_sync)
+
+    doc = cache.get()
+    assert doc.source["success"] and sheet.calls == 1
+    for _ in range(10):
+        assert cache.get() is doc
+    assert sheet.calls == 1
+
+    clock.now += 301
+    sheet.values = SHEET + [["Interception", "6"]]
+    assert cache.get() is doc  # stale copy served; reload ran in the "background"
+    assert sheet.calls == 2
+    assert len(cache.get().source["data"]) == 3
+
+    clock.now += 301
+    sheet.error = RuntimeError("quota exceeded")
+    good = cache.get()
+    assert good.source["success"] and len(good.source["data"]) == 3
+    assert cache.get() is good
+    assert cache.stats["failed_loads"] == 1
+    assert cache.refresh_if_stale() is False  # retried only after another TTL
+    clock.now += 301
+    assert cache.refresh_if_stale() is True
+    assert sheet.calls == 4
+
+
+def test_cold_burst_reads_the_sheet_once():
+    gate = threading.Event()
+    sheet = FakeWorksheet(SHEET, gate=gate)
+    cache = IdpScoringCache(lambda: build_idp_payload(FakeSpreadsheet(sheet)), ttl=300)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get())) for _ in range(8)]
+    for t in threads:
+        t.start()
+    gate.set()
+    for t in threads:
+        t.join(5)
+
+    assert sheet.calls == 1
+    assert len(results) == 8 and len({id(doc) for doc in results}) == 1
+    assert cache.stats["cold"] == 8 and cache.stats["loads"] == 1
+
+
+def test_endpoint_serves_cached_body_with_etag(app_module, monkeypatch):
+    sheet = FakeWorksheet(SHEET)
+    monkeypatch.setattr(app_module, "spreadsheet", FakeSpreadsheet(sheet))
+    monkeypatch.setattr(
+        app_module,
+        "idp_scoring",
+        IdpScoringCache(lambda: build_idp_payload(app_module.spreadsheet), ttl=300, spawn=_sync),
+    )
+    http = app_module.app.test_client()
+
+    first = http.get("/api/idp-scoring")
+    assert first.get_json()["data"][0] == {"Stat": "Sack", "Points": "4"}
+    for _ in range(20):
+        assert http.get("/api/idp-scoring").status_code == 200
+    assert http.get("/api/idp-scoring", headers={"If-None-Match": first.headers["ETag"]}).status_code == 304
+    assert sheet.calls == 1
+    assert http.get("/api/stats").get_json()["idp_scoring"]["fresh"] == 21
+
+
+def test_endpoint_reports_missing_connection(app_module, monkeypatch):
+    monkeypatch.setattr(app_module, "spreadsheet", None)
+    monkeypatch.setattr(
+        app_module, "idp_scoring", IdpScoringCache(lambda: build_idp_payload(app_module.spreadsheet), spawn=_sync)
+    )
+    body = app_module.app.test_client().get("/api/idp-scoring").get_json()
+    assert body == {"success": False, "error": "Google Sheets connection not available"}
@@ -0,0 +1,159 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from dashboard.leagues import LeagueConfig, LeagueRegistry, LeagueScheduler, load_league_configs
+from sleeper.stub import SleeperStubServer, build_synthetic_league
+
+SECOND_LEAGUE_ID = "200000000000000002"
+
+
+@pytest.fixture
+def second_league():
+    return build_synthetic_league(
+        num_teams=10, seed=3, league_id=SECOND_LEAGUE_ID, league_name="The Second League"
+    )
+
+
+@pytest.fixture
+def sleeper_stub(synthetic_league, second_league):
+    """One user with two leagues on the stub."""
+    with SleeperStubServer([synthetic_league, second_league]) as stub:
+        yield stub
+
+
+@pytest.fixture
+def two_leagues(app_module, monkeypatch):
+    second = LeagueConfig(key="second", username="LactatingLtinas", league_name="The Second League")
+    monkeypatch.setattr(app_module, "leagues", app_module.build_leagues([app_module.DEFAULT_LEAGUE, second]))
+    return app_module.leagues
+
+
+class FakeLeague:
+    def __init__(self, key, runs, clock=None, duration=0.0):
+        self.key = key
+
+        def run():
+            runs.append(key)
+            if clock is not None:
+                clock[0] += duration
+
+        self.refresher = SimpleNamespace(run=run)
+
+
+def test_league_configs_load_from_file_and_validate(tmp_path):
+    default = LeagueConfig(key="default", league_id="1")
+    assert load_league_configs(None, default=default) == [default]
+
+    path = tmp_path / "leagues.json"
+    path.write_text(json.dumps([
+        {"key": "main", "username": "someone", "league_name": "Main League", "season": 2025},
+        {"league_id": 42},
+    ]))
+    main, other = load_league_configs(str(path), default=default)
+    assert main == LeagueConfig(key="main", username="someone", league_name="Main League", season="2025")
+    assert other.key == other.league_id == "42"
+
+    path.write_text(json.dumps([{"league_id": "42"}, {"key": "42", "league_id": "43"}]))
+    with pytest.raises(ValueError, match="Duplicate"):
+        load_league_configs(str(path), default=default)
+    with pytest.raises(ValueError, match="needs"):
+        LeagueConfig.from_dict({"key": "main", "username": "someone"})
+
+
+def test_registry_finds_leagues_by_key_or_league_id():
+    a, b = SimpleNamespace(key="default", league_id="1"), SimpleNamespace(key="b", league_id=None)
+    registry = LeagueRegistry([a, b])
+    assert registry.default is a and len(registry) == 2 and list(registry) == [a, b]
+    assert registry.get("b") is b and registry.get("1") is a
+    assert registry.get("2") is None and registry.get(None) is None
+    b.league_id = "2"  # resolved on its first refresh
+    assert registry.get("2") is b
+    with pytest.raises(ValueError):
+        registry.add(SimpleNamespace(key="b", league_id=None))
+
+
+def test_scheduler_staggers_leagues_across_the_interval():
+    now, runs = [100.0], []
+    scheduler = LeagueScheduler(interval=60, clock=lambda: now[0])
+    leagues = [FakeLeague(key, runs) for key in ("a", "b", "c")]
+
+    assert scheduler.run_due(leagues) == 20
+    assert runs == ["a"]
+    assert scheduler.due_in("a") == 60 and scheduler.due_in("c") == 40
+    now[0] += 20
+    assert scheduler.run_due(leagues) == 20 and runs == ["a", "b"]
+    now[0] += 25  # c was due 5 s ago; a is due in 15 s
+    assert scheduler.run_due(leagues) == 15 and runs == ["a", "b", "c"]
+    now[0] += 15
+    assert scheduler.run_due(leagues[:2]) == 20 and runs == ["a", "b", "c", "a"]
+    assert scheduler.due_in("c") is None  # dropped with its league
+    assert scheduler.stats == {"runs": 4, "late": 0, "errors": 0}
+
+
+def test_scheduler_restarts_an_overrunning_league_from_now():
+    now, runs = [0.0], []
+    scheduler = LeagueScheduler(interval=10, clock=lambda: now[0])
+    slow = FakeLeague("slow", runs, clock=now, duration=25)
+
+    assert scheduler.run_due([slow]) == 0  # finished 15 s after its next slot: due again now
+    assert scheduler.stats == {"runs": 1, "late": 1, "errors": 0}
+    now[0] = 100
+    fast = FakeLeague("fast", runs)
+    scheduler = LeagueScheduler(interval=10, clock=lambda: now[0])
+    assert scheduler.run_due([fast]) == 10 and scheduler.stats["late"] == 0
+
+
+def test_each_league_refreshes_into_its_own_state_and_routes(app_module, two_leagues, sleeper_stub, monkeypatch):
+    monkeypatch.setattr(app_module.season_calendar, "latest_completed_week", lambda *a, **k: 14)
+    now = [0.0]
+    monkeypatch.setattr(app_module, "scheduler", LeagueScheduler(interval=60, clock=lambda: now[0]))
+    default, second = two_leagues
+
+    assert app_module.background_cycle() == 30
+    assert default.live_state.version == 1 and second.live_state.version == 0
+    now[0] = 30
+    assert app_module.background_cycle() == 30
+    assert second.live_state.version == 1 and second.league_id == SECOND_LEAGUE_ID
+    assert len(default.latest_data["standings"]) == 12 and len(second.latest_data["standings"]) == 10
+    assert app_module.state_store.version("second") == 1
+
+    http = app_module.app.test_client()
+    assert http.get("/api/data").get_json() == json.loads(json.dumps(default.latest_data))
+    for key in ("second", SECOND_LEAGUE_ID):
+        assert http.get(f"/api/leagues/{key}/data").get_json() == json.loads(json.dumps(second.latest_data))
+        assert http.get(f"/api/leagues/{key}/data/standings").get_json()["data"] == second.latest_data["standings"]
+        assert http.get(f"/leagues/{key}").status_code == 200
+    assert http.get("/api/leagues/nope/data").status_code == 404
+    assert http.get("/leagues/nope").status_code == 404
+    listed = http.get("/api/leagues").get_json()["leagues"]
+    assert [(L["key"], L["version"]) for L in listed] == [("default", 1), ("second", 1)]
+    stats = http.get("/api/stats").get_json()
+    assert stats["scheduler"]["runs"] == 2 and stats["leagues"]["second"]["version"] == 1
+
+
+def test_socket_clients_only_hear_their_own_league(app_module, two_leagues, second_league, monkeypatch):
+    monkeypatch.setattr(app_module.season_calendar, "latest_completed_week", lambda *a, **k: 14)
+    default, second = two_leagues
+    for league in two_leagues:
+        app_module.fetch_playoff_data(league)
+
+    main_client = app_module.socketio.test_client(app_module.app)
+    second_client = app_module.socketio.test_client(app_module.app, auth={"league": "second"})
+    snapshots = [m["args"][0] for m in second_client.get_received() if m["name"] == "data_update"]
+    assert len(snapshots[0]["standings"]) == 10 and snapshots[0]["version"] == second.live_state.version
+    main_client.get_received()
+
+    # Live points move in the second league only; the delta reaches only its clients
+    row = second_league["matchups"][15][0]
+    row["players_points"][row["starters"][0]] += 0.5
+    row["points"] += 0.5
+    app_module.fetch_playoff_data(second)
+    assert [m["name"] for m in second_client.get_received()] == ["data_delta"]
+    assert main_client.get_received() == []
+
+    with pytest.raises(Exception):
+        app_module.socketio.test_client(app_module.app, auth={"league": "nope"})
+    main_client.disconnect()
+    second_client.disconnect()
@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+
+from tournament.bracket import Team, render_sections, resolve_bracket
+from tournament.payouts import PAYOUTS, PayoutEvents, PayoutTable, bracket_events, evaluate, summarize
+
+
+def _bracket(seed=0, n=12):
+    rng = np.random.default_rng(seed)
+    scores = rng.uniform(60, 160, size=(n, 17)).round(2)
+    order = np.argsort(-scores[:, :13].sum(axis=1), kind="stable")
+    teams = [
+        Team(
+            roster_id=int(i) + 1,
+            name=f"Team {i + 1}",
+            seed=seed_no,
+            pre_total=float(scores[i, :13].sum()),
+            week_points={w: float(scores[i, w - 1]) for w in (14, 15, 16, 17)},
+            all_weekly_scores=[float(x) for x in scores[i]],
+        )
+        for seed_no, i in enumerate(order, 1)
+    ]
+    return resolve_bracket(teams)
+
+
+@pytest.mark.parametrize(
+    "margin, expected",
+    [(0, (60, 40)), (7.5, (60, 40)), (7.51, (70, 30)), (15, (70, 30)), (23.5, (80, 20)), (30, (90, 10)), (30.01, (100, 0))],
+)
+def test_duel_tiers_scalar_and_array_agree(margin, expected):
+    assert PAYOUTS.duel(margin) == expected
+    win, lose = PAYOUTS.duel_arrays(np.array([margin]))
+    assert (win[0], lose[0]) == expected
+
+
+def test_actual_payouts_count_only_completed_prizes():
+    bracket = _bracket()
+    for week, expected_total in [(5, 5 * 25), (13, 13 * 25 + 75), (15, 13 * 25 + 75 + 100), (17, 13 * 25 + 75 + 100 + 700)]:
+        roster_ids, events = bracket_events(bracket, week)
+        payouts = evaluate(events)[0]
+        assert payouts.sum() == expected_total
+        sections = render_sections(bracket, project=lambda rid, wk: 0.0, latest_completed_week=week, current_time="")
+        paid = sections["payouts"]
+        listed = sum(w["payout"] for w in paid["weeklyWinners"].values())
+        listed += sum(d["payout"] for d in paid["duelOfFates"].values())
+        listed += sum(p["payout"] for p in (paid["seasonHighScore"], paid["champion"]) if p)
+        assert listed == expected_total
+    assert roster_ids[events.champion[0].argmax()] == bracket.champion
+
+
+def test_a_custom_table_changes_amounts_everywhere():
+    bracket = _bracket(1)
+    table = PayoutTable(weekly_high=10, season_high=50, duel_tiers=((10, 90, 10), (float("inf"), 100, 0)), champion=1000)
+    _, events = bracket_events(bracket, 17, table)
+    assert evaluate(events, table).sum() == 13 * 10 + 50 + 100 + 1000
+    sections = render_sections(bracket, project=lambda rid, wk: 0.0, latest_completed_week=17, current_time="", table=table)
+    assert sections["payouts"]["champion"]["payout"] == 1000
+    week17 = [row["payout"] for rows in sections["week17"].values() for row in rows]
+    assert week17.count("$1000.00") == 1 and set(week17) == {"$1000.00", "$-"}
+
+
+def test_batch_evaluation_and_percentiles():
+    # Three trials, three teams: weekly highs, the season high, a duel and a title in the last trial
+    weekly_high = np.full((3, 13), -1)
+    weekly_high[:, :2] = [[0, 0], [1, 2], [2, 2]]
+    flags = np.zeros((3, 3), dtype=bool)
+    champion = flags.copy()
+    champion[2, 1] = True
+    duel_winner, runner_up = flags.copy(), flags.copy()
+    duel_winner[:, 0], runner_up[:, 1] = True, True
+    events = PayoutEvents(
+        weekly_high=weekly_high,
+        season_high=np.eye(3, dtype=bool),
+        duel_winner=duel_winner,
+        duel_runner_up=runner_up,
+        champion=champion,
+        duel_margin=np.array([5.0, 20.0, 40.0]),
+    )
+    payouts = evaluate(events)
+    assert payouts.tolist() == [
+        [50 + 75 + 60, 40, 0],
+        [80, 25 + 75 + 20, 25],
+        [100, 700, 50 + 75],
+    ]
+    summary = summarize(payouts, percentiles=(0, 50, 100))
+    assert summary["expected"].tolist() == pytest.approx([(185 + 80 + 100) / 3, (40 + 120 + 700) / 3, (25 + 125) / 3])
+    assert summary["percentiles"][50].tolist() == [100, 120, 25]
+    assert summary["percentiles"][100].tolist() == [185, 700, 125]
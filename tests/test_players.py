@@ -0,0 +1,120 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from sleeper.client import SleeperClient
+from sleeper.players import Player, PlayerRegistry
+from sleeper.stub import SleeperStubServer
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture
+def players_stub():
+    players = json.loads((FIXTURES / "players_nfl.json").read_text())
+    # Some team defenses only carry first/last names
+    players["KC"] = {"player_id": "KC", "first_name": "Kansas City", "last_name": "Chiefs", "position": "DEF", "team": "KC"}
+    with SleeperStubServer(players=players) as stub:
+        yield stub
+
+
+def test_registry_downloads_once_a_day_and_persists(players_stub, tmp_path):
+    tick = [0.0]
+    client = SleeperClient(players_stub.base_url)
+    registry = PlayerRegistry(tmp_path / "players.sqlite3", clock=lambda: tick[0])
+    assert len(registry) == 0 and registry.column("team") == {}
+
+    assert registry.refresh(client) is True
+    tick[0] += 3600
+    assert registry.refresh(client) is False
+    assert players_stub.requests == {"/v1/players/nfl": 1}
+    assert registry.stats == {"downloads": 1, "errors": 0, "players": 9}
+
+    # The next day's download is a full one, never a 304 against the cached body
+    tick[0] += 86400
+    assert registry.refresh(client) is True
+    assert players_stub.requests == {"/v1/players/nfl": 2} and players_stub.not_modified == 0
+    client.close()
+
+    # A restart reads the file without touching the network
+    reopened = PlayerRegistry(tmp_path / "players.sqlite3", clock=lambda: tick[0])
+    assert reopened.refresh(None) is False
+    assert reopened.get("4046") == Player("4046", "Jalen Hurts", "QB", "PHI", "")
+
+
+def test_lookups_return_only_requested_rows(players_stub, tmp_path):
+    registry = PlayerRegistry(tmp_path / "players.sqlite3")
+    client = SleeperClient(players_stub.base_url)
+    registry.refresh(client)
+    client.close()
+
+    found = registry.get_many(["4034", "KC", "3199", "missing", "4034"])
+    assert sorted(found) == ["3199", "4034", "KC"]
+    assert found["KC"].full_name == "Kansas City Chiefs" and found["KC"].position == "DEF"
+    assert found["3199"].team == ""  # free agent
+    assert registry.get("missing") is None
+
+    teams = registry.column("team")
+    assert teams["6794"] == "MIN" and teams["PHI"] == "PHI"
+    assert registry.column("team") is teams  # cached until the next download
+    with pytest.raises(ValueError):
+        registry.column("player_id; DROP TABLE players")
+
+
+def test_failed_download_keeps_rows_and_retries_later(players_stub, tmp_path):
+    tick = [0.0]
+    registry = PlayerRegistry(tmp_path / "players.sqlite3", retry_after=600, clock=lambda: tick[0])
+    client = SleeperClient(players_stub.base_url)
+    registry.refresh(client)
+    client.close()
+
+    class Down:
+        calls = 0
+
+        def get_players(self):
+            Down.calls += 1
+            raise RuntimeError("Sleeper is down")
+
+    tick[0] += 86400
+    assert registry.refresh(Down()) is False
+    tick[0] += 60
+    registry.refresh(Down())
+    assert Down.calls == 1 and registry.stats["errors"] == 1
+    assert len(registry) == 9 and registry.get("8146").team == "NYJ"
+    tick[0] += 600
+    registry.refresh(Down())
+    assert Down.calls == 2
+
+    # Another worker sharing the file downloads meanwhile: adopted without a request
+    other = PlayerRegistry(tmp_path / "players.sqlite3", clock=lambda: tick[0])
+    client = SleeperClient(players_stub.base_url)
+    other.refresh(client)
+    client.close()
+    tick[0] += 600
+    assert registry.refresh(Down()) is False and Down.calls == 2
+    assert registry.fetched_at == other.fetched_at
+
+
+def test_background_refresh_runs_once_at_a_time_and_backs_off(players_stub, tmp_path):
+    tick, spawned = [0.0], []
+    registry = PlayerRegistry(tmp_path / "players.sqlite3", retry_after=600, clock=lambda: tick[0], spawn=spawned.append)
+    client = SleeperClient(players_stub.base_url)
+
+    assert registry.refresh_if_stale(client) is True
+    assert registry.refresh_if_stale(client) is False  # one download in flight
+    assert players_stub.total_requests == 0  # nothing ran in the caller
+    spawned.pop()()
+    assert len(registry) == 9 and registry.refresh_if_stale(client) is False  # fresh
+    client.close()
+
+    class Down:
+        def get_players(self):
+            raise RuntimeError("Sleeper is down")
+
+    tick[0] += 86400
+    assert registry.refresh_if_stale(Down()) is True
+    spawned.pop()()
+    assert registry.refresh_if_stale(Down()) is False  # backing off after the failure
+    tick[0] += 600
+    assert registry.refresh_if_stale(Down()) is True
@@ -0,0 +1,150 @@
+import random
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from dashboard.leagues import LeagueScheduler
+from dashboard.polling import PollPolicy
+from sleeper import season
+
+
+def central(*args):
+    return season.CENTRAL_TZ.localize(datetime(*args))
+
+
+class FakeLeague:
+    """A league whose refreshes fail while ``failing`` is set."""
+
+    def __init__(self, key):
+        self.key = key
+        self.failing = False
+        self.refresher = SimpleNamespace(run=self._run, last_error=None)
+
+    def _run(self):
+        self.refresher.last_error = RuntimeError("Sleeper is down") if self.failing else None
+
+
+def test_game_windows_follow_the_weekly_schedule():
+    sunday = central(2025, 12, 14, 13)
+    assert season.current_game_window(sunday) == (central(2025, 12, 14, 12), central(2025, 12, 14, 23, 30))
+    tuesday = central(2025, 12, 16, 10)
+    assert season.current_game_window(tuesday) is None
+    assert season.next_game_window(tuesday)[0] == central(2025, 12, 18, 19)
+    # Saturday games only from week 15 on
+    assert season.current_game_window(central(2025, 11, 22, 15)) is None
+    assert season.current_game_window(central(2025, 12, 20, 15)) is not None
+    # Monday night of week 17 is the season's last window
+    assert season.next_game_window(central(2025, 12, 29, 12))[0] == central(2025, 12, 29, 19)
+    assert season.next_game_window(central(2025, 12, 29, 20)) is None
+
+
+def test_policy_polls_fast_in_game_windows_slowly_between_and_stops_when_frozen():
+    policy = PollPolicy(live=20, idle=300)
+    assert policy.mode(central(2025, 12, 14, 13)) == "live"
+    assert policy.interval(central(2025, 12, 14, 13)) == 20
+    assert policy.interval(central(2025, 12, 16, 10)) == 300
+    # Shortened to land on Thursday night's kickoff window, but never below the live interval
+    assert policy.interval(central(2025, 12, 18, 18, 58)) == 120
+    assert policy.interval(central(2025, 12, 18, 18, 59, 50)) == 20
+    assert policy.interval(central(2025, 8, 1)) == 300  # preseason
+    assert policy.mode(central(2025, 12, 30, 9)) == "frozen"
+    assert policy.interval(central(2025, 12, 30, 9)) is None
+
+
+def test_idle_polling_continues_while_the_live_week_can_change():
+    policy = PollPolicy(live=20, idle=300)
+    # Between Sunday's games and Monday night: Week 15 is unfrozen and takes stat corrections
+    monday = central(2025, 12, 15, 10)
+    assert season.latest_completed_week(monday) == 14 and policy.interval(monday) == 300
+    # Week 15 is final (frozen) on Tuesday; Week 16's lineups still move before Thursday's kickoff
+    wednesday = central(2025, 12, 17, 10)
+    assert season.latest_completed_week(wednesday) == 15 and policy.mode(wednesday) == "idle"
+    # After Week 17's last game only its corrections remain, until it freezes
+    assert policy.mode(central(2025, 12, 29, 23, 45)) == "idle"
+    assert policy.mode(central(2025, 12, 30, 9)) == "frozen"
+
+
+def test_backoff_is_jittered_exponential_and_only_lengthens_the_wait():
+    policy = PollPolicy(live=20, idle=300, max_backoff=600, rng=random.Random(3))
+    for failures, ceiling in [(1, 20), (2, 40), (3, 80), (6, 600), (12, 600)]:
+        waits = [policy.backoff(failures) for _ in range(50)]
+        assert all(ceiling / 2 <= w <= ceiling for w in waits)
+        assert len(set(waits)) > 1
+    sunday, tuesday, frozen = central(2025, 12, 14, 13), central(2025, 12, 16, 10), central(2025, 12, 31)
+    assert 40 <= policy.next_delay(3, sunday) <= 80
+    assert policy.next_delay(3, tuesday) == 300
+    assert policy.next_delay(0, frozen) is None
+    assert 10 <= policy.next_delay(1, frozen) <= 20  # no good data yet: keep retrying
+
+
+def test_predicted_polls_per_day():
+    policy = PollPolicy(live=20, idle=300)
+
+    def polls_on(day):
+        return policy.predict_polls(central(2025, 12, day), central(2025, 12, day) + timedelta(days=1))
+
+    # Sunday: 11.5 h of games every 20 s plus 12.5 h idle every 5 min
+    assert polls_on(14) == 2070 + 150
+    assert polls_on(15) == 1044  # Monday night
+    assert polls_on(16) == 288  # no games
+    assert polls_on(31) == 0  # season over
+
+    described = PollPolicy(now=lambda: central(2025, 12, 16, 10)).describe()
+    assert described["mode"] == "idle" and described["predicted_polls_today"] == 288
+    assert described["predicted_polls_per_day"] == round((2220 + 1044 * 2 + 288 * 3 + 2220) / 7, 1)
+
+
+def test_scheduler_follows_the_policy_and_backs_off_per_league():
+    wall = [central(2025, 12, 14, 13)]
+    mono = [0.0]
+    policy = PollPolicy(live=20, idle=300, rng=random.Random(1), now=lambda: wall[0])
+    scheduler = LeagueScheduler(interval=60, policy=policy, clock=lambda: mono[0])
+    ok, flaky = FakeLeague("ok"), FakeLeague("flaky")
+    flaky.failing = True
+
+    def advance(seconds):
+        mono[0] += seconds
+        wall[0] += timedelta(seconds=seconds)
+
+    assert scheduler.run_due([ok, flaky]) == 20
+    advance(30)
+    scheduler.run_due([ok, flaky])
+    assert scheduler.due_in("ok") == 20 and 10 <= scheduler.due_in("flaky") <= 20
+    waits = []
+    for _ in range(3):
+        advance(scheduler.due_in("flaky"))
+        scheduler.run_due([flaky])
+        waits.append(scheduler.due_in("flaky"))
+    assert 20 <= waits[0] <= 40 and 40 <= waits[1] <= 80 and 80 <= waits[2] <= 160
+    assert scheduler.stats["errors"] == 4
+
+    flaky.failing = False
+    advance(scheduler.due_in("flaky"))
+    scheduler.run_due([flaky])
+    assert scheduler.due_in("flaky") == 20  # recovered: back on the live cadence
+
+    # Once the season is frozen, leagues are not polled again
+    advance((central(2025, 12, 30, 9) - wall[0]).total_seconds())
+    assert scheduler.run_due([ok, flaky]) == float("inf")
+    assert scheduler.due_in("ok") is None and scheduler.due_in("flaky") is None
+
+
+def test_failed_refresh_reports_error_and_backs_off(app_module, monkeypatch):
+    def sleeper_down(*args, **kwargs):
+        raise RuntimeError("Sleeper is down")
+
+    monkeypatch.setattr(app_module.week_cache, "resolve_league_id", sleeper_down)
+    policy = PollPolicy(live=20, idle=300, now=lambda: central(2025, 12, 14, 13))
+    scheduler = LeagueScheduler(interval=60, policy=policy)
+    monkeypatch.setattr(app_module, "scheduler", scheduler)
+    client = app_module.socketio.test_client(app_module.app)
+    app_module.leagues.default.refresher.wait(timeout=10)
+    client.get_received()
+
+    assert app_module.background_cycle() <= 20
+    league = app_module.leagues.default
+    assert str(league.refresher.last_error) == "Sleeper is down"
+    assert scheduler.stats["errors"] == 1 and 10 <= scheduler.due_in("default") <= 20
+    assert [m["args"][0] for m in client.get_received() if m["name"] == "error"] == [{"message": "Sleeper is down"}]
+    polling = app_module.app.test_client().get("/api/stats").get_json()["scheduler"]["polling"]
+    assert polling["mode"] == "live" and polling["interval"] == 20
+    client.disconnect()
@@ -0,0 +1,126 @@
+import random
+
+import pytest
+
+from projection.batch import pack_league, project_batch, project_league
+from projection.quantum_gauntlet import compute_roster_projection
+from sleeper.stub import build_synthetic_league
+
+
+def _mk_matchup(roster_id, starters, players_points):
+    return {"roster_id": roster_id, "starters": starters, "players_points": players_points}
+
+
+def _scalar_totals(roster_ids, **kwargs):
+    return {rid: compute_roster_projection(roster_id=rid, **kwargs).projected_total for rid in roster_ids}
+
+
+@pytest.mark.parametrize(
+    "case",
+    [
+        # Same fixtures as tests/test_quantum_gauntlet.py
+        dict(
+            week=9,
+            roster_ids=[1],
+            matchups_by_week={
+                6: [_mk_matchup(1, ["A", "B", "C"], {"A": 10, "B": 0})],
+                7: [_mk_matchup(1, ["A", "B", "C"], {"A": 20, "B": 10})],
+                8: [_mk_matchup(1, ["A", "B", "C"], {"A": 30, "B": 40})],
+            },
+            current=[_mk_matchup(1, ["A", "B", "C"], {"A": 15, "B": 35, "C": 5})],
+            states={"A": "IN_PROGRESS", "B": "IN_PROGRESS", "C": "NOT_STARTED"},
+            expected={1: 60.0},
+        ),
+        dict(
+            week=5,
+            roster_ids=[2],
+            matchups_by_week={wk: [_mk_matchup(2, ["P"], {"P": 0.0})] for wk in (2, 3, 4)},
+            current=[_mk_matchup(2, ["P"], {"P": 12.3})],
+            states={"P": "FINISHED"},
+            expected={2: 12.3},
+        ),
+        dict(
+            week=3,
+            roster_ids=[10, 11],
+            matchups_by_week={
+                1: [_mk_matchup(10, ["1"], {"1": 10}), _mk_matchup(11, ["2"], {"2": 20})],
+                2: [_mk_matchup(10, ["1"], {"1": 20}), _mk_matchup(11, ["2"], {"2": 10})],
+            },
+            current=[_mk_matchup(10, ["1"], {"1": 0}), _mk_matchup(11, ["2"], {"2": 5})],
+            states={"1": "NOT_STARTED", "2": "IN_PROGRESS"},
+            expected={10: 16.67, 11: 13.33},
+        ),
+    ],
+)
+def test_batch_matches_scalar_fixtures(case):
+    kwargs = dict(
+        week=case["week"],
+        matchups_by_week=case["matchups_by_week"],
+        current_week_matchups=case["current"],
+        get_player_game_state=case["states"].__getitem__,
+    )
+    totals = project_league(case["roster_ids"], **kwargs)
+    scalar = _scalar_totals(case["roster_ids"], **kwargs)
+
+    assert list(totals) == case["roster_ids"]
+    for rid in case["roster_ids"]:
+        assert totals[rid] == pytest.approx(scalar[rid], abs=1e-9)
+        assert totals[rid] == pytest.approx(case["expected"][rid], abs=1e-9)
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("weights", [(0.6, 0.3, 0.1), (0.5, 0.5), (0.0, 0.0, 1.0)])
+def test_batch_matches_scalar_on_synthetic_league(seed, weights):
+    rng = random.Random(seed)
+    league = build_synthetic_league(num_teams=10, weeks=8, seed=seed)
+    matchups_by_week = league["matchups"]
+    # DNPs, a missing player and a traded starter exercise the mask and the fallback
+    for week_rows in matchups_by_week.values():
+        for row in week_rows:
+            for pid in list(row["players_points"]):
+                roll = rng.random()
+                if roll < 0.15:
+                    row["players_points"][pid] = 0.0
+                elif roll < 0.2:
+                    del row["players_points"][pid]
+    matchups_by_week[6][2]["starters"].append("101")
+    states = ["NOT_STARTED", "IN_PROGRESS", "FINISHED"]
+    state_by_player = {}
+
+    def state_provider(pid):
+        return state_by_player.setdefault(pid, rng.choice(states))
+
+    roster_ids = [r["roster_id"] for r in league["rosters"]]
+    for week in (1, 2, 6):
+        kwargs = dict(
+            week=week,
+            matchups_by_week=matchups_by_week,
+            current_week_matchups=matchups_by_week[week],
+            get_player_game_state=state_provider,
+            weights=weights,
+            default_floor=1.5,
+        )
+        totals = project_league(roster_ids, **kwargs)
+        scalar = _scalar_totals(roster_ids, **kwargs)
+        for rid in roster_ids:
+            assert totals[rid] == pytest.approx(scalar[rid], abs=1e-9)
+
+
+def test_pack_league_masks_zero_and_missing_games():
+    matchups_by_week = {
+        1: [_mk_matchup(1, ["A"], {"A": 0.0})],
+        2: [_mk_matchup(1, ["A"], {})],
+        3: [_mk_matchup(1, ["A"], {"A": 7.0})],
+    }
+    current = [_mk_matchup(1, ["A"], {"A": 2.0})]
+    batch = pack_league(
+        [1],
+        week=4,
+        matchups_by_week=matchups_by_week,
+        current_week_matchups=current,
+        get_player_game_state=lambda pid: "IN_PROGRESS",
+    )
+
+    assert batch.history.shape == (1, 3)
+    assert batch.mask.tolist() == [[True, False, False]]
+    assert project_batch(batch) == {1: 7.0}
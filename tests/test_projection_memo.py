@@ -0,0 +1,32 @@
+from projection.memo import ProjectionMemo, matchup_digest
+
+
+def test_memo_counts_hits_and_sweeps_unused_entries_on_new_version():
+    memo = ProjectionMemo()
+    calls = []
+
+    def compute(value):
+        calls.append(value)
+        return value
+
+    memo.begin("v1")
+    assert memo.get_or_compute(("a", 15), lambda: compute(1.0)) == 1.0
+    assert memo.get_or_compute(("b", 15), lambda: compute(2.0)) == 2.0
+    assert memo.get_or_compute(("a", 15), lambda: compute(9.0)) == 1.0
+    assert memo.stats["last"] == {"version": "v1", "hits": 1, "misses": 2, "evictions": 0}
+
+    memo.begin("v1")  # same version: generation continues
+    memo.begin("v2")  # nothing evicted: both entries were used under v1
+    assert memo.get_or_compute(("a", 15), lambda: compute(9.0)) == 1.0
+
+    memo.begin("v3")  # "b" went unused under v2
+    assert memo.stats["last"]["evictions"] == 1
+    assert memo.get_or_compute(("b", 15), lambda: compute(3.0)) == 3.0
+    assert calls == [1.0, 2.0, 3.0]
+    assert (memo.stats["hits"], memo.stats["misses"], memo.stats["evictions"]) == (2, 3, 1)
+
+
+def test_matchup_digest_ignores_key_order():
+    assert matchup_digest({"a": 1, "b": [1, 2]}) == matchup_digest({"b": [1, 2], "a": 1})
+    assert matchup_digest({"a": 1}) != matchup_digest({"a": 2})
+    assert matchup_digest(None) == matchup_digest(None)
@@ -3,7 +3,11 @@ from typing import Dict, List
 
 import pytest
 
+from sleeper.stub import build_synthetic_league
+
 from projection.quantum_gauntlet import (
+    IncrementalProjection,
+    build_matchup_index,
     compute_roster_projection,
     compute_tournament_projection,
 )
@@ -120,3 +124,98 @@ def test_compute_tournament_projection_sums_multiple_rosters():
     assert total == pytest.approx(30.0, rel=1e-9)  # ~16.667 + ~13.333
     assert len(breakdowns) == 2
 
+
+
+def test_matchup_index_matches_scanning_lookups():
+    league = build_synthetic_league(num_teams=8, weeks=10, seed=3)
+    matchups_by_week = league["matchups"]
+    # Player 101 moves from roster 1 to roster 2 in week 8: the roster lookup
+    # misses and the league-wide fallback must find the old points.
+    traded = matchups_by_week[8][1]
+    traded["starters"] = traded["starters"] + ["101"]
+    current = matchups_by_week[8]
+    index = build_matchup_index(matchups_by_week)
+
+    assert index.rosters[8][2] is traded
+    assert index.player_points[7]["101"] == matchups_by_week[7][0]["players_points"]["101"]
+
+    def state_provider(pid: str):
+        return "IN_PROGRESS" if int(pid) % 3 == 0 else "NOT_STARTED"
+
+    for rid in range(1, 9):
+        kwargs = dict(
+            roster_id=rid,
+            week=8,
+            matchups_by_week=matchups_by_week,
+            current_week_matchups=current,
+            get_player_game_state=state_provider,
+        )
+        scanned = compute_roster_projection(**kwargs)
+        indexed = compute_roster_projection(index=index, **kwargs)
+        assert indexed == scanned
+
+    total, _ = compute_tournament_projection(
+        roster_ids=range(1, 9),
+        week=8,
+        matchups_by_week=matchups_by_week,
+        current_week_matchups=current,
+        get_player_game_state=state_provider,
+    )
+    expected = sum(
+        compute_roster_projection(
+            roster_id=rid,
+            week=8,
+            matchups_by_week=matchups_by_week,
+            current_week_matchups=current,
+            get_player_game_state=state_provider,
+        ).projected_total
+        for rid in range(1, 9)
+    )
+    assert total == pytest.approx(expected, rel=1e-12)
+
+
+def test_incremental_projection_updates_only_changed_starters():
+    league = build_synthetic_league(num_teams=6, weeks=8, seed=5)
+    matchups_by_week = league["matchups"]
+    week = 8
+    states = {}
+
+    def state_provider(pid: str):
+        return states.get(pid, "NOT_STARTED")
+
+    def scalar(rid):
+        return compute_roster_projection(
+            roster_id=rid,
+            week=week,
+            matchups_by_week=matchups_by_week,
+            current_week_matchups=matchups_by_week[week],
+            get_player_game_state=state_provider,
+        )
+
+    inc = IncrementalProjection(week, matchups_by_week, state_provider, index=build_matchup_index(matchups_by_week))
+    for row in matchups_by_week[week]:
+        inc.track(row["roster_id"], row)
+    assert inc.stats == {"forecasts": 54, "selections": 54}
+    for rid in range(1, 7):
+        assert inc.roster_projection(rid) == scalar(rid)
+
+    # Two live changes on roster 3: one overtakes its forecast, one finishes low
+    row = matchups_by_week[week][2]
+    fast, done = row["starters"][0], row["starters"][1]
+    row["players_points"][fast] = 60.0
+    row["players_points"][done] = 0.5
+    states.update({fast: "IN_PROGRESS", done: "FINISHED"})
+
+    changes, relineup = inc.diff_live_points(matchups_by_week[week])
+    assert changes == {(3, fast): 60.0, (3, done): 0.5} and relineup == []
+    assert inc.apply_live_points(changes) == {3}
+    assert inc.stats == {"forecasts": 54, "selections": 56}
+    for rid in range(1, 7):
+        assert inc.projected_total(rid) == scalar(rid).projected_total
+        assert inc.roster_projection(rid) == scalar(rid)
+
+    # A lineup change re-tracks just that roster
+    matchups_by_week[week][4]["starters"] = matchups_by_week[week][4]["starters"][:-1]
+    assert inc.sync(matchups_by_week[week]) == {5}
+    assert inc.stats["forecasts"] == 54 + 8
+    assert inc.roster_projection(5) == scalar(5)
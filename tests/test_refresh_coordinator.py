@@ -0,0 +1,84 @@
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+
+import pytest
+
+from dashboard.refresh import RefreshCoordinator, offload
+
+
+def test_concurrent_callers_share_one_refresh():
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def refresh():
+        calls.append(threading.current_thread().name)
+        started.set()
+        release.wait(5)
+
+    coordinator = RefreshCoordinator(refresh)
+    assert coordinator.trigger() is True
+    assert started.wait(5)
+
+    # Callers arriving mid-refresh join it instead of starting their own
+    assert coordinator.trigger() is False
+    joined = []
+    waiters = [threading.Thread(target=lambda: joined.append(coordinator.run(timeout=5))) for _ in range(4)]
+    for t in waiters:
+        t.start()
+    notified = []
+    coordinator.subscribe(lambda: notified.append("done"))
+    time.sleep(0.05)
+    assert notified == [] and coordinator.running
+
+    release.set()
+    for t in waiters:
+        t.join(5)
+    assert coordinator.wait(5)
+    assert calls == ["refresh"]
+    assert joined == [True] * 4
+    assert notified == ["done"]
+    assert coordinator.stats == {"runs": 1, "joined": 5, "errors": 0}
+
+
+def test_idle_subscribe_runs_immediately_and_errors_release_waiters():
+    coordinator = RefreshCoordinator(lambda: 1 / 0, spawn=lambda target: target())
+    seen = []
+    coordinator.subscribe(lambda: seen.append("idle"))
+    assert seen == ["idle"]
+
+    coordinator.trigger()
+    assert not coordinator.running
+    assert isinstance(coordinator.last_error, ZeroDivisionError)
+    assert coordinator.run() is True
+    assert coordinator.stats == {"runs": 2, "joined": 0, "errors": 2}
+
+
+def test_offload_runs_off_the_gevent_loop():
+    pytest.importorskip("gevent")
+    # A fresh interpreter: monkey-patching must happen before threading is used
+    script = textwrap.dedent("""
+        from gevent import monkey
+        monkey.patch_all()
+        import threading, time
+        import gevent
+        from dashboard.refresh import offload
+
+        ticks = []
+        ticker = gevent.spawn(lambda: [ticks.append(gevent.sleep(0.01)) for _ in range(20)])
+        loop_thread = threading.get_native_id()
+        worker_thread = offload(lambda: time.sleep(0.1) or threading.get_native_id())
+        assert worker_thread != loop_thread, "ran on the event loop"
+        assert len(ticks) >= 3, "the loop was blocked"
+        ticker.kill()
+        assert offload(lambda: 42) == 42
+    """)
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+
+
+def test_offload_calls_directly_without_gevent():
+    assert offload(lambda: threading.get_ident()) == threading.get_ident()
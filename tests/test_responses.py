@@ -0,0 +1,80 @@
+import gzip
+import json
+
+import pytest
+from flask import jsonify
+
+from dashboard.responses import DocumentCache, encode_document
+
+
+def test_encoded_body_matches_jsonify(app_module):
+    data = {"week15": {"b": [1, 2.5, None], "a": "Ünïcode"}, "timestamp": "now", "payouts": {1: {"x": 1}}}
+    doc = encode_document(data)
+    with app_module.app.app_context():
+        assert doc.bodies["identity"] == jsonify(data).get_data()
+    assert gzip.decompress(doc.bodies["gzip"]) == doc.bodies["identity"]
+    assert encode_document(dict(data)).etag == doc.etag
+
+
+def test_document_cache_encodes_once_per_data_object():
+    cache = DocumentCache()
+    data = {"timestamp": "a"}
+    first = cache.get(data)
+    assert cache.get(data) is first
+    assert cache.get({"timestamp": "b"}) is not first
+    assert cache.stats == {"encodes": 2, "hits": 1}
+
+
+def test_api_data_serves_precomputed_gzip_and_304s(app_module, synthetic_league, monkeypatch):
+    monkeypatch.setattr(app_module.season_calendar, "latest_completed_week", lambda *a, **k: 14)
+    app_module.fetch_playoff_data()
+    http = app_module.app.test_client()
+
+    first = http.get("/api/data", headers={"Accept-Encoding": "gzip, deflate"})
+    assert first.status_code == 200
+    assert first.headers["Content-Encoding"] == "gzip"
+    assert first.headers["Cache-Control"] == "no-cache"
+    assert "no-store" not in first.headers["Cache-Control"]
+    assert json.loads(gzip.decompress(first.data)) == json.loads(json.dumps(app_module.leagues.default.latest_data))
+    etag = first.headers["ETag"]
+
+    for _ in range(5):
+        polled = http.get("/api/data", headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+        assert polled.status_code == 304 and polled.data == b""
+    plain = http.get("/data_snapshot.json")
+    assert "Content-Encoding" not in plain.headers
+    assert plain.get_json() == json.loads(json.dumps(app_module.leagues.default.latest_data))
+    assert app_module.leagues.default.data_documents.stats == {"encodes": 1, "hits": 6}
+
+    synthetic_league["matchups"][15][0]["points"] += 2.0
+    app_module.fetch_playoff_data()
+    changed = http.get("/api/data", headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+    assert changed.status_code == 200 and changed.headers["ETag"] != etag
+
+
+def test_index_page_revalidates_with_etag(app_module):
+    http = app_module.app.test_client()
+    page = http.get("/")
+    assert page.status_code == 200 and page.headers["ETag"]
+    again = http.get("/", headers={"If-None-Match": page.headers["ETag"]})
+    assert again.status_code == 304
+
+
+def test_index_page_connects_websocket_only_when_configured(app_module, monkeypatch):
+    http = app_module.app.test_client()
+    assert "const WEBSOCKET_ONLY = false;" in http.get("/").get_data(as_text=True)
+    monkeypatch.setattr(app_module, "SOCKETIO_WEBSOCKET_ONLY", True)
+    assert "const WEBSOCKET_ONLY = true;" in http.get("/leagues/default").get_data(as_text=True)
+
+
+def test_brotli_preferred_when_installed(app_module):
+    brotli = pytest.importorskip("brotli")
+    app_module.leagues.default.latest_data = {"timestamp": "now", "standings": [{"team": "Team 1"}] * 50}
+    http = app_module.app.test_client()
+
+    resp = http.get("/api/data", headers={"Accept-Encoding": "gzip, br"})
+    assert resp.headers["Content-Encoding"] == "br"
+    assert json.loads(brotli.decompress(resp.data)) == app_module.leagues.default.latest_data
+    gz = http.get("/api/data", headers={"Accept-Encoding": "gzip, br;q=0"})
+    assert gz.headers["Content-Encoding"] == "gzip"
+    assert gz.headers["ETag"] != resp.headers["ETag"]
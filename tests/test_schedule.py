@@ -0,0 +1,227 @@
+import json
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from projection.quantum_gauntlet import IncrementalProjection
+from sleeper import season
+from sleeper.client import SleeperClient
+from sleeper.players import PlayerRegistry
+from sleeper.schedule import GameStates, NflSchedule, points_game_state
+from sleeper.stub import SleeperStubServer
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def central(*args):
+    return season.CENTRAL_TZ.localize(datetime(*args))
+
+
+@pytest.fixture
+def nfl_schedule():
+    return json.loads((FIXTURES / "nfl_schedule_2025.json").read_text())
+
+
+@pytest.fixture
+def players():
+    return json.loads((FIXTURES / "players_nfl.json").read_text())
+
+
+@pytest.fixture
+def schedule_stub(nfl_schedule, players):
+    with SleeperStubServer(nfl_schedule=nfl_schedule, players=players) as stub:
+        yield stub
+
+
+def _states(nfl_schedule, players, week, now, fallback=None):
+    teams = sorted({g["home"] for g in nfl_schedule} | {g["away"] for g in nfl_schedule})
+    player_teams = {pid: p["team"] or "" for pid, p in players.items()}
+    games = [g for g in nfl_schedule if g["week"] == week]
+    return GameStates.build(games, teams, player_teams, now, fallback)
+
+
+def test_game_states_follow_kickoffs_statuses_and_byes(nfl_schedule, players):
+    sunday_early = _states(nfl_schedule, players, 15, central(2025, 12, 14, 13))
+    assert sunday_early("4046") == "IN_PROGRESS"  # PHI, in_game
+    assert sunday_early("PHI") == "IN_PROGRESS"  # team defense
+    assert sunday_early("4034") == "NOT_STARTED"  # KC kicks off at 15:25
+    assert sunday_early("6794") == "NOT_STARTED"  # MIN plays Monday night
+    assert sunday_early("5846") == "FINISHED"  # GB played Saturday (date only: the window is over)
+    assert sunday_early("8146") == "FINISHED"  # NYJ on bye
+    assert sunday_early("3199") == "FINISHED"  # free agent
+    assert sunday_early("4984") == "FINISHED"  # BUF has no game in the schedule
+    assert sunday_early("unknown") == "NOT_STARTED"
+
+    sunday_late = _states(nfl_schedule, players, 15, central(2025, 12, 14, 16, 30))
+    assert sunday_late("4046") == "FINISHED"  # four hours after kickoff
+    assert sunday_late("4034") == "IN_PROGRESS"
+    assert sunday_late.version != sunday_early.version
+    assert _states(nfl_schedule, players, 15, central(2025, 12, 14, 16, 31)).version == sunday_late.version
+
+    monday = _states(nfl_schedule, players, 15, central(2025, 12, 15, 19, 30))
+    assert monday("6794") == "IN_PROGRESS" and monday("4034") == "FINISHED"
+
+    # Players the map does not know use the fallback
+    fallback = points_game_state({"unknown": 3.5})
+    assert _states(nfl_schedule, players, 15, central(2025, 12, 14, 13), fallback)("unknown") == "IN_PROGRESS"
+
+
+def test_schedule_loads_once_per_week_and_rechecks_during_games(schedule_stub, tmp_path):
+    tick, now = [0.0], [central(2025, 12, 14, 13)]
+    client = SleeperClient(schedule_stub.base_url)
+    registry = PlayerRegistry(tmp_path / "sleeper_players.sqlite3", clock=lambda: tick[0])
+    cache = NflSchedule(
+        tmp_path / "nfl_schedule.json", players=registry, live_ttl=300, clock=lambda: tick[0], now=lambda: now[0]
+    )
+
+    # Before the registry's background download only team defenses are placed
+    before = cache.game_states(client, 15)
+    assert before("PHI") == "IN_PROGRESS" and before("4046") == "NOT_STARTED"
+    assert schedule_stub.requests == {"/schedule/nfl/regular/2025": 1}
+    registry.refresh(client)
+    assert cache.game_states(client, 15)("4046") == "IN_PROGRESS"
+    assert cache.game_states(client, 15).version != before.version
+    assert schedule_stub.requests == {"/schedule/nfl/regular/2025": 1, "/v1/players/nfl": 1}
+    tick[0] += 60
+    cache.game_states(client, 14)
+    assert schedule_stub.total_requests == 2
+
+    # In a game window the schedule (only) is re-checked after live_ttl; unchanged, it is a 304
+    tick[0] += 300
+    cache.game_states(client, 15)
+    assert schedule_stub.requests["/schedule/nfl/regular/2025"] == 2 and schedule_stub.not_modified == 1
+    schedule_stub.nfl_schedule[4]["status"] = "complete"
+    tick[0] += 300
+    assert cache.game_states(client, 15)("4046") == "FINISHED"
+    assert schedule_stub.requests["/v1/players/nfl"] == 1
+
+    # Tuesday has no games: nothing to re-check; the next NFL week's first refresh reloads the
+    # schedule, while the player registry waits for its daily refresh
+    now[0], tick[0] = central(2025, 12, 16, 10), tick[0] + 3600
+    cache.game_states(client, 16)
+    assert schedule_stub.requests["/schedule/nfl/regular/2025"] == 3
+    now[0] = central(2025, 12, 18, 10)
+    cache.game_states(client, 16)
+    assert schedule_stub.requests == {"/schedule/nfl/regular/2025": 4, "/v1/players/nfl": 1}
+    client.close()
+
+    # A restart reads the disk cache; a broken Sleeper keeps it and retries after live_ttl
+    class Down:
+        calls = 0
+
+        def get_nfl_schedule(self, season):
+            Down.calls += 1
+            raise RuntimeError("Sleeper is down")
+
+    restarted = NflSchedule(
+        tmp_path / "nfl_schedule.json",
+        players=PlayerRegistry(tmp_path / "sleeper_players.sqlite3", clock=lambda: tick[0]),
+        clock=lambda: tick[0],
+        now=lambda: central(2025, 12, 21, 13),
+    )
+    assert restarted.game_states(Down(), 15)("4046") == "FINISHED"
+    restarted.game_states(Down(), 15)
+    assert Down.calls == 1 and restarted.stats["errors"] == 1
+
+
+def test_week_missing_from_the_schedule_falls_back_to_live_points(nfl_schedule, players, schedule_stub, tmp_path):
+    fallback = points_game_state({"4046": 7.0})
+    # Week 16 is not in the fixture: no game is not the same as every team on bye
+    states = _states(nfl_schedule, players, 16, central(2025, 12, 21, 13), fallback)
+    assert states.version == "points"
+    assert states("4046") == "IN_PROGRESS" and states("4034") == "NOT_STARTED" and states("PHI") == "NOT_STARTED"
+
+    client = SleeperClient(schedule_stub.base_url)
+    cache = NflSchedule(tmp_path / "nfl_schedule.json", now=lambda: central(2025, 12, 21, 13))
+    assert cache.game_states(client, 16, fallback=fallback)("4034") == "NOT_STARTED"
+    assert cache.game_states(client, 15, fallback=fallback)("PHI") == "FINISHED"
+    client.close()
+
+
+def test_missing_schedule_falls_back_to_live_points(tmp_path):
+    with SleeperStubServer() as stub:
+        client = SleeperClient(stub.base_url)
+        states = NflSchedule(tmp_path / "nfl_schedule.json").game_states(
+            client, 15, fallback=points_game_state({"a": 1.0})
+        )
+        client.close()
+    assert states.version == "points"
+    assert states("a") == "IN_PROGRESS" and states("b") == "NOT_STARTED"
+
+
+def test_projection_reselects_players_whose_game_ended_without_new_points():
+    matchups = {wk: [{"roster_id": 1, "starters": ["A", "B"], "players_points": {"A": 10.0, "B": 8.0}}] for wk in (12, 13, 14)}
+    live = [{"roster_id": 1, "starters": ["A", "B"], "players_points": {"A": 0.0, "B": 12.0}}]
+    matchups[15] = live
+    states = {"A": "IN_PROGRESS", "B": "IN_PROGRESS"}
+    projection = IncrementalProjection(15, matchups, lambda pid: states[pid])
+    projection.track(1, live[0])
+    assert projection.projected_total(1) == 22.0  # A still on its 10-point forecast
+
+    # A's game ends scoreless: same points, new state
+    states = {"A": "FINISHED", "B": "IN_PROGRESS"}
+    assert projection.sync(live, lambda pid: states[pid]) == {1}
+    assert projection.projected_total(1) == 12.0
+    assert projection.sync(live, lambda pid: states[pid]) == set()
+
+
+@pytest.fixture
+def synthetic_nfl(synthetic_league):
+    """Every synthetic starter on PHI (early Sunday game) or KC (late game) in Week 15."""
+    kickoff = {"PHI": central(2025, 12, 14, 12), "KC": central(2025, 12, 14, 15, 25)}
+    games = [
+        {"week": 15, "date": "2025-12-14", "home": home, "away": away, "status": "pre_game",
+         "start_time": int(kickoff[home].timestamp() * 1000)}
+        for home, away in (("PHI", "DAL"), ("KC", "LAC"))
+    ]
+    players = {
+        pid: {"player_id": pid, "team": "PHI" if int(pid) % 2 else "KC"}
+        for roster in synthetic_league["rosters"]
+        for pid in roster["starters"]
+    }
+    return games, players
+
+
+@pytest.fixture
+def sleeper_stub(synthetic_league, synthetic_nfl):
+    games, players = synthetic_nfl
+    with SleeperStubServer(synthetic_league, nfl_schedule=games, players=players) as stub:
+        yield stub
+
+
+def test_refresh_reprojects_when_games_end(app_module, synthetic_league, monkeypatch, tmp_path):
+    monkeypatch.setattr(app_module.season_calendar, "latest_completed_week", lambda *a, **k: 14)
+    now = [central(2025, 12, 14, 13)]
+    schedule = NflSchedule(tmp_path / "nfl_schedule.json", players=app_module.player_registry, now=lambda: now[0])
+    monkeypatch.setattr(app_module, "nfl_schedule", schedule)
+    league = app_module.leagues.default
+
+    def week15_projections():
+        return {
+            row["team"]: float(row["proj_score"])
+            for rows in league.latest_data["week15"].values()
+            for row in rows
+            if "proj_score" in row
+        }
+
+    # Week 15's live points: odd starters (PHI) have scored little so far
+    for row in synthetic_league["matchups"][15]:
+        for pid in row["starters"]:
+            row["players_points"][pid] = 0.5 if int(pid) % 2 else 0.0
+        row["points"] = round(sum(row["players_points"].values()), 2)
+
+    app_module.player_registry.refresh(app_module.sleeper)
+    app_module.fetch_playoff_data(league)
+    early = week15_projections()
+    app_module.fetch_playoff_data(league)
+    assert league.refresh_stats["skipped_cycles"] == 1
+
+    # PHI's game is over: same Sleeper data, but those starters now count their final points
+    now[0] = central(2025, 12, 14, 16, 30)
+    app_module.fetch_playoff_data(league)
+    assert league.refresh_stats["skipped_cycles"] == 1
+    late = week15_projections()
+    assert late != early
+    assert all(late[team] <= early[team] for team in early)
+    assert schedule.stats["loads"] == 1 and app_module.player_registry.stats["downloads"] == 1
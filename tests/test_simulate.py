@@ -0,0 +1,163 @@
+import threading
+
+import numpy as np
+import pytest
+
+from tournament.bracket import Team, render_sections, resolve_bracket
+from tournament.simulate import OUTCOMES, build_score_model, resolve_outcomes, simulate
+from sleeper.stub import build_synthetic_league
+
+
+def _scalar_outcomes(scores):
+    """One trial through the list-based engine, listed in roster order like the app does."""
+    n = scores.shape[0]
+    rows = sorted(
+        (
+            dict(
+                roster_id=i,
+                pre_total=float(scores[i, :13].sum()),
+                week_points={w: float(scores[i, w - 1]) for w in (14, 15, 16, 17)},
+                all_weekly_scores=[float(x) for x in scores[i]],
+            )
+            for i in range(n)
+        ),
+        key=lambda r: r["pre_total"],
+        reverse=True,
+    )
+    teams = [Team(name=f"T{r['roster_id']}", seed=seed, **r) for seed, r in enumerate(rows, 1)]
+    bracket = resolve_bracket(teams)
+    sections = render_sections(bracket, project=lambda rid, week: 0.0, latest_completed_week=17, current_time="")
+    payout = np.zeros(n)
+    paid = sections["payouts"]
+    for row in list(paid["weeklyWinners"].values()) + list(paid["duelOfFates"].values()):
+        payout[int(row["team"][1:])] += row["payout"]
+    payout[int(paid["seasonHighScore"]["team"][1:])] += 75
+    payout[bracket.champion] += 700
+    flags = {
+        "bye": set(bracket.rounds["bye"]),
+        "wildcard_winner": {bracket.wildcard_winner},
+        "conference": set(bracket.rounds["conference"]),
+        "superbowl": set(bracket.rounds["superbowl"]),
+        "champion": {bracket.champion},
+        "purgatory": set(bracket.rounds["purgatory17"]),
+        "toilet_bowl": set(bracket.rounds["toilet17"]),
+    }
+    return {t.roster_id: t.seed for t in teams}, flags, payout
+
+
+@pytest.mark.parametrize("n", [8, 10, 12, 14])
+@pytest.mark.parametrize("fixed_regular_season", [False, True])
+def test_vectorized_bracket_matches_the_list_engine(n, fixed_regular_season):
+    rng = np.random.default_rng(n)
+    # Coarse scores, so every tie-break is exercised
+    scores = rng.integers(0, 6, size=(150, n, 17)).astype(float) * 10
+    if fixed_regular_season:
+        scores[:, :, :13] = scores[0, :, :13]
+    outcomes = resolve_outcomes(scores)
+    for trial in range(len(scores)):
+        seeds, flags, payout = _scalar_outcomes(scores[trial])
+        assert list(outcomes["seed"][trial]) == [seeds[i] for i in range(n)]
+        for name, members in flags.items():
+            assert set(np.flatnonzero(outcomes[name][trial])) == members, (trial, name)
+        assert np.allclose(outcomes["payout"][trial], payout), trial
+
+
+def test_score_model_freezes_completed_weeks_and_respects_live_states():
+    matchups = {
+        week: [
+            {"roster_id": 1, "points": 10.0 * week, "starters": ["A", "B"], "players_points": {"A": 5.0 * week, "B": 0.0}},
+            {"roster_id": 2, "points": 7.0, "starters": ["C"], "players_points": {"C": 7.0}},
+        ]
+        for week in (1, 2, 3)
+    }
+    matchups[4] = [
+        {"roster_id": 1, "points": 30.0, "starters": ["A", "B"], "players_points": {"A": 30.0, "B": 0.0}},
+        {"roster_id": 2, "points": 1.0, "starters": ["C"], "players_points": {"C": 1.0}},
+    ]
+    states = {"A": "FINISHED", "B": "NOT_STARTED", "C": "IN_PROGRESS"}
+    model = build_score_model(
+        [1, 2], matchups_by_week=matchups, latest_completed_week=3, get_player_game_state=states.get, last_week=5
+    )
+    scores = model.sample(2000, np.random.default_rng(0))
+    assert scores.shape == (2000, 2, 5)
+    assert (scores[:, 0, :3] == [10, 20, 30]).all() and (scores[:, 1, :3] == 7).all()
+    # Week 4: A finished with 30, B has no usable games (floor 0); C draws 7 but has 1 already
+    assert (scores[:, 0, 3] == 30).all() and (scores[:, 1, 3] == 7).all()
+    # Week 5 has no lineups yet: the latest ones are bootstrapped from A's history
+    assert set(np.unique(scores[:, 0, 4])) == {5.0, 10.0, 15.0}
+
+
+@pytest.fixture(scope="module")
+def league_model():
+    league = build_synthetic_league(num_teams=12, seed=7)
+    roster_ids = [r["roster_id"] for r in league["rosters"]]
+    return build_score_model(roster_ids, matchups_by_week=league["matchups"], latest_completed_week=10)
+
+
+def test_simulation_is_reproducible_and_consistent(league_model):
+    result = simulate(league_model, trials=3000, chunk=1000, seed=11)
+    assert result.probabilities["champion"].sum() == pytest.approx(1.0)
+    assert result.probabilities["bye"].sum() == pytest.approx(2.0)
+    assert result.probabilities["superbowl"].sum() == pytest.approx(3.0)  # three-team finals
+    assert result.probabilities["toilet_bowl"].sum() == pytest.approx(3.0)
+    assert result.expected_seed.sum() == pytest.approx(sum(range(1, 13)))
+    # Every trial pays the weekly highs of weeks 1-13, the season high, the Duel of the Fates and the champion
+    assert result.expected_payout.sum() == pytest.approx(13 * 25 + 75 + 100 + 700)
+
+    again = simulate(league_model, trials=3000, chunk=1000, seed=11, workers=2)
+    for name in OUTCOMES:
+        assert np.array_equal(result.probabilities[name], again.probabilities[name])
+    assert np.array_equal(result.expected_payout, again.expected_payout)
+
+    for pos in range(12):
+        low, median, high = (result.payout_percentiles[p][pos] for p in (5, 50, 95))
+        assert low <= median <= high and high <= 13 * 25 + 75 + 100 + 700
+
+    odds = result.to_dict({league_model.roster_ids[0]: "First"})
+    assert odds["trials"] == 3000 and len(odds["teams"]) == 12
+    assert [t["champion"] for t in odds["teams"]] == sorted((t["champion"] for t in odds["teams"]), reverse=True)
+    assert "First" in {t["team"] for t in odds["teams"]}
+    assert list(odds["teams"][0]["payout_percentiles"]) == ["p5", "p25", "p50", "p75", "p95"]
+
+
+def test_odds_are_built_in_the_background_per_version(app_module, monkeypatch):
+    monkeypatch.setattr(app_module.season_calendar, "latest_completed_week", lambda *a, **k: 14)
+    monkeypatch.setattr(app_module, "SIMULATION_TRIALS", 2000)
+    http = app_module.app.test_client()
+    assert http.get("/api/odds").status_code == 503
+
+    league = app_module.leagues.default
+    calls, gate = [], threading.Event()
+    gate.set()
+    real_simulate = app_module.simulate
+
+    def counted(*args, **kwargs):
+        calls.append(1)
+        gate.wait(timeout=10)
+        return real_simulate(*args, **kwargs)
+
+    monkeypatch.setattr(app_module, "simulate", counted)
+    app_module.fetch_playoff_data(league)
+    assert league.odds_builder.wait(timeout=10)
+
+    first = http.get("/api/odds")
+    assert first.status_code == 200
+    odds = first.get_json()
+    assert odds["version"] == league.live_state.version and odds["trials"] == 2000
+    assert {t["team"] for t in odds["teams"]} == {row["team"] for row in league.latest_data["standings"]}
+    # Week 14 is complete: the wildcard game is decided
+    assert sorted(t["wildcard_winner"] for t in odds["teams"]) == [0.0] * 11 + [1.0]
+    assert http.get("/api/leagues/default/odds").get_json() == odds
+    assert http.get("/api/odds", headers={"If-None-Match": first.headers["ETag"]}).status_code == 304
+    assert calls == [1]
+    assert http.get("/api/leagues/nope/odds").status_code == 404
+
+    # While the next version simulates, requests get the previous one without waiting for it
+    gate.clear()
+    monkeypatch.setattr(app_module.season_calendar, "latest_completed_week", lambda *a, **k: 13)
+    app_module.fetch_playoff_data(league)
+    assert league.live_state.version > odds["version"] and league.odds_builder.running
+    assert http.get("/api/odds").get_json() == odds
+    gate.set()
+    assert league.odds_builder.wait(timeout=10)
+    assert http.get("/api/odds").get_json()["version"] == league.live_state.version and calls == [1, 1]
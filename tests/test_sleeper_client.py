@@ -0,0 +1,117 @@
+import time
+
+import pytest
+import requests
+
+from sleeper.client import SleeperClient
+from sleeper.stub import SleeperStubServer, build_synthetic_league
+
+
+def test_endpoints_round_trip_against_stub(sleeper_stub, synthetic_league):
+    client = SleeperClient(sleeper_stub.base_url)
+    try:
+        user_id = client.get_user(synthetic_league["username"])["user_id"]
+        leagues = client.get_leagues(user_id, synthetic_league["season"])
+        assert [L["name"] for L in leagues] == [synthetic_league["league_name"]]
+
+        rosters, users = client.get_rosters_and_users(synthetic_league["league_id"])
+        assert len(rosters) == len(users) == 12
+    finally:
+        client.close()
+
+
+def test_matchups_for_weeks_preserves_order_and_payloads(sleeper_stub, synthetic_league):
+    client = SleeperClient(sleeper_stub.base_url, max_workers=4)
+    try:
+        weeks = [17, 3, 9, 1]
+        by_week = client.get_matchups_for_weeks(synthetic_league["league_id"], weeks)
+    finally:
+        client.close()
+
+    assert list(by_week) == weeks
+    for wk in weeks:
+        assert by_week[wk] == synthetic_league["matchups"][wk]
+
+
+def test_parallel_fan_out_reuses_pooled_connections():
+    league = build_synthetic_league(num_teams=12, seed=1)
+    with SleeperStubServer(league, latency=0.05) as stub:
+        client = SleeperClient(stub.base_url, max_workers=8)
+        try:
+            start = time.perf_counter()
+            client.get_matchups_for_weeks(league["league_id"], range(1, 18))
+            elapsed = time.perf_counter() - start
+            # Second pass must ride the existing keep-alive connections
+            client.get_matchups_for_weeks(league["league_id"], range(1, 18))
+        finally:
+            client.close()
+
+        assert stub.total_requests == 34
+        assert stub.connections <= 8
+
+    # 17 sequential round trips would take ≥ 0.85s; 8 workers need ~3 rounds
+    assert elapsed < 17 * 0.05 * 0.6
+
+
+def test_http_errors_propagate(sleeper_stub):
+    client = SleeperClient(sleeper_stub.base_url)
+    try:
+        with pytest.raises(requests.HTTPError):
+            client.get_matchups_for_weeks("does-not-exist", [1, 2])
+    finally:
+        client.close()
+
+
+def test_conditional_get_reuses_body_and_fingerprint(sleeper_stub, synthetic_league):
+    client = SleeperClient(sleeper_stub.base_url)
+    league_id = synthetic_league["league_id"]
+    prefix = f"/league/{league_id}/"
+    try:
+        first = client.get_matchups(league_id, 15)
+        fp = client.fingerprint(prefix)
+        again = client.get_matchups(league_id, 15)
+        assert again is first
+        assert sleeper_stub.not_modified == 1
+        assert client.stats == {"requests": 2, "not_modified": 1}
+        assert client.fingerprint(prefix) == fp
+
+        synthetic_league["matchups"][15][0]["points"] += 1.0
+        changed = client.get_matchups(league_id, 15)
+        assert changed[0]["points"] == synthetic_league["matchups"][15][0]["points"]
+        assert client.fingerprint(prefix) != fp
+    finally:
+        client.close()
+
+
+def test_request_budget_caps_the_sustained_rate():
+    from sleeper.budget import RequestBudget
+
+    now = [0.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    budget = RequestBudget(2, burst=2, clock=lambda: now[0], sleep=sleep)
+    # The burst goes out at once; after that one token every 1/rate seconds
+    assert [budget.acquire() for _ in range(4)] == [0.0, 0.0, 0.5, 0.5]
+    assert now[0] == pytest.approx(1.0)
+    now[0] += 10  # idle time refills only up to the burst
+    assert [budget.acquire() for _ in range(3)] == [0.0, 0.0, 0.5]
+    assert budget.stats == {"acquired": 7, "waited": 3, "wait_seconds": pytest.approx(1.5)}
+    with pytest.raises(ValueError):
+        RequestBudget(0)
+
+
+def test_client_spends_a_budget_token_per_request(sleeper_stub, synthetic_league):
+    from sleeper.budget import RequestBudget
+
+    budget = RequestBudget(1000)
+    client = SleeperClient(sleeper_stub.base_url, budget=budget)
+    try:
+        client.get_rosters_and_users(synthetic_league["league_id"])
+        client.get_matchups_for_weeks(synthetic_league["league_id"], [1, 2, 3])
+    finally:
+        client.close()
+    assert budget.stats["acquired"] == client.stats["requests"] == 5
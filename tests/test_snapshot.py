@@ -0,0 +1,81 @@
+import json
+import os
+import subprocess
+import sys
+
+from dashboard.snapshot import load_snapshot, restore_json_keys, write_snapshot
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_round_trip_is_atomic_and_ignores_placeholders(tmp_path):
+    path = tmp_path / "data_snapshot.json"
+    assert load_snapshot(str(path)) is None
+
+    # Shipped placeholder: BOM-prefixed with an empty timestamp
+    path.write_text('﻿{"timestamp": "", "standings": []}', encoding="utf-8")
+    assert load_snapshot(str(path)) is None
+
+    data = {"timestamp": "12/21/2025 13:05 CST", "standings": [{"team": "Ünïcode"}]}
+    assert write_snapshot(str(path), data)
+    assert load_snapshot(str(path)) == data
+    assert os.listdir(tmp_path) == ["data_snapshot.json"]
+
+    path.write_text("{truncated", encoding="utf-8")
+    assert load_snapshot(str(path)) is None
+
+
+def test_refresh_writes_snapshot_that_a_restart_loads(app_module, tmp_path):
+    app_module.fetch_playoff_data()
+    # JSON round trip: integer week keys come back as strings, as clients see them
+    expected = json.loads(json.dumps(app_module.leagues.default.latest_data))
+    with open(app_module.SNAPSHOT_PATH, encoding="utf-8") as fh:
+        assert json.load(fh) == expected
+
+    env = dict(
+        os.environ,
+        DATA_SNAPSHOT_PATH=app_module.SNAPSHOT_PATH,
+        STATE_STORE_URL="sqlite:///" + str(tmp_path / "state.sqlite3"),
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", "import json, app; print(json.dumps(app.leagues.default.live_state.snapshot()))"],
+        cwd=REPO_ROOT, env=env, capture_output=True, text=True, check=True,
+    ).stdout
+    restarted = json.loads(out.strip().splitlines()[-1])
+    assert restarted.pop("version") == 0
+    assert restarted == expected
+
+
+def test_loaded_data_keeps_integer_week_keys(app_module, monkeypatch):
+    monkeypatch.setattr(app_module.season_calendar, "latest_completed_week", lambda *a, **k: 14)
+    app_module.fetch_playoff_data()
+    fresh = app_module.leagues.default.latest_data
+    assert all(isinstance(week, int) for week in fresh["payouts"]["weeklyWinners"])
+
+    # A warm-started league sees no change when the first refresh rebuilds the same data
+    warm = app_module.make_league(app_module.DEFAULT_LEAGUE, app_module.SNAPSHOT_PATH)
+    assert warm.latest_data == fresh
+    assert warm.live_state.update(fresh) is None
+    assert restore_json_keys(json.loads(json.dumps(fresh))) == fresh
+
+
+def test_shipped_snapshot_is_only_read(app_module, tmp_path):
+    shipped = tmp_path / "shipped_snapshot.json"
+    write_snapshot(str(shipped), {"timestamp": "12/28/2025 21:00 CST", "standings": []})
+    before = shipped.read_bytes()
+
+    league = app_module.make_league(app_module.DEFAULT_LEAGUE, app_module.SNAPSHOT_PATH, str(shipped))
+    assert league.latest_data["timestamp"] == "12/28/2025 21:00 CST"
+    app_module.fetch_playoff_data(league)
+    assert shipped.read_bytes() == before
+    assert load_snapshot(app_module.SNAPSHOT_PATH)["timestamp"] != "12/28/2025 21:00 CST"
+
+
+def test_snapshot_defaults_to_the_cache_directory(tmp_path):
+    env = {k: v for k, v in os.environ.items() if k != "DATA_SNAPSHOT_PATH"}
+    env.update(SLEEPER_CACHE_DIR=str(tmp_path), STATE_STORE_URL="sqlite:///" + str(tmp_path / "state.sqlite3"))
+    out = subprocess.run(
+        [sys.executable, "-c", "import app; print(app.SNAPSHOT_PATH)"],
+        cwd=REPO_ROOT, env=env, capture_output=True, text=True, check=True,
+    ).stdout
+    assert out.strip().splitlines()[-1] == str(tmp_path / "data_snapshot.json")
@@ -0,0 +1,131 @@
+import sys
+
+import pytest
+
+from dashboard.state import VersionedState
+from dashboard.store import RedisStateStore, SQLiteStateStore, StoredState, open_state_store
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeRedis:
+    """In-process stand-in for the handful of Redis commands the store uses."""
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.values = {}
+        self.expiry = {}
+
+    def _live(self, key):
+        if key in self.expiry and self.expiry[key] <= self.clock():
+            self.values.pop(key, None)
+            self.expiry.pop(key, None)
+        return key in self.values
+
+    def get(self, key):
+        return self.values[key].encode() if self._live(key) else None
+
+    def set(self, key, value, nx=False, px=None):
+        if nx and self._live(key):
+            return None
+        self.values[key] = str(value)
+        self.expiry.pop(key, None)
+        if px is not None:
+            self.expiry[key] = self.clock() + px / 1000
+        return True
+
+    def pexpire(self, key, px):
+        if not self._live(key):
+            return False
+        self.expiry[key] = self.clock() + px / 1000
+        return True
+
+    def mset(self, mapping):
+        for key, value in mapping.items():
+            self.set(key, value)
+        return True
+
+    def delete(self, key):
+        self.values.pop(key, None)
+        self.expiry.pop(key, None)
+
+
+@pytest.fixture(params=["sqlite", "redis"])
+def stores(request, tmp_path):
+    """Two handles on one shared store, as two workers would hold, plus the clock."""
+    clock = FakeClock()
+    if request.param == "sqlite":
+        path = str(tmp_path / "state.sqlite3")
+        return SQLiteStateStore(path, clock=clock), SQLiteStateStore(path, clock=clock), clock
+    redis = FakeRedis(clock)
+    return RedisStateStore(redis), RedisStateStore(redis), clock
+
+
+def test_one_leader_until_its_lease_expires(stores):
+    a, b, clock = stores
+    assert a.acquire_leadership("a", ttl=180)
+    assert not b.acquire_leadership("b", ttl=180)
+    assert b.leader() == "a"
+
+    clock.now += 120
+    assert a.acquire_leadership("a", ttl=180)  # renewal
+    clock.now += 120
+    assert not b.acquire_leadership("b", ttl=180)
+
+    clock.now += 61  # "a" stopped renewing
+    assert b.acquire_leadership("b", ttl=180)
+    assert not a.acquire_leadership("a", ttl=180)
+    assert a.leader() == "b"
+
+    b.release_leadership("a")  # only the owner can release
+    assert a.leader() == "b"
+    b.release_leadership("b")
+    assert a.leader() is None
+    assert a.acquire_leadership("a", ttl=180)
+
+
+def test_published_versions_only_move_forward(stores):
+    a, b, _ = stores
+    assert b.version("default") == 0 and b.load_if_newer("default", 0) is None
+
+    assert a.publish("default", StoredState(2, {"week15": 2}, {"timestamp": "t2"}))
+    assert not a.publish("default", StoredState(1, {"week15": 1}, {"timestamp": "t1"}))  # deposed leader
+    assert b.version("default") == 2
+    stored = b.load_if_newer("default", 0)
+    assert stored == StoredState(2, {"week15": 2}, {"timestamp": "t2"})
+    assert b.load_if_newer("default", 2) is None
+
+    # Leagues are versioned independently
+    assert a.publish("42", StoredState(1, {}, {"timestamp": "other"}))
+    assert b.version("42") == 1 and b.version("default") == 2
+    assert b.load_if_newer("42", 0).data == {"timestamp": "other"}
+
+
+def test_follower_restore_matches_leader_versions():
+    leader = VersionedState({"timestamp": "", "week15": {}})
+    leader.update({"timestamp": "t1", "week15": {"1": 10}})
+    delta = leader.update({"timestamp": "t2", "week15": {"1": 12}})
+
+    follower = VersionedState({"timestamp": ""})
+    follower.restore(leader.version, dict(leader.data), dict(leader.section_versions))
+    assert follower.version == delta["version"] == 2
+    assert follower.section("week15") == (2, {"1": 12})
+    # The next leader delta applies on top of the adopted version
+    nxt = leader.update({"timestamp": "t3", "week15": {"1": 12}})
+    assert nxt["base_version"] == follower.version
+
+
+def test_open_state_store_urls(tmp_path, monkeypatch):
+    store = open_state_store("sqlite:///" + str(tmp_path / "a" / "state.sqlite3"))
+    assert isinstance(store, SQLiteStateStore) and store.version("default") == 0
+    assert isinstance(open_state_store(str(tmp_path / "b.sqlite3")), SQLiteStateStore)
+
+    monkeypatch.setitem(sys.modules, "redis", None)
+    with pytest.raises(RuntimeError, match="redis"):
+        open_state_store("redis://localhost:6379/0")
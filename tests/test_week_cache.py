@@ -0,0 +1,82 @@
+from datetime import datetime
+
+from sleeper import season
+from sleeper.client import SleeperClient
+from sleeper.week_cache import WeekCache
+
+
+def central(*args):
+    return season.CENTRAL_TZ.localize(datetime(*args))
+
+
+def _matchup_paths(stub):
+    return sorted(p.rsplit("/", 1)[-1] for p in stub.requests if "/matchups/" in p)
+
+
+def test_completed_weeks_freeze_and_only_live_week_is_polled(sleeper_stub, synthetic_league, tmp_path):
+    client = SleeperClient(sleeper_stub.base_url)
+    cache = WeekCache(tmp_path / "weeks.json")
+    league_id = synthetic_league["league_id"]
+    try:
+        first = cache.get_matchups(client, league_id, range(1, 18), latest_completed_week=14)
+        assert sleeper_stub.total_requests == 17
+        assert cache.frozen_weeks(league_id) == list(range(1, 15))
+
+        sleeper_stub.reset_counters()
+        second = cache.get_matchups(client, league_id, range(1, 18), latest_completed_week=14)
+        # Weeks 16-17 are within the slow TTL; only the live week is re-fetched
+        assert _matchup_paths(sleeper_stub) == ["15"]
+        assert second == first
+    finally:
+        client.close()
+
+
+def test_future_weeks_refresh_after_slow_ttl(sleeper_stub, synthetic_league, tmp_path):
+    now = [1000.0]
+    client = SleeperClient(sleeper_stub.base_url)
+    cache = WeekCache(tmp_path / "weeks.json", slow_ttl=300, clock=lambda: now[0])
+    league_id = synthetic_league["league_id"]
+    try:
+        cache.get_matchups(client, league_id, range(14, 18), latest_completed_week=14)
+        cache.get_rosters_and_users(client, league_id)
+        now[0] += 301
+        sleeper_stub.reset_counters()
+
+        cache.get_matchups(client, league_id, range(14, 18), latest_completed_week=14)
+        cache.get_rosters_and_users(client, league_id)
+        assert _matchup_paths(sleeper_stub) == ["15", "16", "17"]
+        assert sleeper_stub.total_requests == 5
+    finally:
+        client.close()
+
+
+def test_cold_restart_loads_frozen_weeks_and_league_without_network(sleeper_stub, synthetic_league, tmp_path):
+    path = tmp_path / "weeks.json"
+    client = SleeperClient(sleeper_stub.base_url)
+    try:
+        warm = WeekCache(path)
+        league_id = warm.resolve_league_id(
+            client, synthetic_league["username"], synthetic_league["season"], synthetic_league["league_name"]
+        )
+        expected = warm.get_matchups(client, league_id, range(1, 18), latest_completed_week=17)
+
+        sleeper_stub.reset_counters()
+        cold = WeekCache(path)
+        assert cold.resolve_league_id(
+            client, synthetic_league["username"], synthetic_league["season"], synthetic_league["league_name"]
+        ) == league_id
+        assert cold.get_matchups(client, league_id, range(1, 18), latest_completed_week=17) == expected
+        assert sleeper_stub.total_requests == 0
+    finally:
+        client.close()
+
+
+def test_weeks_freeze_at_central_midnight_across_dst():
+    # September (CDT): Week 1 is final from Tuesday 00:00
+    assert season.latest_completed_week(central(2025, 9, 8, 23, 59)) == 0
+    assert season.latest_completed_week(central(2025, 9, 9, 0, 0)) == 1
+    # After the November change (CST) Monday Night Football still runs at 23:15: not final yet
+    assert season.latest_completed_week(central(2025, 12, 29, 23, 15)) == 16
+    assert season.latest_completed_week(central(2025, 12, 30, 0, 0)) == 17
+    assert season.current_nfl_week(central(2025, 12, 17, 23, 59)) == 15
+    assert season.current_nfl_week(central(2025, 12, 18, 0, 30)) == 16
@@ -0,0 +1 @@
+"""Tournament bracket package for Quantum Gauntlet"""
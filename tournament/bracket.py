@@ -0,0 +1,446 @@
+"""
+Quantum Gauntlet Bracket Engine
+-------------------------------
+
+Resolves the playoff bracket on roster ids and renders dashboard sections
+(``payouts``, ``week14`` … ``week17``, ``standings``, ``the_run``):
+- Round 1 positions: seeds 1-2 Bye, 3-6 Playoff, best Week 14 wildcard
+  (seeds 7-12) advances, the rest go to the Toilet Bowl
+- Week 15 Duel of the Fates (bye teams, Week 14+15 combined), Divisional Round
+  (Week 15 only) and wildcard losers (combined)
+- Week 16 Conference Championship, Purgatory and Toilet Bowl
+- Week 17 Superbowl, Purgatory and Toilet Bowl
+
+``resolve_bracket`` works only with ``Team`` records keyed by ``roster_id``:
+every round is an ordered list of ids plus a set index, so advancement is an
+O(1) membership test per team. ``"(seed) Team"`` display strings are produced
+only by ``render_sections``. Each section is rendered once and
+``the_run.playoff_results`` references the same ``week15``/``week16``/``week17``
+objects. Projections are supplied by the caller as ``project(roster_id, week)``;
+prize money comes from a ``tournament.payouts.PayoutTable``.
+
+Public API:
+  - Team
+  - Bracket
+  - teams_from_results
+  - resolve_bracket
+  - render_sections
+  - build_tournament_sections
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+import numpy as np
+
+from tournament.payouts import PAYOUTS, PayoutTable, bracket_events
+
+PLAYOFF_WEEKS = (14, 15, 16, 17)
+
+
+def fmt(x):
+    return f"{x:.2f}" if isinstance(x, (int, float)) else x
+
+
+@dataclass
+class Team:
+    roster_id: int
+    name: str
+    seed: int
+    pre_total: float
+    week_points: Dict[int, float]
+    all_weekly_scores: List[float] = field(default_factory=list)
+    weekly_records: List[dict] = field(default_factory=list)
+    position: str = ""
+    combined: float = 0.0
+
+    def wk(self, week: int) -> float:
+        return self.week_points.get(week, 0.0)
+
+    @property
+    def label(self) -> str:
+        return f"({self.seed}) {self.name}"
+
+
+@dataclass
+class Bracket:
+    teams: Dict[int, Team]
+    # Ordered roster ids per round/list; see resolve_bracket for the keys
+    rounds: Dict[str, List[int]]
+    wildcard_winner: Optional[int]
+    champion: Optional[int]
+
+    def __post_init__(self) -> None:
+        self.members: Dict[str, Set[int]] = {name: set(ids) for name, ids in self.rounds.items()}
+
+    def team_list(self, name: str) -> List[Team]:
+        return [self.teams[rid] for rid in self.rounds[name]]
+
+
+def teams_from_results(results: Iterable[dict]) -> List[Team]:
+    """Convert seeded result rows (``orig_seed``, ``wk14`` … ``wk17``) into Team records."""
+    return [
+        Team(
+            roster_id=r["roster_id"],
+            name=r["team"],
+            seed=r["orig_seed"],
+            pre_total=r["pre_total"],
+            week_points={wk: r[f"wk{wk}"] for wk in PLAYOFF_WEEKS},
+            all_weekly_scores=r.get("all_weekly_scores", []),
+            weekly_records=r.get("weekly_records", []),
+        )
+        for r in results
+    ]
+
+
+def _by(week: int):
+    return lambda t: t.wk(week)
+
+
+def _ids(teams: Iterable[Team]) -> List[int]:
+    return [t.roster_id for t in teams]
+
+
+def resolve_bracket(teams: List[Team]) -> Bracket:
+    """
+    Resolve every round from ``teams`` given in seed order. Sorting is stable,
+    so ties keep the order of the list each round is drawn from.
+    """
+    by_id = {t.roster_id: t for t in teams}
+
+    # ——— ROUND 1 POSITIONS ———
+    wildcards = [t for t in teams if 7 <= t.seed <= 12]
+    wildcard_winner = max(wildcards, key=_by(14)) if wildcards else None
+    for t in teams:
+        if t.seed <= 2:
+            t.position = "Bye"
+        elif t.seed <= 6:
+            t.position = "Playoff"
+        else:
+            t.position = "Wildcard Winner" if t is wildcard_winner else "Toliet Bowl"
+
+    bye = [t for t in teams if t.position == "Bye"]
+    playoff14 = sorted([t for t in teams if t.position == "Playoff"], key=_by(14), reverse=True)
+    wildcard = sorted([t for t in teams if t.position in ("Wildcard Winner", "Toliet Bowl")],
+                      key=_by(14), reverse=True)
+    for t in bye + wildcard:
+        t.combined = t.wk(14) + t.wk(15)
+
+    # ——— WEEK 15 ———
+    # Divisional Round (Seeds 3-6 + wildcard winner): Week 15 ONLY (no aggregate)
+    playoff15 = [t for t in teams if 3 <= t.seed <= 6] + ([wildcard_winner] if wildcard_winner else [])
+    divisional = sorted(playoff15, key=_by(15), reverse=True)[:5]
+    wildcard_losers = [t for t in wildcard if t is not wildcard_winner]
+    wild_comb = sorted(wildcard_losers, key=lambda t: t.combined, reverse=True)[:5]
+
+    # ——— WEEK 16 (displayed rounds advance from the Week 15 results) ———
+    conf_ids = set(_ids(bye)) | set(_ids(divisional[:3]))
+    conference = sorted([t for t in teams if t.roster_id in conf_ids], key=_by(16), reverse=True)
+    purg16_ids = set(_ids(divisional[3:])) | set(_ids(wild_comb[:1]))
+    purgatory16 = sorted([t for t in teams if t.roster_id in purg16_ids], key=_by(16), reverse=True)
+    toilet16_ids = set(_ids(wild_comb[1:]))
+    toilet16 = sorted([t for t in teams if t.roster_id in toilet16_ids], key=_by(16), reverse=True)
+
+    # ——— WEEK 17 ———
+    superbowl = sorted(conference[:3], key=_by(17), reverse=True)
+    purg17_ids = set(_ids(conference[3:])) | set(_ids(purgatory16)) | set(_ids(toilet16[:1]))
+    purgatory17 = sorted([t for t in teams if t.roster_id in purg17_ids], key=_by(17), reverse=True)
+
+    # Champion payout and the Week 17 toilet bowl follow the Week 16 score lists
+    conf_list = bye + sorted(divisional, key=_by(16), reverse=True)[:3]
+    conf_top3 = sorted(conf_list, key=_by(16), reverse=True)[:3]
+    conf_top3_sorted = sorted(conf_top3, key=_by(17), reverse=True)
+    purg_list = sorted(divisional, key=_by(15))[:2] + [sorted(wildcard, key=_by(16), reverse=True)[1]]
+    bottom2_conf16 = sorted(conf_list, key=_by(16))[:2]
+    conf_purg_ids = set(_ids(conf_list)) | set(_ids(purg_list))
+    toilet_list = sorted([t for t in wildcard if t.roster_id not in conf_purg_ids], key=_by(15))[:4]
+    toilet_top16 = max(toilet_list, key=_by(16)) if toilet_list else None
+    exclude_ids = set(_ids(conf_top3)) | set(_ids(purg_list)) | set(_ids(bottom2_conf16))
+    if toilet_top16:
+        exclude_ids.add(toilet_top16.roster_id)
+    toilet_candidates = [t for t in wildcard if t.roster_id not in exclude_ids]
+    toilet17 = sorted(sorted(toilet_candidates, key=_by(16))[:3], key=_by(17), reverse=True)
+
+    return Bracket(
+        teams=by_id,
+        rounds={
+            "seeded": _ids(teams),
+            "bye": _ids(bye),
+            "playoff14": _ids(playoff14),
+            "wildcard": _ids(wildcard),
+            "divisional": _ids(divisional),
+            "wildcard_losers": _ids(wildcard_losers),
+            "wild_comb": _ids(wild_comb),
+            "conference": _ids(conference),
+            "purgatory16": _ids(purgatory16),
+            "toilet16": _ids(toilet16),
+            "superbowl": _ids(superbowl),
+            "purgatory17": _ids(purgatory17),
+            "toilet17": _ids(toilet17),
+        },
+        wildcard_winner=wildcard_winner.roster_id if wildcard_winner else None,
+        champion=conf_top3_sorted[0].roster_id if conf_top3_sorted else None,
+    )
+
+
+def render_sections(
+    bracket: Bracket,
+    *,
+    project: Callable[[int, int], float],
+    latest_completed_week: int,
+    current_time: str,
+    table: PayoutTable = PAYOUTS,
+) -> Dict[str, Any]:
+    """
+    Serialize a resolved bracket into the ``latest_data`` sections (without
+    ``timestamp``); prize amounts come from ``table``.
+    """
+    teams = bracket.team_list("seeded")
+    bye = bracket.team_list("bye")
+
+    # ——— PAYOUTS ———
+    # For tournament display, show the week after the latest completed week
+    current_week_for_display = min(latest_completed_week + 1, 17)
+
+    # Prizes earned so far, in seed order
+    _, events = bracket_events(bracket, latest_completed_week, table)
+
+    # Weekly high scores (only for completed weeks 1-13)
+    weekly_winners = {}
+    for week, pos in enumerate(events.weekly_high[0], 1):
+        if pos >= 0:
+            weekly_winners[week] = {
+                'team': teams[pos].name,
+                'score': teams[pos].all_weekly_scores[week - 1],
+                'week': week,
+                'payout': table.weekly_high,
+                'date': ''  # Can be populated with actual dates if needed
+            }
+
+    # Season high score (only if week 13 is complete)
+    season_high_score = None
+    for pos in np.flatnonzero(events.season_high[0]):
+        season_high_score = {
+            'team': teams[pos].name,
+            'totalScore': teams[pos].pre_total,
+            'payout': table.season_high,
+            'date': ''
+        }
+
+    # Duel of the Fates: bye teams ranked by Week 14+15 combined; labels show the stakes before it is decided
+    duel_payout_labels: Dict[int, str] = {}
+    duel_of_fates = {}
+    if len(bye) >= 2:
+        winner, loser = sorted(bye, key=lambda t: t.combined, reverse=True)[:2]
+        win_payout, lose_payout = table.duel(winner.combined - loser.combined)
+        duel_payout_labels = {winner.roster_id: f"${win_payout:.2f}", loser.roster_id: f"${lose_payout:.2f}"}
+        # Only paid out once week 15 is complete
+        if events.duel_winner.any():
+            duel_of_fates[winner.name] = {
+                'team': winner.name,
+                'payout': win_payout,
+                'category': 'Duel of the Fates Winner',
+                'date': ''
+            }
+            duel_of_fates[loser.name] = {
+                'team': loser.name,
+                'payout': lose_payout,
+                'category': 'Duel of the Fates Runner-up',
+                'date': ''
+            }
+    elif bye:
+        duel_payout_labels = {bye[0].roster_id: f"${table.duel(0.0)[0]:.2f}"}
+
+    # Champion (only if week 17 is complete)
+    champion = None
+    for pos in np.flatnonzero(events.champion[0]):
+        champion = {
+            'team': teams[pos].name,
+            'payout': table.champion,
+            'date': ''
+        }
+
+    payouts_data = {
+        'weeklyWinners': weekly_winners,
+        'seasonHighScore': season_high_score,
+        'duelOfFates': duel_of_fates,
+        'champion': champion,
+        'lastUpdated': current_time,
+        'currentWeek': latest_completed_week,  # For payout display (completed only)
+        'currentWeekInProgress': current_week_for_display  # For tournament display (includes in-progress)
+    }
+
+    # ——— ROW HELPERS ———
+    def payout15(t: Team) -> str:
+        if t.roster_id not in bracket.members["bye"]:
+            return "$-"
+        return duel_payout_labels.get(t.roster_id, f"${table.duel(0.0)[1]:.2f}")
+
+    def payout17(t: Team) -> str:
+        return f"${table.champion:.2f}" if t.roster_id == bracket.champion else "$-"
+
+    def projected(t: Team, week: int) -> str:
+        return fmt(project(t.roster_id, week))
+
+    def scored(rows: List[Team], week: int) -> List[dict]:
+        return [{'team': t.label, 'score': fmt(t.wk(week))} for t in rows]
+
+    # ——— STANDINGS ———
+    initial_standings = [
+        {'seed': idx, 'team': t.name, 'position': t.position, 'pre_total': fmt(t.pre_total)}
+        for idx, t in enumerate(teams, start=1)
+    ]
+    standings = [
+        {'seed': t.seed, 'team': t.name, 'position': t.position, 'pre_total': fmt(t.pre_total)}
+        for t in teams
+    ]
+
+    # ——— WEEK 14 / 15 ———
+    bye_pair = sorted(bye, key=lambda t: t.seed)
+    bye_pair = (bye_pair + bye_pair)[:2] if bye_pair else []
+    week14_data = {
+        'bye': scored(bye_pair, 14),
+        'playoff': [{'team': t.label, 'score': 'Bye Week'} for t in bracket.team_list("playoff14")[:4]],
+        'wildcard': scored(bracket.team_list("wildcard"), 14)
+    }
+
+    bye_result = []
+    for t in bye:
+        proj = projected(t, 15)
+        bye_result.append({
+            'team': t.label,
+            'proj_score': proj,
+            'score': proj,
+            'next_week': "Conf Champ",
+            'payout': payout15(t)
+        })
+    week15_data = {
+        'bye': scored(bye_pair, 15),
+        'playoff': scored(bracket.team_list("divisional"), 15),
+        'toilet': scored(bracket.team_list("wildcard_losers"), 15),
+        'bye_result': bye_result,
+        'playoff_result': [
+            {
+                'team': t.label,
+                'proj_score': projected(t, 15),
+                'score': fmt(t.wk(15)),
+                'next_week': "Conf Champ" if idx < 3 else "Purgatory",
+                'payout': payout15(t)
+            } for idx, t in enumerate(bracket.team_list("divisional"))
+        ],
+        'toilet_result': [
+            {
+                'team': t.label,
+                'proj_score': projected(t, 15),
+                'score': fmt(t.combined),
+                'next_week': "Purgatory" if idx == 0 else "Toilet Bowl",
+                'payout': payout15(t)
+            } for idx, t in enumerate(bracket.team_list("wild_comb"))
+        ]
+    }
+
+    # ——— WEEK 16 ———
+    week16_data = {
+        'conference': [
+            {
+                'team': t.label,
+                'proj_score': projected(t, 16),
+                'score': fmt(t.wk(16)),
+                'next_week': 'Superbowl' if idx < 3 else 'Purgatory'
+            } for idx, t in enumerate(bracket.team_list("conference"))
+        ],
+        'purgatory': [
+            {
+                'team': t.label,
+                'proj_score': projected(t, 16),
+                'score': fmt(t.wk(16)),
+                'next_week': 'Purgatory'
+            } for t in bracket.team_list("purgatory16")
+        ],
+        'toilet': [
+            {
+                'team': t.label,
+                'proj_score': projected(t, 16),
+                'score': fmt(t.wk(16)),
+                'next_week': 'Purgatory' if idx == 0 else 'Toilet Bowl'
+            } for idx, t in enumerate(bracket.team_list("toilet16"))
+        ]
+    }
+
+    # ——— WEEK 17 ———
+    week17_data = {
+        'championship': [
+            {
+                'team': t.label,
+                'proj_score': projected(t, 17),
+                'score': fmt(t.wk(17)),
+                'final_result': "Champion" if idx == 0 else "Purgatory",
+                'payout': payout17(t)
+            } for idx, t in enumerate(bracket.team_list("superbowl"))
+        ],
+        'purgatory': [
+            {
+                'team': t.label,
+                'proj_score': projected(t, 17),
+                'score': fmt(t.wk(17)),
+                'final_result': "Purgatory",
+                'payout': payout17(t)
+            } for t in bracket.team_list("purgatory17")
+        ],
+        'toilet': [
+            {
+                'team': t.label,
+                'proj_score': projected(t, 17),
+                'score': fmt(t.wk(17)),
+                'final_result': "Toilet Bowl",
+                'payout': payout17(t)
+            } for t in bracket.team_list("toilet17")
+        ]
+    }
+
+    return {
+        'payouts': payouts_data,
+        'week14': week14_data,
+        'week15': week15_data,
+        'week16': week16_data,
+        'week17': week17_data,
+        'standings': standings,
+        'initial_standings': initial_standings,
+        'the_run': {
+            'teams': [
+                {
+                    'team': t.name,
+                    'seed': t.seed,
+                    'weekly_records': t.weekly_records,
+                    'all_weekly_scores': t.all_weekly_scores,
+                    'position': t.position,
+                    'playoff_scores': {f"wk{wk}": t.wk(wk) for wk in PLAYOFF_WEEKS}
+                } for t in teams
+            ],
+            # Same section objects as above, not rebuilt copies
+            'playoff_results': {
+                'week15': week15_data,
+                'week16': week16_data,
+                'week17': week17_data
+            }
+        }
+    }
+
+
+def build_tournament_sections(
+    results: List[dict],
+    *,
+    project: Callable[[int, int], float],
+    latest_completed_week: int,
+    current_time: str,
+) -> Dict[str, Any]:
+    """Resolve the bracket for seeded ``results`` rows and render every section."""
+    bracket = resolve_bracket(teams_from_results(results))
+    return render_sections(
+        bracket,
+        project=project,
+        latest_completed_week=latest_completed_week,
+        current_time=current_time,
+    )
@@ -0,0 +1,175 @@
+"""
+Quantum Gauntlet Payout Engine
+------------------------------
+
+One table of prize money, evaluated the same way for the actual season and
+for batches of simulated ones:
+- ``PayoutTable`` holds the amounts: $25 weekly high (weeks 1-13), $75 season
+  high, the Duel of the Fates margin tiers ($60/$40 up to 7.5 points …
+  $100/$0 beyond 30) and $700 for the champion; ``PAYOUTS`` is the league's
+  table
+- ``PayoutEvents`` records who earned what in ``trials`` seasons as arrays
+  (weekly high winners, season high, duel winner/runner-up and margin,
+  champion); ``bracket_events`` builds the single-trial events of an actual
+  ``Bracket`` so far, so unfinished prizes are not counted
+- ``evaluate`` turns events into a ``trials × teams`` payout matrix with a
+  handful of array operations (the duel tiers are one ``searchsorted``)
+- ``summarize`` reduces a payout matrix to per-team expected values and
+  percentiles
+
+Public API:
+  - PAYOUTS
+  - PayoutEvents
+  - PayoutTable
+  - bracket_events
+  - evaluate
+  - summarize
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+DEFAULT_PERCENTILES = (5, 25, 50, 75, 95)
+
+
+@dataclass(frozen=True)
+class PayoutTable:
+    weekly_high: float = 25
+    # Weekly highs are paid for weeks 1 … weekly_high_weeks
+    weekly_high_weeks: int = 13
+    season_high: float = 75
+    # (largest winning margin, winner, runner-up), ascending; the last tier catches every margin
+    duel_tiers: Tuple[Tuple[float, float, float], ...] = (
+        (7.5, 60, 40),
+        (15, 70, 30),
+        (23.5, 80, 20),
+        (30, 90, 10),
+        (math.inf, 100, 0),
+    )
+    champion: float = 700
+
+    def duel(self, margin: float) -> Tuple[float, float]:
+        """Duel of the Fates (winner, runner-up) payout for a winning margin."""
+        for limit, win, lose in self.duel_tiers:
+            if margin <= limit:
+                return win, lose
+        raise ValueError(f"No Duel of the Fates tier covers a margin of {margin}")
+
+    def duel_arrays(self, margins: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """``duel`` for an array of margins."""
+        limits, wins, loses = (np.array(column, dtype=float) for column in zip(*self.duel_tiers))
+        # side="left": a margin equal to a tier's limit still belongs to that tier
+        tier = np.minimum(np.searchsorted(limits, margins, side="left"), len(limits) - 1)
+        return wins[tier], loses[tier]
+
+
+PAYOUTS = PayoutTable()
+
+
+@dataclass
+class PayoutEvents:
+    # trials × weekly_high_weeks team index of each weekly high (-1: not awarded)
+    weekly_high: np.ndarray
+    # trials × teams flags
+    season_high: np.ndarray
+    duel_winner: np.ndarray
+    duel_runner_up: np.ndarray
+    champion: np.ndarray
+    # trials winning margins of the duel (ignored where nobody won it)
+    duel_margin: np.ndarray
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.season_high.shape
+
+    def weekly_high_counts(self) -> np.ndarray:
+        """trials × teams number of weekly highs won."""
+        trials, teams = self.shape
+        # One bincount over (trial, team) cells; unawarded weeks land in a spare bin
+        cells = np.where(self.weekly_high >= 0, np.arange(trials)[:, None] * teams + self.weekly_high, trials * teams)
+        return np.bincount(cells.ravel(), minlength=trials * teams + 1)[:-1].reshape(trials, teams).astype(float)
+
+
+def evaluate(events: PayoutEvents, table: PayoutTable = PAYOUTS) -> np.ndarray:
+    """trials × teams total payout per team."""
+    win, lose = table.duel_arrays(events.duel_margin)
+    return (
+        table.weekly_high * events.weekly_high_counts()
+        + table.season_high * events.season_high
+        + np.where(events.duel_winner, win[:, None], 0.0)
+        + np.where(events.duel_runner_up, lose[:, None], 0.0)
+        + table.champion * events.champion
+    )
+
+
+def summarize(payouts: np.ndarray, percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> Dict[str, object]:
+    """
+    Per-team ``expected`` payout and ``percentiles`` (percentile → per-team
+    amount) of a ``trials × teams`` payout matrix. Percentiles are amounts a
+    team actually receives in some trial, never interpolations between them.
+    """
+    return {
+        "expected": payouts.mean(axis=0, dtype=np.float64),
+        "percentiles": {
+            p: values
+            for p, values in zip(percentiles, np.percentile(payouts, percentiles, axis=0, method="inverted_cdf"))
+        },
+    }
+
+
+def bracket_events(bracket, latest_completed_week: int, table: PayoutTable = PAYOUTS) -> Tuple[List[int], PayoutEvents]:
+    """
+    Roster ids in seed order and the one-trial events of an actual bracket,
+    counting only prizes whose weeks are complete: weekly highs of completed
+    weeks (weeks nobody scored in are skipped), the season high after the
+    regular season, the duel after Week 15 and the champion after Week 17.
+    """
+    teams = bracket.team_list("seeded")
+    roster_ids = [t.roster_id for t in teams]
+    position = {rid: pos for pos, rid in enumerate(roster_ids)}
+    n = len(teams)
+
+    weekly_high = np.full((1, table.weekly_high_weeks), -1)
+    for week in range(1, min(table.weekly_high_weeks, latest_completed_week) + 1):
+        scores = [t.all_weekly_scores[week - 1] for t in teams]
+        if any(score > 0 for score in scores):
+            # First team (by seed) with the week's best score
+            weekly_high[0, week - 1] = max(range(n), key=lambda pos: scores[pos])
+
+    season_high = np.zeros((1, n), dtype=bool)
+    if latest_completed_week >= table.weekly_high_weeks and teams:
+        season_high[0, max(range(n), key=lambda pos: teams[pos].pre_total)] = True
+
+    duel_winner = np.zeros((1, n), dtype=bool)
+    duel_runner_up = np.zeros((1, n), dtype=bool)
+    margin = np.zeros(1)
+    duel = _duel_pair(bracket.team_list("bye"))
+    if duel is not None and latest_completed_week >= 15:
+        winner, loser = duel
+        duel_winner[0, position[winner.roster_id]] = True
+        duel_runner_up[0, position[loser.roster_id]] = True
+        margin[0] = winner.combined - loser.combined
+
+    champion = np.zeros((1, n), dtype=bool)
+    if latest_completed_week >= 17 and bracket.champion is not None:
+        champion[0, position[bracket.champion]] = True
+
+    return roster_ids, PayoutEvents(
+        weekly_high=weekly_high,
+        season_high=season_high,
+        duel_winner=duel_winner,
+        duel_runner_up=duel_runner_up,
+        champion=champion,
+        duel_margin=margin,
+    )
+
+
+def _duel_pair(bye: Iterable):
+    """(winner, runner-up) of the Duel of the Fates: the bye teams by Week 14+15 combined."""
+    ranked = sorted(bye, key=lambda t: t.combined, reverse=True)
+    return (ranked[0], ranked[1]) if len(ranked) >= 2 else None
@@ -0,0 +1,410 @@
+"""
+Quantum Gauntlet Monte Carlo Simulator
+--------------------------------------
+
+Championship odds and expected payouts from many sampled seasons:
+- ``build_score_model`` freezes the weeks that are complete and, for every
+  remaining week, each roster's starters (the latest known lineup when a
+  week has none yet) with their histories: the points they scored in the
+  completed weeks, 0-point games dropped as DNPs
+- Each trial draws every starter's score from their history (bootstrap);
+  in the week in progress FINISHED starters keep their live points and
+  IN_PROGRESS starters score at least what they have, as in the projection's
+  selection rule
+- ``resolve_outcomes`` replays ``tournament.bracket`` on a whole batch of
+  trials with stable array sorts (seeding, wildcard, Duel of the Fates,
+  Divisional Round, Conference Championship, Purgatory, Toilet Bowl and the
+  champion), ties broken exactly like the list-based engine
+- ``simulate`` runs the trials in chunks (bounded memory, optionally on a
+  process pool) and reports, per team, the probability of each outcome and
+  the expected payout and payout percentiles (``tournament.payouts``)
+
+Public API:
+  - OUTCOMES
+  - ScoreModel
+  - SimulationResult
+  - build_score_model
+  - resolve_outcomes
+  - simulate
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import repeat
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from projection.quantum_gauntlet import GameState, build_matchup_index
+from tournament.payouts import DEFAULT_PERCENTILES, PAYOUTS, PayoutEvents, PayoutTable, evaluate, summarize
+
+REGULAR_WEEKS = 13
+LAST_WEEK = 17
+# Per-team outcome flags reported by ``simulate``
+OUTCOMES = (
+    "bye",
+    "wildcard_winner",
+    "duel_winner",
+    "conference",
+    "superbowl",
+    "champion",
+    "purgatory",
+    "toilet_bowl",
+)
+
+_NOT_STARTED, _IN_PROGRESS, _FINISHED = 0, 1, 2
+_STATE_CODES = {"NOT_STARTED": _NOT_STARTED, "IN_PROGRESS": _IN_PROGRESS}
+
+
+@dataclass
+class _WeekDraw:
+    week: int
+    # starters: row in ScoreModel.history, live points and state code
+    slots: np.ndarray
+    live: np.ndarray
+    states: np.ndarray
+    # starters × teams indicator, so team totals are one matrix product
+    owners: np.ndarray
+
+
+@dataclass
+class ScoreModel:
+    roster_ids: List[int]
+    # teams × weeks, NaN where the week is sampled
+    fixed: np.ndarray
+    # players × max games; row p holds counts[p] usable values
+    history: np.ndarray
+    counts: np.ndarray
+    draws: List[_WeekDraw]
+
+    def sample(self, trials: int, rng: np.random.Generator) -> np.ndarray:
+        """``trials × teams × weeks`` scores (week w in column w - 1)."""
+        scores = np.broadcast_to(self.fixed, (trials,) + self.fixed.shape).copy()
+        width = self.history.shape[1]
+        flat = self.history.ravel()
+        for draw in self.draws:
+            # Uniform pick among each starter's games, gathered from the flattened history
+            # (a float32 draw is < 1, so the product stays below the count)
+            counts = self.counts[draw.slots].astype(np.float32)
+            picks = (rng.random((trials, len(draw.slots)), dtype=np.float32) * counts).astype(np.int32)
+            values = np.take(flat, (draw.slots * width).astype(np.int32) + picks)
+            if draw.states.any():
+                values = np.where(
+                    draw.states == _FINISHED,
+                    draw.live,
+                    np.where(draw.states == _IN_PROGRESS, np.maximum(values, draw.live), values),
+                )
+            scores[:, :, draw.week - 1] = values @ draw.owners
+        return scores
+
+
+def build_score_model(
+    roster_ids: Iterable[int],
+    *,
+    matchups_by_week: Dict[int, List[dict]],
+    latest_completed_week: int,
+    get_player_game_state: Optional[Callable[[str], GameState]] = None,
+    exclude_zero_points: bool = True,
+    default_floor: float = 0.0,
+    last_week: int = LAST_WEEK,
+) -> ScoreModel:
+    """
+    Score model for the weeks after ``latest_completed_week``. ``roster_ids``
+    order breaks seeding ties, like the order rosters are listed in.
+    ``get_player_game_state`` applies to the week in progress (default: not started).
+    """
+    roster_ids = [int(rid) for rid in roster_ids]
+    index = build_matchup_index(matchups_by_week)
+    completed = [w for w in range(1, last_week + 1) if w <= latest_completed_week]
+
+    fixed = np.full((len(roster_ids), last_week), np.nan)
+    for week in completed:
+        week_rosters = index.rosters.get(week, {})
+        for pos, rid in enumerate(roster_ids):
+            fixed[pos, week - 1] = float((week_rosters.get(rid) or {}).get("points") or 0.0)
+
+    player_rows: Dict[str, int] = {}
+    histories: List[List[float]] = []
+
+    def history_row(player_id: str) -> int:
+        row = player_rows.get(player_id)
+        if row is None:
+            values = []
+            for week in completed:
+                points = index.player_points.get(week, {}).get(player_id)
+                if points is None or (exclude_zero_points and points == 0):
+                    continue
+                values.append(float(points))
+            row = player_rows[player_id] = len(histories)
+            histories.append(values or [float(default_floor)])
+        return row
+
+    draws: List[_WeekDraw] = []
+    for week in range(latest_completed_week + 1, last_week + 1):
+        slots: List[int] = []
+        live: List[float] = []
+        states: List[int] = []
+        owners: List[int] = []
+        for pos, rid in enumerate(roster_ids):
+            matchup = index.rosters.get(week, {}).get(rid) or {}
+            starters = list(matchup.get("starters") or [])
+            if not starters:
+                # Lineup not set yet: assume the most recent one
+                for earlier in range(week - 1, 0, -1):
+                    starters = list((index.rosters.get(earlier, {}).get(rid) or {}).get("starters") or [])
+                    if starters:
+                        break
+            in_progress = week == latest_completed_week + 1 and get_player_game_state is not None
+            points = matchup.get("players_points") or {}
+            for player_id in starters:
+                slots.append(history_row(player_id))
+                live.append(float(points.get(player_id, 0.0)) if in_progress else 0.0)
+                states.append(
+                    _STATE_CODES.get(get_player_game_state(player_id), _FINISHED) if in_progress else _NOT_STARTED
+                )
+                owners.append(pos)
+        indicator = np.zeros((len(slots), len(roster_ids)))
+        indicator[np.arange(len(slots)), owners] = 1.0
+        draws.append(_WeekDraw(
+            week=week,
+            slots=np.array(slots, dtype=np.intp),
+            live=np.array(live, dtype=float),
+            states=np.array(states, dtype=np.int8),
+            owners=indicator,
+        ))
+
+    width = max((len(values) for values in histories), default=1)
+    history = np.zeros((len(histories), width))
+    for row, values in enumerate(histories):
+        history[row, :len(values)] = values
+    return ScoreModel(
+        roster_ids=roster_ids,
+        fixed=fixed,
+        history=history,
+        counts=np.array([len(values) for values in histories], dtype=float),
+        draws=draws,
+    )
+
+
+# ——— VECTORIZED BRACKET ———
+
+def _positions(member: np.ndarray, *keys: np.ndarray) -> np.ndarray:
+    """
+    Each member's 0-based place when the members of every trial are sorted by
+    ``keys`` (most significant first, ascending); non-members get ``n``.
+    """
+    trials, n = member.shape
+    order = np.lexsort(tuple(reversed(keys)) + (~member,), axis=-1)
+    positions = np.empty_like(order)
+    np.put_along_axis(positions, order, np.broadcast_to(np.arange(n), order.shape), axis=-1)
+    return np.where(member, positions, n)
+
+
+def _first(member: np.ndarray, *keys: np.ndarray) -> np.ndarray:
+    """
+    Mask of the member that sorts first in each trial (none when a trial has no
+    members). Narrowed key by key instead of sorted; the last key must be unique.
+    """
+    candidates = member
+    for key in keys:
+        best = np.where(candidates, key, np.inf).min(axis=1, keepdims=True)
+        candidates = candidates & (key == best)
+    return candidates
+
+
+def _top(member: np.ndarray, k: int, *keys: np.ndarray) -> np.ndarray:
+    """Like ``_positions`` for the first ``k`` places only (others get ``n``); cheaper for small ``k``."""
+    positions = np.full(member.shape, member.shape[1])
+    remaining = member
+    for place in range(k):
+        first = _first(remaining, *keys)
+        positions[first] = place
+        remaining = remaining & ~first
+    return positions
+
+
+def _regular_season(scores: np.ndarray):
+    """Seeds (0-based, ties in roster order) and each week's high scorer (-1 if nobody scored) from weeks 1-13."""
+    trials, n, _ = scores.shape
+    index_order = np.broadcast_to(np.arange(n), (trials, n))
+    everyone = np.ones((trials, n), dtype=bool)
+    seed = _positions(everyone, -scores[:, :, :REGULAR_WEEKS].sum(axis=2), index_order)
+    weekly_high = np.full((trials, REGULAR_WEEKS), -1)
+    for week in range(1, REGULAR_WEEKS + 1):
+        week_scores = scores[:, :, week - 1]
+        high = _first(everyone, -week_scores, seed).argmax(axis=1)
+        weekly_high[:, week - 1] = np.where((week_scores > 0).any(axis=1), high, -1)
+    return seed, weekly_high
+
+
+def resolve_outcomes(scores: np.ndarray, *, table: PayoutTable = PAYOUTS) -> Dict[str, np.ndarray]:
+    """
+    Bracket results for ``trials × teams × weeks`` scores (weeks 1-17): one
+    ``trials × teams`` array per ``OUTCOMES`` flag, plus ``seed`` (1-based),
+    the prize ``events`` and the resulting ``payout`` (weekly highs, season
+    high, Duel of the Fates, champion). Mirrors ``resolve_bracket`` and the
+    ``render_sections`` payouts.
+    """
+    trials, n, _ = scores.shape
+    if n < 8:
+        raise ValueError("The bracket needs at least 8 teams")
+    if table.weekly_high_weeks != REGULAR_WEEKS:
+        raise ValueError(f"Weekly highs are resolved for weeks 1-{REGULAR_WEEKS}")
+    wk = {week: scores[:, :, week - 1] for week in (14, 15, 16, 17)}
+
+    # ——— SEEDING ———
+    regular = scores[:, :, :REGULAR_WEEKS]
+    if (regular == regular[:1]).all():
+        # Regular season complete: the same seeds and weekly highs in every trial
+        seed, weekly_high = (np.repeat(a, trials, axis=0) for a in _regular_season(scores[:1]))
+    else:
+        seed, weekly_high = _regular_season(scores)
+
+    bye = seed < 2
+    playoff = (seed >= 2) & (seed < 6)
+    wildcard = seed >= 6
+    wildcard_winner = _first((seed >= 6) & (seed < 12), -wk[14], seed)
+    combined = wk[14] + wk[15]
+
+    # ——— WEEK 15 ———
+    divisional = _positions(playoff | wildcard_winner, -wk[15], seed)
+    wildcard_losers = wildcard & ~wildcard_winner
+    wild_comb = _positions(wildcard_losers, -combined, -wk[14], seed)
+
+    # ——— WEEK 16 ———
+    conference = bye | (divisional < 3)
+    purgatory16 = ((divisional >= 3) & (divisional < 5)) | (wild_comb == 0)
+    toilet16 = (wild_comb >= 1) & (wild_comb < 5)
+
+    # ——— WEEK 17 ———
+    superbowl = _top(conference, 3, -wk[16], seed) < 3
+    purgatory = (conference & ~superbowl) | purgatory16 | _first(toilet16, -wk[16], seed)
+
+    # Champion follows the Week 16 lists: bye teams, then the top 3 divisional teams by Week 16
+    div16 = _top(divisional < n, 3, -wk[16], divisional)
+    conf_list_pos = np.where(bye, seed, np.where(div16 < 3, 2 + div16, n))
+    conf_list = conf_list_pos < n
+    conf_top3_pos = _top(conf_list, 3, -wk[16], conf_list_pos)
+    conf_top3 = conf_top3_pos < 3
+    champion = _first(conf_top3, -wk[17], conf_top3_pos)
+
+    # Week 17 Toilet Bowl: wildcard teams outside the Week 16 Conference/Purgatory lists
+    purg_list = (_top(divisional < n, 2, wk[15], divisional) < 2) | (
+        _top(wildcard, 2, -wk[16], -wk[14], seed) == 1
+    )
+    bottom2_conf16 = _top(conf_list, 2, wk[16], conf_list_pos) < 2
+    toilet_list_pos = _positions(wildcard & ~(conf_list | purg_list), wk[15], -wk[14], seed)
+    toilet_list = toilet_list_pos < 4
+    toilet_top16 = _first(toilet_list, -wk[16], toilet_list_pos)
+    excluded = conf_top3 | purg_list | bottom2_conf16 | toilet_top16
+    toilet_bowl = _top(wildcard & ~excluded, 3, wk[16], -wk[14], seed) < 3
+
+    # ——— PAYOUTS ———
+    # Duel of the Fates: the bye teams by Week 14+15 combined
+    duel_winner = _first(bye, -combined, seed)
+    runner_up = bye & ~duel_winner
+    events = PayoutEvents(
+        weekly_high=weekly_high,
+        season_high=seed == 0,
+        duel_winner=duel_winner,
+        duel_runner_up=runner_up,
+        champion=champion,
+        duel_margin=np.where(duel_winner, combined, 0.0).sum(axis=1) - np.where(runner_up, combined, 0.0).sum(axis=1),
+    )
+
+    return {
+        "seed": seed + 1,
+        "bye": bye,
+        "wildcard_winner": wildcard_winner,
+        "duel_winner": duel_winner,
+        "conference": conference,
+        "superbowl": superbowl,
+        "champion": champion,
+        "purgatory": purgatory,
+        "toilet_bowl": toilet_bowl,
+        "events": events,
+        "payout": evaluate(events, table),
+    }
+
+
+# ——— SIMULATION ———
+
+@dataclass
+class SimulationResult:
+    roster_ids: List[int]
+    trials: int
+    # outcome → per-team probability
+    probabilities: Dict[str, np.ndarray]
+    expected_seed: np.ndarray
+    expected_payout: np.ndarray
+    # percentile → per-team payout
+    payout_percentiles: Dict[float, np.ndarray]
+
+    def to_dict(self, names: Optional[Dict[int, str]] = None) -> Dict[str, object]:
+        """JSON-ready per-team odds, ordered by championship probability."""
+        names = names or {}
+        teams = []
+        for pos, rid in enumerate(self.roster_ids):
+            teams.append({
+                "roster_id": rid,
+                "team": names.get(rid, str(rid)),
+                "expected_seed": round(float(self.expected_seed[pos]), 2),
+                "expected_payout": round(float(self.expected_payout[pos]), 2),
+                "payout_percentiles": {
+                    f"p{p:g}": round(float(values[pos]), 2) for p, values in self.payout_percentiles.items()
+                },
+                **{name: round(float(self.probabilities[name][pos]), 4) for name in OUTCOMES},
+            })
+        teams.sort(key=lambda t: (-t["champion"], t["expected_seed"]))
+        return {"trials": self.trials, "teams": teams}
+
+
+def _simulate_chunk(model: ScoreModel, trials: int, seed: np.random.SeedSequence, table: PayoutTable) -> tuple:
+    outcomes = resolve_outcomes(model.sample(trials, np.random.default_rng(seed)), table=table)
+    counts = {name: outcomes[name].sum(axis=0) for name in OUTCOMES}
+    # Prize amounts are exact in float32; halves what a pool worker sends back
+    return counts, outcomes["seed"].sum(axis=0), outcomes["payout"].astype(np.float32)
+
+
+def simulate(
+    model: ScoreModel,
+    *,
+    trials: int = 100_000,
+    chunk: int = 10_000,
+    seed: Optional[int] = None,
+    workers: int = 1,
+    table: PayoutTable = PAYOUTS,
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+) -> SimulationResult:
+    """
+    Run ``trials`` sampled seasons through the bracket, ``chunk`` trials at a
+    time (each with its own random stream, so results do not depend on
+    ``workers``). ``workers > 1`` spreads the chunks over a process pool.
+    Payouts are evaluated with ``table`` and summarized at ``percentiles``.
+    """
+    sizes = [min(chunk, trials - start) for start in range(0, trials, chunk)]
+    streams = np.random.SeedSequence(seed).spawn(len(sizes))
+    if workers > 1 and len(sizes) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_simulate_chunk, repeat(model), sizes, streams, repeat(table)))
+    else:
+        parts = [_simulate_chunk(model, size, stream, table) for size, stream in zip(sizes, streams)]
+
+    n = len(model.roster_ids)
+    counts = {name: np.zeros(n) for name in OUTCOMES}
+    seed_sum = np.zeros(n)
+    for part_counts, part_seeds, _ in parts:
+        for name in OUTCOMES:
+            counts[name] += part_counts[name]
+        seed_sum += part_seeds
+    payouts = summarize(np.concatenate([part[2] for part in parts]), percentiles)
+    return SimulationResult(
+        roster_ids=list(model.roster_ids),
+        trials=trials,
+        probabilities={name: counts[name] / trials for name in OUTCOMES},
+        expected_seed=seed_sum / trials,
+        expected_payout=payouts["expected"],
+        payout_percentiles=payouts["percentiles"],
+    )
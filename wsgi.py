@@ -0,0 +1,52 @@
+"""
+Production Entry Point
+----------------------
+
+Serves the dashboard from gunicorn with a gevent worker instead of the
+Werkzeug development server (``python app.py``):
+- Selects Socket.IO's "gevent" async mode and monkey-patches the standard
+  library before ``app`` is imported, so Sleeper requests, locks and sleeps in
+  the refresh loop yield to other connections instead of blocking the worker
+- ``create_app()`` starts the background refresher as a cooperative task,
+  once per worker process
+
+    gunicorn -k gevent -w 1 --worker-connections 2000 --bind 0.0.0.0:$PORT 'wsgi:create_app()'
+
+One worker serves most deployments. To scale out, every worker must share
+the dashboard state and the Socket.IO broadcasts:
+- ``STATE_STORE_URL`` (``sqlite:///…`` for workers on one host, ``redis://…``
+  across hosts): one worker holds the refresh lease and crawls Sleeper, the
+  others adopt each version it publishes. A worker releases the lease when
+  it exits, and one whose process is gone is replaced without waiting for
+  the lease to expire. With neither this nor the message queue set, the
+  lone worker skips the election and always crawls
+- ``SOCKETIO_MESSAGE_QUEUE`` (``redis://…``): the leader's broadcasts reach
+  clients connected to any worker
+- ``SOCKETIO_WEBSOCKET_ONLY=true`` for ``-w N``: gunicorn does not route a
+  client's long-polling requests back to the same worker, so clients must
+  connect over websockets only. Alternatively run one ``-w 1`` gunicorn per
+  port behind a load balancer with sticky sessions
+
+    SOCKETIO_WEBSOCKET_ONLY=true STATE_STORE_URL=redis://… SOCKETIO_MESSAGE_QUEUE=redis://… \
+        gunicorn -k gevent -w 4 --worker-connections 2000 --bind 0.0.0.0:$PORT 'wsgi:create_app()'
+
+Public API:
+  - create_app
+"""
+
+import os
+
+os.environ.setdefault("SOCKETIO_ASYNC_MODE", "gevent")
+if os.environ["SOCKETIO_ASYNC_MODE"] == "gevent":
+    from gevent import monkey
+
+    # No-op under gunicorn's gevent worker, which has already patched
+    monkey.patch_all()
+
+import app as dashboard  # noqa: E402
+
+
+def create_app():
+    """The Flask app with its background refresher running in this process."""
+    dashboard.start_background_tasks()
+    return dashboard.app